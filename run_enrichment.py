@@ -68,8 +68,7 @@ def main():
         print("\nEnrichment interrupted by user")
     except Exception as e:
         print(f"\nError running enrichment: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Enrichment run failed")
         sys.exit(1)
 
 if __name__ == "__main__":
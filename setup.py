@@ -58,6 +58,22 @@ setup(
             'pytest-asyncio>=0.21.0',
             'black>=22.0.0',
             'flake8>=5.0.0',
+            'python-dotenv>=0.21.0',
+        ],
+        'jit': [
+            'numba>=0.56.0',
+        ],
+        'arrow': [
+            'pyarrow>=7.0.0',
+        ],
+        'json': [
+            'orjson>=3.6.0',
+        ],
+        'server': [
+            'waitress>=2.0.0',
+        ],
+        'msgpack': [
+            'msgpack>=1.0.0',
         ],
     },
     entry_points={
@@ -12,16 +12,23 @@ This package provides tools to:
 __version__ = "1.0.0"
 __author__ = "TABC Scraper System"
 
-from .data.api_client import TexasComptrollerAPI
-from .scraping.square_footage import SquareFootageScraper
-from .scraping.concept_classifier import EnhancedRestaurantConceptClassifier
-from .analysis.population import PopulationAnalyzer
-from .storage.database import DatabaseManager
+import importlib
 
-__all__ = [
-    'TexasComptrollerAPI',
-    'SquareFootageScraper',
-    'EnhancedRestaurantConceptClassifier',
-    'PopulationAnalyzer',
-    'DatabaseManager'
-]
\ No newline at end of file
+# Public classes by defining submodule. They are imported on first attribute access, so importing a
+# single submodule (e.g. the web server) does not load pandas, SQLAlchemy and the scrapers up front.
+_LAZY_EXPORTS = {
+    'TexasComptrollerAPI': '.data.api_client',
+    'SquareFootageScraper': '.scraping.square_footage',
+    'EnhancedRestaurantConceptClassifier': '.scraping.concept_classifier',
+    'PopulationAnalyzer': '.analysis.population',
+    'DatabaseManager': '.storage.database'
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        value = getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -4,7 +4,6 @@ Population analysis for restaurant location demographics
 
 import logging
 import re
-import time
 import os
 import asyncio
 from typing import Dict, List, Tuple, Optional, Any
@@ -13,6 +12,8 @@ import aiohttp
 import json
 
 from ..storage.cache import get_geocode_cache, set_geocode_cache
+from ..rate_limit import AsyncRateLimiter
+from ..http_session import request_session, shared_session
 
 logger = logging.getLogger(__name__)
 
@@ -45,6 +46,9 @@ class PopulationResult:
     confidence: float
     census_data_available: bool = False
 
+# Nominatim's usage policy allows at most one request per second, shared by every analyzer
+_nominatim_limiter = AsyncRateLimiter(1.0)
+
 class PopulationAnalyzer:
     """Analyzer for population demographics around restaurant locations"""
 
@@ -101,7 +105,8 @@ class PopulationAnalyzer:
                 'countrycodes': 'us'
             }
 
-            async with aiohttp.ClientSession() as session:
+            await _nominatim_limiter.wait()
+            async with request_session() as session:
                 async with session.get(url, params=params, timeout=aiohttp.ClientTimeout(total=10)) as response:
                     if response.status == 200:
                         data = await response.json()
@@ -201,12 +206,14 @@ class PopulationAnalyzer:
         Returns:
             Estimated population within radius
         """
-        try:
-            total_population = 0
-
-            # Get census data for the location
-            census_data = self.get_census_data_for_coordinates(lat, lon)
+        # Get census data for the location
+        census_data = self.get_census_data_for_coordinates(lat, lon)
+        return self._population_in_radius(census_data, radius_miles)
 
+    @staticmethod
+    def _population_in_radius(census_data: Dict[str, Any], radius_miles: float) -> int:
+        """Population within a radius, estimated from already-fetched census data"""
+        try:
             if census_data['total_population'] > 0:
                 # Use census data as base population
                 base_population = census_data['total_population']
@@ -238,6 +245,30 @@ class PopulationAnalyzer:
             logger.error(f"Error calculating population in radius: {e}")
             return int(5000 * radius_miles)  # Fallback
 
+    @staticmethod
+    def _failed_result(restaurant_name: str, address: str, source: str) -> PopulationResult:
+        """Empty PopulationResult for a location that could not be analyzed"""
+        return PopulationResult(
+            restaurant_name=restaurant_name,
+            address=address,
+            latitude=0.0,
+            longitude=0.0,
+            population_1_mile=0,
+            population_3_mile=0,
+            population_5_mile=0,
+            population_10_mile=0,
+            drinking_age_1_mile=0,
+            drinking_age_3_mile=0,
+            drinking_age_5_mile=0,
+            drinking_age_10_mile=0,
+            median_income_1_mile=None,
+            median_age_1_mile=None,
+            average_household_size_1_mile=None,
+            source=source,
+            confidence=0.0,
+            census_data_available=False
+        )
+
     async def analyze_location(self, restaurant_name: str, address: str) -> PopulationResult:
         """
         Analyze population demographics around a restaurant location
@@ -256,28 +287,9 @@ class PopulationAnalyzer:
 
         if lat is None or lon is None:
             logger.warning(f"Could not geocode address: {address}")
-            return PopulationResult(
-                restaurant_name=restaurant_name,
-                address=address,
-                latitude=0.0,
-                longitude=0.0,
-                population_1_mile=0,
-                population_3_mile=0,
-                population_5_mile=0,
-                population_10_mile=0,
-                drinking_age_1_mile=0,
-                drinking_age_3_mile=0,
-                drinking_age_5_mile=0,
-                drinking_age_10_mile=0,
-                median_income_1_mile=None,
-                median_age_1_mile=None,
-                average_household_size_1_mile=None,
-                source='geocoding_failed',
-                confidence=0.0,
-                census_data_available=False
-            )
+            return self._failed_result(restaurant_name, address, 'geocoding_failed')
 
-        # Get census data for the location
+        # Get census data for the location once; every radius is estimated from it
         census_data = self.get_census_data_for_coordinates(lat, lon)
 
         # Calculate population for each radius
@@ -285,7 +297,7 @@ class PopulationAnalyzer:
         populations = {}
 
         for radius in radii:
-            total_pop = self.calculate_population_in_radius(lat, lon, radius)
+            total_pop = self._population_in_radius(census_data, radius)
             populations[f"population_{radius}_mile"] = total_pop
             populations[f"drinking_age_{radius}_mile"] = int(total_pop * self.drinking_age_ratio)
 
@@ -308,58 +320,66 @@ class PopulationAnalyzer:
             **populations
         )
 
-    def analyze_multiple_locations(self, restaurants: List[Dict[str, Any]]) -> Dict[str, PopulationResult]:
+    async def analyze_multiple_locations_async(self, restaurants: List[Dict[str, Any]],
+                                               max_concurrency: int = 8) -> Dict[str, PopulationResult]:
         """
-        Analyze population demographics for multiple restaurant locations
+        Analyze population demographics for multiple restaurant locations concurrently
+
+        Geocoding requests are still spaced to Nominatim's rate limit; cached addresses resolve
+        without waiting for it.
 
         Args:
             restaurants: List of restaurant data dictionaries
+            max_concurrency: Maximum number of locations analyzed at once
 
         Returns:
             Dictionary mapping restaurant IDs to PopulationResult objects
         """
-        results = {}
+        semaphore = asyncio.Semaphore(max_concurrency)
+        locations = [
+            (
+                restaurant.get('id', restaurant.get('location_name', 'unknown')),
+                restaurant.get('location_name', ''),
+                restaurant.get('full_address', restaurant.get('location_address', ''))
+            )
+            for restaurant in restaurants
+        ]
+
+        async def analyze(i: int, name: str, address: str) -> PopulationResult:
+            async with semaphore:
+                logger.info(f"Processing restaurant {i}/{len(locations)}: {name or 'Unknown'}")
+                return await self.analyze_location(name, address)
+
+        # One keep-alive session for the whole batch, so geocoding requests skip the handshakes
+        async with shared_session():
+            outcomes = await asyncio.gather(
+                *(analyze(i, name, address) for i, (_, name, address) in enumerate(locations, 1)),
+                return_exceptions=True
+            )
 
-        for i, restaurant in enumerate(restaurants, 1):
-            logger.info(f"Processing restaurant {i}/{len(restaurants)}: {restaurant.get('location_name', 'Unknown')}")
-
-            restaurant_id = restaurant.get('id', restaurant.get('location_name', 'unknown'))
-            name = restaurant.get('location_name', '')
-            address = restaurant.get('full_address', restaurant.get('location_address', ''))
-
-            try:
-                result = self.analyze_location(name, address)
-                results[restaurant_id] = result
-            except Exception as e:
-                logger.error(f"Error analyzing {name}: {e}")
-                # Return error result
-                results[restaurant_id] = PopulationResult(
-                    restaurant_name=name,
-                    address=address,
-                    latitude=0.0,
-                    longitude=0.0,
-                    population_1_mile=0,
-                    population_3_mile=0,
-                    population_5_mile=0,
-                    population_10_mile=0,
-                    drinking_age_1_mile=0,
-                    drinking_age_3_mile=0,
-                    drinking_age_5_mile=0,
-                    drinking_age_10_mile=0,
-                    median_income_1_mile=None,
-                    median_age_1_mile=None,
-                    average_household_size_1_mile=None,
-                    source='error',
-                    confidence=0.0,
-                    census_data_available=False
-                )
-
-            # Add delay to be respectful to geocoding API
-            if i < len(restaurants):
-                time.sleep(1.2)  # Nominatim requests should be limited
+        results = {}
+        for (restaurant_id, name, address), outcome in zip(locations, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error(f"Error analyzing {name}: {outcome}")
+                outcome = self._failed_result(name, address, 'error')
+            results[restaurant_id] = outcome
 
         return results
 
+    def analyze_multiple_locations(self, restaurants: List[Dict[str, Any]]) -> Dict[str, PopulationResult]:
+        """
+        Analyze population demographics for multiple restaurant locations
+
+        Blocking wrapper around analyze_multiple_locations_async for callers without an event loop.
+
+        Args:
+            restaurants: List of restaurant data dictionaries
+
+        Returns:
+            Dictionary mapping restaurant IDs to PopulationResult objects
+        """
+        return asyncio.run(self.analyze_multiple_locations_async(restaurants))
+
     def get_population_summary(self, results: Dict[str, PopulationResult]) -> Dict[str, Any]:
         """Get summary statistics for population analysis results"""
         if not results:
@@ -10,6 +10,7 @@ import sys
 import signal
 import os
 from pathlib import Path
+from typing import Optional
 
 import click
 
@@ -34,6 +35,115 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+async def fetch_restaurants(limit: int = 1000, batch_size: int = 1000, database_url: Optional[str] = None,
+                            active_only: bool = False) -> int:
+    """
+    Fetch restaurant data from the Texas Comptroller API and store it in the database
+
+    Shared by the ``fetch`` command and the web dashboard trigger.
+
+    Returns:
+        Number of restaurant records stored
+    """
+    # Initialize components
+    api_client = TexasComptrollerAPI()
+    db_manager = DatabaseManager(database_url)
+
+    # Test API connection first
+    if not await api_client.test_connection():
+        click.echo("[ERROR] Failed to connect to Texas Comptroller API")
+        return 0
+
+    click.echo("API connection successful")
+
+    # Fetch restaurant data
+    if active_only:
+        click.echo(f"[DATA] Fetching active restaurant data only (batch size: {batch_size}, limit: {limit})...")
+        restaurants = await api_client.get_active_restaurants(batch_size=batch_size, limit=limit)
+    else:
+        click.echo(f"[DATA] Fetching all restaurant data (batch size: {batch_size}, limit: {limit})...")
+        restaurants = await api_client.get_all_restaurants(batch_size=batch_size, limit=limit)
+
+    if not restaurants:
+        click.echo("[WARN]  No restaurant data retrieved")
+        return 0
+
+    click.echo(f"[SUCCESS] Retrieved {len(restaurants)} restaurant records")
+
+    # Show filtering info if active-only was used
+    if active_only:
+        click.echo(f"[INFO] Filtered to active businesses only")
+
+    # Store in database
+    click.echo("[SAVE] Storing data in database...")
+    # The insert is synchronous SQLAlchemy work; run it off the event loop
+    stored_count = await asyncio.to_thread(db_manager.store_restaurants, (vars(r) for r in restaurants))
+
+    click.echo(f"[SUCCESS] Successfully stored {stored_count} restaurant records")
+    click.echo("[SUCCESS] Restaurant data fetch completed!")
+    return stored_count
+
+
+async def enrich_restaurants(limit: Optional[int] = None, batch_size: int = 10, database_url: Optional[str] = None,
+                             skip_square_footage: bool = False, skip_concept_classification: bool = False,
+                             skip_population_analysis: bool = False):
+    """
+    Run the data enrichment pipeline over stored restaurants
+
+    Shared by the ``enrich`` command and the web dashboard trigger.
+
+    Returns:
+        Enrichment statistics from the pipeline
+    """
+    click.echo("[LAB] Starting data enrichment pipeline...")
+
+    # Initialize database and pipeline
+    db_manager = DatabaseManager(database_url)
+    pipeline = DataEnrichmentPipeline(db_manager)
+
+    # Configure pipeline based on flags
+    if skip_square_footage:
+        pipeline.enable_square_footage_scraping = False
+    if skip_concept_classification:
+        pipeline.enable_concept_classification = False
+    if skip_population_analysis:
+        pipeline.enable_population_analysis = False
+
+    # Update batch size (reduced for rate limiting)
+    pipeline.batch_size = min(batch_size, 2)  # Cap at 2 for square footage scraping
+
+    click.echo("[DATA] Configuration:")
+    click.echo(f"   • Batch size: {pipeline.batch_size}")
+    click.echo(f"   • Square footage scraping: {'[ENABLED]' if pipeline.enable_square_footage_scraping else '[SKIPPED]'}")
+    click.echo(f"   • Concept classification: {'[ENABLED]' if pipeline.enable_concept_classification else '[SKIPPED]'}")
+    click.echo(f"   • Population analysis: {'[ENABLED]' if pipeline.enable_population_analysis else '[SKIPPED]'}")
+
+    # Run enrichment pipeline
+    click.echo("[RUNNING] Running enrichment pipeline...")
+    stats = await pipeline.run_full_enrichment_pipeline(limit=limit)
+
+    # Display results
+    click.echo("[SUCCESS] Enrichment completed!")
+    click.echo("[CHART] Results:")
+    click.echo(f"   • Restaurants processed: {stats.total_restaurants}")
+    click.echo(f"   • Successful enrichments: {stats.successful_enrichments}")
+    click.echo(f"   • Failed enrichments: {stats.failed_enrichments}")
+    click.echo(f"   • Total processing time: {stats.total_processing_time:.2f}s")
+    click.echo(f"   • Average time per restaurant: {stats.average_time_per_restaurant:.2f}s")
+
+    if stats.data_sources_used:
+        click.echo("[DATA] Data sources used:")
+        for source, count in stats.data_sources_used.items():
+            click.echo(f"   • {source}: {count} restaurants")
+
+    if stats.error_summary:
+        click.echo("[WARN]  Errors encountered:")
+        for error_type, count in stats.error_summary.items():
+            click.echo(f"   • {error_type}: {count}")
+
+    return stats
+
+
 @click.group()
 @click.version_option(version='1.0.0')
 def cli():
@@ -57,45 +167,8 @@ def fetch(limit, batch_size, database_url, active_only):
 
     Downloads restaurant data and stores it in the local database.
     """
-    async def _async_fetch():
-        # Initialize components
-        api_client = TexasComptrollerAPI()
-        db_manager = DatabaseManager(database_url)
-
-        # Test API connection first
-        if not await api_client.test_connection():
-            click.echo("[ERROR] Failed to connect to Texas Comptroller API")
-            return
-
-        click.echo("API connection successful")
-
-        # Fetch restaurant data
-        if active_only:
-            click.echo(f"[DATA] Fetching active restaurant data only (batch size: {batch_size}, limit: {limit})...")
-            restaurants = await api_client.get_active_restaurants(batch_size=batch_size, limit=limit)
-        else:
-            click.echo(f"[DATA] Fetching all restaurant data (batch size: {batch_size}, limit: {limit})...")
-            restaurants = await api_client.get_all_restaurants(batch_size=batch_size, limit=limit)
-
-        if not restaurants:
-            click.echo("[WARN]  No restaurant data retrieved")
-            return
-
-        click.echo(f"[SUCCESS] Retrieved {len(restaurants)} restaurant records")
-
-        # Show filtering info if active-only was used
-        if active_only:
-            click.echo(f"[INFO] Filtered to active businesses only")
-
-        # Store in database
-        click.echo("[SAVE] Storing data in database...")
-        stored_count = db_manager.store_restaurants([r.__dict__ for r in restaurants])
-
-        click.echo(f"[SUCCESS] Successfully stored {stored_count} restaurant records")
-        click.echo("[SUCCESS] Restaurant data fetch completed!")
-
     try:
-        asyncio.run(_async_fetch())
+        asyncio.run(fetch_restaurants(limit=limit, batch_size=batch_size, database_url=database_url, active_only=active_only))
     except Exception as e:
         logger.error(f"Error during fetch: {e}")
         click.echo(f"[ERROR] Error during fetch: {e}")
@@ -116,55 +189,15 @@ def enrich(limit, batch_size, database_url, skip_square_footage, skip_concept_cl
     Enriches restaurant data with concept classification, population analysis,
     and square footage information.
     """
-    async def _async_enrich():
-        click.echo("[LAB] Starting data enrichment pipeline...")
-
-        # Initialize database and pipeline
-        db_manager = DatabaseManager(database_url)
-        pipeline = DataEnrichmentPipeline(db_manager)
-
-        # Configure pipeline based on flags
-        if skip_square_footage:
-            pipeline.enable_square_footage_scraping = False
-        if skip_concept_classification:
-            pipeline.enable_concept_classification = False
-        if skip_population_analysis:
-            pipeline.enable_population_analysis = False
-
-        # Update batch size (reduced for rate limiting)
-        pipeline.batch_size = min(batch_size, 2)  # Cap at 2 for square footage scraping
-
-        click.echo("[DATA] Configuration:")
-        click.echo(f"   • Batch size: {pipeline.batch_size}")
-        click.echo(f"   • Square footage scraping: {'[ENABLED]' if pipeline.enable_square_footage_scraping else '[SKIPPED]'}")
-        click.echo(f"   • Concept classification: {'[ENABLED]' if pipeline.enable_concept_classification else '[SKIPPED]'}")
-        click.echo(f"   • Population analysis: {'[ENABLED]' if pipeline.enable_population_analysis else '[SKIPPED]'}")
-
-        # Run enrichment pipeline
-        click.echo("[RUNNING] Running enrichment pipeline...")
-        stats = await pipeline.run_full_enrichment_pipeline(limit=limit)
-
-        # Display results
-        click.echo("[SUCCESS] Enrichment completed!")
-        click.echo("[CHART] Results:")
-        click.echo(f"   • Restaurants processed: {stats.total_restaurants}")
-        click.echo(f"   • Successful enrichments: {stats.successful_enrichments}")
-        click.echo(f"   • Failed enrichments: {stats.failed_enrichments}")
-        click.echo(f"   • Total processing time: {stats.total_processing_time:.2f}s")
-        click.echo(f"   • Average time per restaurant: {stats.average_time_per_restaurant:.2f}s")
-
-        if stats.data_sources_used:
-            click.echo("[DATA] Data sources used:")
-            for source, count in stats.data_sources_used.items():
-                click.echo(f"   • {source}: {count} restaurants")
-
-        if stats.error_summary:
-            click.echo("[WARN]  Errors encountered:")
-            for error_type, count in stats.error_summary.items():
-                click.echo(f"   • {error_type}: {count}")
-
     try:
-        asyncio.run(_async_enrich())
+        asyncio.run(enrich_restaurants(
+            limit=limit,
+            batch_size=batch_size,
+            database_url=database_url,
+            skip_square_footage=skip_square_footage,
+            skip_concept_classification=skip_concept_classification,
+            skip_population_analysis=skip_population_analysis
+        ))
     except Exception as e:
         logger.error(f"Error during enrichment: {e}")
         click.echo(f"[ERROR] Error during enrichment: {e}")
@@ -258,9 +291,9 @@ def validate(input_file, output_report, database_url, detailed):
 
         click.echo(f"[SUCCESS] Loaded {len(df)} records for validation")
 
-        # Generate comprehensive report
+        # Generate comprehensive report; per-result details are only needed for the saved report
         click.echo("[LAB] Running validation checks...")
-        report = reporter.generate_comprehensive_report(df)
+        report = reporter.generate_comprehensive_report(df, include_details=bool(output_report))
 
         # Display summary
         overview = report['dataset_overview']
@@ -356,7 +389,8 @@ def status():
 @click.option('--host', default='0.0.0.0', help='Host to bind to')
 @click.option('--port', default=5000, type=int, help='Port to bind to')
 @click.option('--debug', is_flag=True, help='Run in debug mode')
-def serve(host, port, debug):
+@click.option('--threads', default=8, type=int, help='Request-handling threads (waitress)')
+def serve(host, port, debug, threads):
     """
     Run the web server for health monitoring and API endpoints
     """
@@ -370,7 +404,7 @@ def serve(host, port, debug):
     signal.signal(signal.SIGTERM, signal_handler)
 
     try:
-        run_server(host=host, port=port, debug=debug)
+        run_server(host=host, port=port, debug=debug, threads=threads)
     except Exception as e:
         logger.error(f"Error running server: {e}")
         raise click.ClickException(f"Server failed: {e}")
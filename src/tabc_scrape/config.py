@@ -38,6 +38,7 @@ class DatabaseConfig(BaseModel):
     """Configuration for database storage"""
     url: str = Field(default="sqlite:///tabc_restaurants.db", description="Database URL")
     echo: bool = Field(default=False, description="Enable SQL echo for debugging")
+    pool_size: int = Field(default=10, ge=1, le=100, description="Connection pool size for server databases (ignored for SQLite)")
 
     @validator('url')
     def validate_database_url(cls, v):
@@ -72,6 +73,12 @@ class CacheConfig(BaseModel):
     default_ttl: int = Field(default=3600, ge=60, le=86400, description="Default cache TTL in seconds")
     api_cache_ttl: int = Field(default=1800, ge=60, le=86400, description="API response cache TTL in seconds")
     geocode_cache_ttl: int = Field(default=7200, ge=60, le=86400, description="Geocoding cache TTL in seconds")
+    geocode_cache_path: str = Field(default="~/.cache/tabc_scrape/geocode.sqlite", description="SQLite file persisting geocoding results across runs (empty to disable)")
+    square_footage_cache_ttl: int = Field(default=14 * 86400, ge=0, le=90 * 86400, description="Seconds a persisted square footage result stays valid")
+    square_footage_cache_path: str = Field(default="~/.cache/tabc_scrape/square_footage.sqlite", description="SQLite file persisting square footage results across runs (empty to disable)")
+    stats_cache_ttl: int = Field(default=10, ge=0, le=3600, description="Web dashboard/metrics stats cache TTL in seconds")
+    data_cache_ttl: int = Field(default=60, ge=0, le=86400, description="Web enriched-data response cache TTL in seconds")
+    metrics_refresh_interval: int = Field(default=30, ge=1, le=3600, description="Seconds between background refreshes of the /metrics database gauges")
 
     @validator('port')
     def validate_redis_port(cls, v):
@@ -109,7 +116,8 @@ class Config(BaseModel):
             },
             'database': {
                 'url': os.getenv('TABC_DB_URL', 'sqlite:///tabc_restaurants.db'),
-                'echo': os.getenv('TABC_DB_ECHO', 'false').lower() == 'true'
+                'echo': os.getenv('TABC_DB_ECHO', 'false').lower() == 'true',
+                'pool_size': int(os.getenv('TABC_DB_POOL_SIZE', '10'))
             },
             'enrichment': {
                 'population_radii': [int(r) for r in os.getenv('TABC_ENRICHMENT_RADII', '1,3,5,10').split(',')]
@@ -122,7 +130,13 @@ class Config(BaseModel):
                 'enabled': os.getenv('TABC_CACHE_ENABLED', 'true').lower() == 'true',
                 'default_ttl': int(os.getenv('TABC_CACHE_DEFAULT_TTL', '3600')),
                 'api_cache_ttl': int(os.getenv('TABC_CACHE_API_TTL', '1800')),
-                'geocode_cache_ttl': int(os.getenv('TABC_CACHE_GEOCODE_TTL', '7200'))
+                'geocode_cache_ttl': int(os.getenv('TABC_CACHE_GEOCODE_TTL', '7200')),
+                'geocode_cache_path': os.getenv('TABC_CACHE_GEOCODE_PATH', '~/.cache/tabc_scrape/geocode.sqlite'),
+                'square_footage_cache_ttl': int(os.getenv('TABC_CACHE_SQFT_TTL', str(14 * 86400))),
+                'square_footage_cache_path': os.getenv('TABC_CACHE_SQFT_PATH', '~/.cache/tabc_scrape/square_footage.sqlite'),
+                'stats_cache_ttl': int(os.getenv('TABC_CACHE_STATS_TTL', '10')),
+                'data_cache_ttl': int(os.getenv('TABC_CACHE_DATA_TTL', '60')),
+                'metrics_refresh_interval': int(os.getenv('TABC_CACHE_METRICS_REFRESH', '30'))
             }
         }
         return cls(**env_vars)
@@ -148,7 +162,8 @@ class Config(BaseModel):
             },
             'database': {
                 'url': self.database.url.replace('://', '://***:***@') if '://' in self.database.url and '@' in self.database.url else self.database.url,  # Mask credentials
-                'echo': self.database.echo
+                'echo': self.database.echo,
+                'pool_size': self.database.pool_size
             },
             'enrichment': {
                 'population_radii': self.enrichment.population_radii
@@ -160,7 +175,13 @@ class Config(BaseModel):
                 'enabled': self.cache.enabled,
                 'default_ttl': self.cache.default_ttl,
                 'api_cache_ttl': self.cache.api_cache_ttl,
-                'geocode_cache_ttl': self.cache.geocode_cache_ttl
+                'geocode_cache_ttl': self.cache.geocode_cache_ttl,
+                'geocode_cache_path': self.cache.geocode_cache_path,
+                'square_footage_cache_ttl': self.cache.square_footage_cache_ttl,
+                'square_footage_cache_path': self.cache.square_footage_cache_path,
+                'stats_cache_ttl': self.cache.stats_cache_ttl,
+                'data_cache_ttl': self.cache.data_cache_ttl,
+                'metrics_refresh_interval': self.cache.metrics_refresh_interval
             }
         }
 
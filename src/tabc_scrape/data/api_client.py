@@ -3,6 +3,7 @@ Texas Comptroller API client for restaurant data collection
 """
 
 import time
+import json
 import logging
 import asyncio
 from typing import Dict, List, Optional, Any
@@ -15,6 +16,12 @@ from ..storage.cache import get_api_cache, set_api_cache
 
 logger = logging.getLogger(__name__)
 
+# Socrata export endpoints for the same dataset, compared against the OData base URL by probe_endpoints
+_EXPORT_ENDPOINTS = {
+    'json': 'https://data.texas.gov/api/v3/views/naix-2893/query.json',
+    'csv': 'https://data.texas.gov/api/v3/views/naix-2893/query.csv'
+}
+
 @dataclass
 class RestaurantRecord:
     """Data class for restaurant records from TABC API"""
@@ -294,7 +301,7 @@ class TexasComptrollerAPI:
         Returns:
             DataFrame with restaurant data
         """
-        restaurants = await self.get_all_restaurants()
+        restaurants = await self.get_all_restaurants(limit=limit)
 
         if not restaurants:
             logger.warning("No restaurant data retrieved")
@@ -341,6 +348,57 @@ class TexasComptrollerAPI:
         logger.info(f"Created DataFrame with shape {df.shape}")
         return df
 
+    async def probe_endpoints(self, endpoints: Optional[Dict[str, str]] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Request each dataset endpoint concurrently and describe its response
+
+        Args:
+            endpoints: Endpoint name -> URL (defaults to the OData base URL plus the JSON and CSV exports)
+
+        Returns:
+            Endpoint name -> status code, response time, size and success flag, or the error
+        """
+        if endpoints is None:
+            endpoints = {'odata': self.base_url, **_EXPORT_ENDPOINTS}
+
+        # One session for all probes, so requests to the same host share its connection pool
+        async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=self.timeout)) as session:
+            results = await asyncio.gather(*(self._probe_endpoint(session, name, url) for name, url in endpoints.items()))
+
+        return dict(zip(endpoints, results))
+
+    async def _probe_endpoint(self, session: aiohttp.ClientSession, name: str, url: str) -> Dict[str, Any]:
+        """Request one endpoint and describe its response"""
+        start_time = time.time()
+
+        try:
+            async with session.get(url, ssl=False) as response:
+                body = await response.read()
+                result = {
+                    'url': url,
+                    'status_code': response.status,
+                    'response_time': time.time() - start_time,
+                    'content_length': len(body),
+                    'success': response.status == 200
+                }
+
+                if response.status == 200:
+                    if name == 'json':
+                        data = json.loads(body)
+                        result['record_count'] = len(data.get('data', []))
+                        result['columns'] = data.get('columns', [])
+                    elif name == 'csv':
+                        result['is_csv'] = True
+
+                return result
+
+        except Exception as e:
+            return {
+                'url': url,
+                'error': str(e),
+                'success': False
+            }
+
     async def test_connection(self) -> bool:
         """Test if the API is accessible"""
         try:
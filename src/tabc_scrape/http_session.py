@@ -0,0 +1,46 @@
+"""
+Shared aiohttp sessions so batches of requests reuse keep-alive connections
+"""
+
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import AsyncIterator, Optional
+
+import aiohttp
+
+# Session opened by the innermost shared_session() of the running task; tasks started inside it
+# (e.g. by asyncio.gather) inherit it through their copied context
+_shared_session: ContextVar[Optional[aiohttp.ClientSession]] = ContextVar('tabc_shared_session', default=None)
+
+
+@asynccontextmanager
+async def shared_session(limit_per_host: int = 8) -> AsyncIterator[aiohttp.ClientSession]:
+    """Make every request_session() in this block reuse one pooled keep-alive session
+
+    Repeat requests to the same host then skip the TCP and TLS handshakes. Nested blocks reuse the
+    outer session.
+    """
+    session = _shared_session.get()
+    if session is not None and not session.closed:
+        yield session
+        return
+
+    connector = aiohttp.TCPConnector(limit_per_host=limit_per_host, ttl_dns_cache=300)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        token = _shared_session.set(session)
+        try:
+            yield session
+        finally:
+            _shared_session.reset(token)
+
+
+@asynccontextmanager
+async def request_session() -> AsyncIterator[aiohttp.ClientSession]:
+    """The enclosing shared_session() if there is one, otherwise a session for just this request"""
+    session = _shared_session.get()
+    if session is not None and not session.closed:
+        yield session
+        return
+
+    async with aiohttp.ClientSession() as session:
+        yield session
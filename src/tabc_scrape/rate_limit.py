@@ -0,0 +1,38 @@
+"""
+Request pacing for external services with per-client rate limits
+"""
+
+import asyncio
+import threading
+import time
+
+
+class AsyncRateLimiter:
+    """Lets at most one call through per interval, spacing out concurrent callers
+
+    Only callers that arrive within an interval of the previous one wait, and only for the rest of
+    that interval. Use it around the outbound request alone, so parsing and scoring never hold up
+    the next request.
+    """
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    async def wait(self) -> None:
+        """Wait until this caller may send its request"""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+    async def __aenter__(self):
+        await self.wait()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
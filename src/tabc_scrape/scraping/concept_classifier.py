@@ -179,6 +179,13 @@ class EnhancedRestaurantConceptClassifier:
             pattern = r'\b(?:' + '|'.join(re.escape(keyword) for keyword in data['keywords']) + r')\b'
             self.compiled_patterns[concept] = re.compile(pattern, re.IGNORECASE)
 
+        # Any keyword of any concept; one scan rules out text that no concept pattern can match
+        self._any_keyword_pattern = re.compile(
+            r'\b(?:' + '|'.join(re.escape(keyword) for data in self.concept_keywords.values()
+                                 for keyword in data['keywords']) + r')\b',
+            re.IGNORECASE
+        )
+
         # Initialize AI components if available
         self.ai_model = None
         self.vectorizer = None
@@ -440,36 +447,44 @@ class EnhancedRestaurantConceptClassifier:
             logger.error(f"AI classification error: {e}")
             return self._rule_based_classify(text)
 
-    def _rule_based_classify(self, text: str) -> Tuple[str, float]:
-        """Fallback rule-based classification"""
-        text_lower = text.lower()
-        found_concepts = []
-        found_keywords = []
+    def _match_keywords(self, text_lower: str) -> Dict[str, List[str]]:
+        """Keywords found per concept, in concept order; concepts without matches are left out"""
+        if not self._any_keyword_pattern.search(text_lower):
+            return {}
 
-        # Check each concept category
+        matches = {}
         for concept, pattern in self.compiled_patterns.items():
-            matches = pattern.findall(text_lower)
-            if matches:
-                found_concepts.append(concept)
-                found_keywords.extend(matches)
-
-        # Determine primary concept
-        primary_concept = found_concepts[0] if found_concepts else 'unknown'
-
-        # Calculate confidence
-        confidence = min(len(found_keywords) * 0.2, 1.0)
-
+            found = pattern.findall(text_lower)
+            if found:
+                matches[concept] = found
+        return matches
+
+    @staticmethod
+    def _classify_matches(matches: Dict[str, List[str]]) -> Tuple[str, float]:
+        """Primary concept (first concept matched) and confidence from keyword matches"""
+        primary_concept = next(iter(matches), 'unknown')
+        confidence = min(sum(len(found) for found in matches.values()) * 0.2, 1.0)
         return primary_concept, confidence
 
+    def _rule_based_classify(self, text: str) -> Tuple[str, float]:
+        """Fallback rule-based classification"""
+        return self._classify_matches(self._match_keywords(text.lower()))
+
     def classify_from_name_and_description(self, name: str, description: str = "", address: str = "") -> ConceptClassification:
         """Enhanced classification based on name and description"""
         text_to_analyze = f"{name} {description} {address}".lower()
 
-        # Get AI classification if available
-        ai_concept, ai_confidence = self._ai_classify_text(text_to_analyze)
+        # Scan for keywords once; the rule-based result and secondary concepts both come from these matches
+        keyword_matches = self._match_keywords(text_to_analyze)
 
         # Get rule-based classification for comparison
-        rule_concept, rule_confidence = self._rule_based_classify(text_to_analyze)
+        rule_concept, rule_confidence = self._classify_matches(keyword_matches)
+
+        # Get AI classification if available (without a model it is the rule-based result)
+        if AI_AVAILABLE and self.ai_model:
+            ai_concept, ai_confidence = self._ai_classify_text(text_to_analyze)
+        else:
+            ai_concept, ai_confidence = rule_concept, rule_confidence
 
         # Combine results
         if ai_confidence > rule_confidence:
@@ -485,9 +500,8 @@ class EnhancedRestaurantConceptClassifier:
         secondary_concepts = []
         all_keywords = []
 
-        for concept, pattern in self.compiled_patterns.items():
-            matches = pattern.findall(text_to_analyze)
-            if matches and concept != primary_concept:
+        for concept, matches in keyword_matches.items():
+            if concept != primary_concept:
                 secondary_concepts.append(concept)
                 all_keywords.extend(matches)
 
@@ -508,15 +522,16 @@ class EnhancedRestaurantConceptClassifier:
 
         web_data_sources = []
 
-        # Try multiple web sources
+        # Request every source at once, then use them in preference order; once one succeeds the
+        # slower ones are cancelled, so a failed source costs no extra round trip
         sources_to_try = [
-            ('yelp', lambda: self._scrape_yelp_business(restaurant_name, address)),
-            ('google', lambda: self._scrape_google_business(restaurant_name, address))
+            ('yelp', asyncio.ensure_future(self._scrape_yelp_business(restaurant_name, address))),
+            ('google', asyncio.ensure_future(self._scrape_google_business(restaurant_name, address)))
         ]
 
-        for source_name, scrape_func in sources_to_try:
+        for index, (source_name, scrape_task) in enumerate(sources_to_try):
             try:
-                source_data = await scrape_func()
+                source_data = await scrape_task
                 if source_data and source_data.success:
                     web_data_sources.append(source_data.source_name)
 
@@ -538,6 +553,9 @@ class EnhancedRestaurantConceptClassifier:
                     if len(web_data_sources) > 1:
                         classification.confidence = min(classification.confidence * 1.3, 1.0)
 
+                    for _, pending_task in sources_to_try[index + 1:]:
+                        pending_task.cancel()
+
                     return classification
 
             except Exception as e:
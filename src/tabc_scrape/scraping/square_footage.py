@@ -6,16 +6,46 @@ import logging
 import re
 import time
 import asyncio
+from collections import defaultdict
 from typing import Optional, Dict, Any, List, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict
 import aiohttp
 from bs4 import BeautifulSoup
 from urllib.parse import quote, urlencode
 import json
 from pydantic import BaseModel, Field, validator
 
+from ..rate_limit import AsyncRateLimiter
+from ..http_session import request_session, shared_session
+from ..storage.cache import get_square_footage_cache, set_square_footage_cache
+
 logger = logging.getLogger(__name__)
 
+# Google searches are spaced 5 seconds apart across all scrapers, including concurrent ones
+_google_search_limiter = AsyncRateLimiter(5.0)
+
+# Common square footage patterns in text, in priority order. They are matched against lowercased
+# text, which is cheaper than re.IGNORECASE
+_SQFT_PATTERNS = [
+    re.compile(pattern) for pattern in (
+        r'(\d{1,3}(?:,\d{3})*)\s*(?:sq\.?\s*ft\.?|square\s+feet?|sqft)',
+        r'(\d{1,3}(?:,\d{3})*)\s*(?:sf|square\s+foot)',
+        r'building\s+size[:\s]+(\d{1,3}(?:,\d{3})*)',
+        r'property\s+size[:\s]+(\d{1,3}(?:,\d{3})*)',
+        r'restaurant\s+size[:\s]+(\d{1,3}(?:,\d{3})*)',
+        r'total\s+area[:\s]+(\d{1,3}(?:,\d{3})*)',
+        r'floor\s+area[:\s]+(\d{1,3}(?:,\d{3})*)',
+        r'leasable\s+area[:\s]+(\d{1,3}(?:,\d{3})*)',
+        r'(\d{1,3}(?:,\d{3})*)\s*(?:sq\s+ft|square\s+feet)',
+        r'building\s+area[:\s]+(\d{1,3}(?:,\d{3})*)',
+        r'(\d{1,3}(?:,\d{3})*)\s*(?:square\s+feet|sqft|sf)',
+    )
+]
+
+# Every pattern above contains one of these, so text without any of them is skipped without
+# running the regexes
+_SQFT_KEYWORDS = ('sq', 'sf', 'size', 'area')
+
 class ScrapingInput(BaseModel):
     """Input validation for scraping requests"""
     restaurant_name: str = Field(..., min_length=1, max_length=200, description="Restaurant name")
@@ -45,29 +75,13 @@ class SquareFootageResult:
 class SquareFootageScraper:
     """Scraper for restaurant square footage information"""
 
-    def __init__(self):
-        # aiohttp will be used per request
-
-        # Common square footage patterns in text
-        self.sqft_patterns = [
-            r'(\d{1,3}(?:,\d{3})*)\s*(?:sq\.?\s*ft\.?|square\s+feet?|sqft)',
-            r'(\d{1,3}(?:,\d{3})*)\s*(?:sf|square\s+foot)',
-            r'building\s+size[:\s]+(\d{1,3}(?:,\d{3})*)',
-            r'property\s+size[:\s]+(\d{1,3}(?:,\d{3})*)',
-            r'restaurant\s+size[:\s]+(\d{1,3}(?:,\d{3})*)',
-            r'total\s+area[:\s]+(\d{1,3}(?:,\d{3})*)',
-            r'floor\s+area[:\s]+(\d{1,3}(?:,\d{3})*)',
-            r'leasable\s+area[:\s]+(\d{1,3}(?:,\d{3})*)',
-            r'(\d{1,3}(?:,\d{3})*)\s*(?:sq\s+ft|square\s+feet)',
-            r'building\s+area[:\s]+(\d{1,3}(?:,\d{3})*)',
-            r'(\d{1,3}(?:,\d{3})*)\s*(?:square\s+feet|sqft|sf)',
-        ]
-
-        self.compiled_patterns = [re.compile(pattern, re.IGNORECASE) for pattern in self.sqft_patterns]
-
     def _extract_square_footage_from_text(self, text: str) -> Optional[int]:
         """Extract square footage numbers from text"""
-        for pattern in self.compiled_patterns:
+        text = text.lower()
+        if not any(keyword in text for keyword in _SQFT_KEYWORDS):
+            return None
+
+        for pattern in _SQFT_PATTERNS:
             matches = pattern.findall(text)
             if matches:
                 # Get the largest number found (most likely the building size)
@@ -96,10 +110,10 @@ class SquareFootageScraper:
         try:
             search_url = f"https://www.google.com/search?q={quote(query)}&num={num_results}"
 
-            # Add delay to respect rate limits
-            await asyncio.sleep(5)  # 5 second delay between requests
+            # Respect rate limits
+            await _google_search_limiter.wait()
 
-            async with aiohttp.ClientSession() as session:
+            async with request_session() as session:
                 async with session.get(
                     search_url,
                     timeout=aiohttp.ClientTimeout(total=15),
@@ -178,7 +192,7 @@ class SquareFootageScraper:
             search_query = f"{address} restaurant"
             search_url = f"{base_url}?q={quote(search_query)}"
 
-            async with aiohttp.ClientSession() as session:
+            async with request_session() as session:
                 async with session.get(search_url, timeout=aiohttp.ClientTimeout(total=15)) as response:
                     if response.status == 200:
                         text = await response.text()
@@ -201,7 +215,7 @@ class SquareFootageScraper:
             for url in urls:
                 if any(domain in url.lower() for domain in ['.com', '.net', '.org', '.biz']):
                     try:
-                        async with aiohttp.ClientSession() as session:
+                        async with request_session() as session:
                             async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
                                 if response.status == 200:
                                     text = await response.text()
@@ -226,7 +240,7 @@ class SquareFootageScraper:
             for url in urls:
                 if any(site in url.lower() for site in ['loopnet.com', 'crexi.com', 'showcase.com', 'costar.com', 'properties.com']):
                     try:
-                        async with aiohttp.ClientSession() as session:
+                        async with request_session() as session:
                             async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
                                 if response.status == 200:
                                     text = await response.text()
@@ -259,6 +273,15 @@ class SquareFootageScraper:
         address = input_data.address
         county = input_data.county
 
+        # Found square footage rarely changes, so it is reused across runs until it expires
+        cache_key = f"{restaurant_name}|{address}|{county}"
+        cached = await get_square_footage_cache(cache_key)
+        if cached is not None:
+            logger.info(f"Returning cached square footage for {restaurant_name}: {cached['square_footage']}")
+            # Annotate a copy; the dict may be the one held by the in-memory cache layer
+            cached = dict(cached, property_details={**(cached.get('property_details') or {}), 'cached': True})
+            return SquareFootageResult(**cached)
+
         logger.info(f"Scraping square footage for {restaurant_name} at {address}")
 
         sources_tried = []
@@ -301,7 +324,7 @@ class SquareFootageScraper:
 
             for url in urls:
                 try:
-                    async with aiohttp.ClientSession() as session:
+                    async with request_session() as session:
                         async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
                             if response.status == 200:
                                 text = await response.text()
@@ -341,57 +364,80 @@ class SquareFootageScraper:
         )
 
         logger.info(f"Square footage scraping result: {square_footage} sqft from {source} (confidence: {confidence:.2f})")
+
+        # Misses are not cached, so sources that were unreachable are retried next time
+        if square_footage:
+            await set_square_footage_cache(cache_key, asdict(result))
         return result
 
-    async def scrape_multiple_restaurants(self, restaurants: List[Dict[str, Any]]) -> Dict[str, SquareFootageResult]:
+    async def scrape_multiple_restaurants(self, restaurants: List[Dict[str, Any]],
+                                          per_county_concurrency: int = 2) -> Dict[str, SquareFootageResult]:
         """
-        Scrape square footage for multiple restaurants
+        Scrape square footage for multiple restaurants concurrently
+
+        Each county's property appraiser site sees at most per_county_concurrency restaurants at
+        once; Google searches stay spaced by the shared search limiter.
 
         Args:
             restaurants: List of restaurant data dictionaries
+            per_county_concurrency: Maximum restaurants scraped at once within one county
 
         Returns:
             Dictionary mapping restaurant IDs to results
         """
-        results = {}
+        county_semaphores = defaultdict(lambda: asyncio.Semaphore(per_county_concurrency))
+        locations = [
+            (
+                restaurant.get('id', restaurant.get('location_name', 'unknown')),
+                restaurant.get('location_name', ''),
+                restaurant.get('full_address', restaurant.get('location_address', '')),
+                restaurant.get('location_county', '')
+            )
+            for restaurant in restaurants
+        ]
+
+        async def scrape(name: str, address: str, county: str) -> SquareFootageResult:
+            async with county_semaphores[county.strip().lower()]:
+                return await self.scrape_square_footage(name, address, county)
 
-        for restaurant in restaurants:
-            restaurant_id = restaurant.get('id', restaurant.get('location_name', 'unknown'))
-            name = restaurant.get('location_name', '')
-            address = restaurant.get('full_address', restaurant.get('location_address', ''))
-            county = restaurant.get('location_county', '')
-
-            # Add small delay between requests to be respectful
-            if results:  # Don't delay the first request
-                await asyncio.sleep(1)
-
-            try:
-                result = await self.scrape_square_footage(name, address, county)
-                results[restaurant_id] = result
-            except Exception as e:
-                logger.error(f"Error scraping {name}: {e}")
-                results[restaurant_id] = SquareFootageResult(
+        # One keep-alive session for the whole batch, so repeat hosts skip the handshakes
+        async with shared_session():
+            outcomes = await asyncio.gather(
+                *(scrape(name, address, county) for _, name, address, county in locations),
+                return_exceptions=True
+            )
+
+        results = {}
+        for (restaurant_id, name, address, _), outcome in zip(locations, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error(f"Error scraping {name}: {outcome}")
+                outcome = SquareFootageResult(
                     restaurant_name=name,
                     address=address,
                     square_footage=None,
                     source='error',
                     confidence=0.0
                 )
+            results[restaurant_id] = outcome
 
         return results
 
     def get_scraping_stats(self, results: Dict[str, SquareFootageResult]) -> Dict[str, Any]:
         """Get statistics about scraping results"""
         total = len(results)
-        successful = sum(1 for r in results.values() if r.square_footage is not None)
-        failed = total - successful
 
+        # Successes, their sources and their confidence in a single pass
+        successful = 0
+        confidence_total = 0
         sources = {}
         for result in results.values():
             if result.square_footage is not None:
+                successful += 1
+                confidence_total += result.confidence
                 sources[result.source] = sources.get(result.source, 0) + 1
 
-        avg_confidence = sum(r.confidence for r in results.values() if r.square_footage is not None) / max(successful, 1)
+        failed = total - successful
+        avg_confidence = confidence_total / max(successful, 1)
 
         return {
             'total_restaurants': total,
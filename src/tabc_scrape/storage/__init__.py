@@ -2,8 +2,29 @@
 Data storage module for restaurant data persistence
 """
 
-from .database import DatabaseManager
-from .models import Restaurant, ConceptClassification, PopulationData, SquareFootageData, EnrichmentJob, DataQualityMetrics
-from .enrichment_pipeline import DataEnrichmentPipeline, EnrichmentResult, PipelineStats
+import importlib
 
-__all__ = ['DatabaseManager']
\ No newline at end of file
+# Public names by defining submodule, imported on first attribute access. Importing a light submodule
+# such as .cache then doesn't pull in the enrichment pipeline, which imports the analysis modules that
+# themselves use .cache.
+_LAZY_EXPORTS = {
+    'DatabaseManager': '.database',
+    'Restaurant': '.models',
+    'ConceptClassification': '.models',
+    'PopulationData': '.models',
+    'SquareFootageData': '.models',
+    'EnrichmentJob': '.models',
+    'DataQualityMetrics': '.models',
+    'DataEnrichmentPipeline': '.enrichment_pipeline',
+    'EnrichmentResult': '.enrichment_pipeline',
+    'PipelineStats': '.enrichment_pipeline'
+}
+
+__all__ = ['DatabaseManager']
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        value = getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
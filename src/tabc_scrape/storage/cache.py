@@ -5,6 +5,9 @@ Simple in-memory caching service (Redis fallback)
 import json
 import logging
 import hashlib
+import os
+import sqlite3
+import threading
 import time
 from typing import Any, Optional, Dict, Union
 from collections import defaultdict
@@ -204,8 +207,69 @@ class CacheService:
             'type': 'memory'
         }
 
+class PersistentCache:
+    """JSON values persisted in a SQLite file, so expensive lookups survive across runs"""
+
+    def __init__(self, path: str):
+        self.path = os.path.expanduser(path) if path else ''
+        self._conn = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _normalize(key: str) -> str:
+        """Ignore case and whitespace differences in keys such as addresses"""
+        return ' '.join(key.lower().split())
+
+    def _connection(self) -> Optional[sqlite3.Connection]:
+        """Open the store on first use; disables it if the file cannot be opened"""
+        if self._conn is None and self.path:
+            try:
+                os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+                conn = sqlite3.connect(self.path, check_same_thread=False)
+                conn.execute("CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value TEXT NOT NULL, ts REAL NOT NULL)")
+                conn.commit()
+                self._conn = conn
+            except sqlite3.Error as e:
+                logger.warning(f"Persistent cache disabled ({self.path}): {e}")
+                self.path = ''
+        return self._conn
+
+    def get(self, key: str, max_age: Optional[float] = None) -> Optional[Any]:
+        """Stored value for a key, or None if missing or older than max_age seconds"""
+        with self._lock:
+            conn = self._connection()
+            if conn is None:
+                return None
+            try:
+                row = conn.execute("SELECT value, ts FROM cache WHERE key = ?", (self._normalize(key),)).fetchone()
+            except sqlite3.Error as e:
+                logger.warning(f"Persistent cache read failed ({self.path}): {e}")
+                return None
+        if row is None or (max_age is not None and time.time() - row[1] > max_age):
+            return None
+        return json.loads(row[0])
+
+    def set(self, key: str, value: Any) -> bool:
+        """Persist a JSON-serializable value"""
+        with self._lock:
+            conn = self._connection()
+            if conn is None:
+                return False
+            try:
+                conn.execute(
+                    "INSERT OR REPLACE INTO cache (key, value, ts) VALUES (?, ?, ?)",
+                    (self._normalize(key), json.dumps(value, default=str), time.time())
+                )
+                conn.commit()
+                return True
+            except sqlite3.Error as e:
+                logger.warning(f"Persistent cache write failed ({self.path}): {e}")
+                return False
+
 # Global cache service instance
 cache_service = CacheService()
+geocode_store = PersistentCache(config.cache.geocode_cache_path)
+square_footage_store = PersistentCache(config.cache.square_footage_cache_path)
 
 # Convenience functions for common operations
 async def get_api_cache(url: str) -> Optional[Dict[str, Any]]:
@@ -217,9 +281,33 @@ async def set_api_cache(url: str, response: Dict[str, Any]) -> bool:
     return await cache_service.set('api', url, response, config.cache.api_cache_ttl)
 
 async def get_geocode_cache(address: str) -> Optional[Dict[str, float]]:
-    """Get geocoding result from cache"""
-    return await cache_service.get('geocode', address)
+    """Get geocoding result from cache, falling back to the persistent store"""
+    cached = await cache_service.get('geocode', address)
+    if cached is not None:
+        return cached
+
+    stored = geocode_store.get(address)
+    if stored is not None:
+        await cache_service.set('geocode', address, stored, config.cache.geocode_cache_ttl)
+    return stored
 
 async def set_geocode_cache(address: str, lat: float, lon: float) -> bool:
-    """Cache geocoding result"""
-    return await cache_service.set('geocode', address, {'lat': lat, 'lon': lon}, config.cache.geocode_cache_ttl)
\ No newline at end of file
+    """Cache geocoding result in memory and in the persistent store"""
+    geocode_store.set(address, {'lat': lat, 'lon': lon})
+    return await cache_service.set('geocode', address, {'lat': lat, 'lon': lon}, config.cache.geocode_cache_ttl)
+
+async def get_square_footage_cache(key: str) -> Optional[Dict[str, Any]]:
+    """Get a square footage result from cache, falling back to the persistent store"""
+    cached = await cache_service.get('square_footage', key)
+    if cached is not None:
+        return cached
+
+    stored = square_footage_store.get(key, max_age=config.cache.square_footage_cache_ttl)
+    if stored is not None:
+        await cache_service.set('square_footage', key, stored, config.cache.default_ttl)
+    return stored
+
+async def set_square_footage_cache(key: str, result: Dict[str, Any]) -> bool:
+    """Cache a square footage result in memory and in the persistent store"""
+    square_footage_store.set(key, result)
+    return await cache_service.set('square_footage', key, result, config.cache.default_ttl)
\ No newline at end of file
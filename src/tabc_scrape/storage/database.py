@@ -5,7 +5,11 @@ Enhanced database management with SQLAlchemy and enrichment pipeline
 import logging
 import json
 import os
-from typing import Dict, List, Optional, Any
+import itertools
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, Iterator, List, Optional, Any, Union
 from dataclasses import dataclass
 import pandas as pd
 from contextlib import contextmanager
@@ -13,6 +17,7 @@ from contextlib import contextmanager
 from sqlalchemy import create_engine, Column, Integer, String, Float, Boolean, DateTime, Text, func, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.pool import StaticPool
 from sqlalchemy.exc import SQLAlchemyError
 from typing import Optional
 
@@ -21,18 +26,58 @@ from .models import Base, Restaurant, ConceptClassification, PopulationData, Squ
 
 logger = logging.getLogger(__name__)
 
+# Low-cardinality text columns of the restaurant and enriched DataFrames that can be loaded as categoricals
+_RESTAURANT_CATEGORY_COLUMNS = (
+    'taxpayer_city', 'taxpayer_state', 'taxpayer_county',
+    'location_city', 'location_state', 'location_county'
+)
+_ENRICHED_CATEGORY_COLUMNS = _RESTAURANT_CATEGORY_COLUMNS + (
+    'concept_primary', 'concept_source', 'square_footage_source'
+)
+
+# Total rows of enriched DataFrames kept per manager; larger frames (e.g. whole-table loads) aren't cached
+_ENRICHED_FRAME_CACHE_MAX_ROWS = 20000
+
+# Restaurants written per executemany batch by store_restaurants, bounding memory for large ingests
+_STORE_BATCH_SIZE = 1000
+
+_RESTAURANT_COLUMNS = frozenset(column.key for column in Restaurant.__table__.columns)
+
+# Enriched row columns that only restaurants without / with population data have
+_DEFAULT_POPULATION_COLUMNS = tuple(
+    f"{prefix}_{radius}_mile" for radius in [1, 3, 5, 10] for prefix in ('population', 'drinking_age')
+)
+_POPULATION_DATA_COLUMNS = tuple(
+    f"population_{key}" for key in PopulationData().to_dict() if key != 'id' and key != 'restaurant_id'
+)
+
 @dataclass
 class DatabaseManager:
     """Enhanced database manager using SQLAlchemy with enrichment pipeline support"""
 
+    # Wall-clock time of the last restaurant/enrichment write made by any manager in this process
+    last_mutation_ts = 0.0
+
     def __init__(self, database_url: Optional[str] = None):
         self.database_url = database_url or config.database.url
         # Mask credentials in logs
         masked_url = self._mask_database_url(self.database_url)
-        self.engine = create_engine(self.database_url, echo=config.database.echo)
+        engine_options = {'echo': config.database.echo}
+        if not self.database_url.startswith('sqlite'):
+            # Keep a pool of connections for reuse across requests, checking each is alive before handing it out
+            engine_options.update(pool_size=config.database.pool_size, pool_pre_ping=True)
+        elif ':memory:' in self.database_url or 'mode=memory' in self.database_url:
+            # An in-memory database lives only as long as its connection, so every session and thread
+            # has to share that single connection
+            engine_options.update(poolclass=StaticPool, connect_args={'check_same_thread': False})
+        self.engine = create_engine(self.database_url, **engine_options)
         self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
         logger.info(f"Initialized database with URL: {masked_url}")
 
+        # (limit, categorical, after_id) -> (mutation_ts, created_at, DataFrame); see get_enriched_restaurants_dataframe
+        self._enriched_frame_cache = OrderedDict()
+        self._enriched_frame_cache_lock = threading.Lock()
+
         # Create tables
         self._create_tables()
 
@@ -110,43 +155,80 @@ class DatabaseManager:
         finally:
             session.close()
 
-    def store_restaurants(self, restaurants: List[Dict[str, Any]]) -> int:
+    @staticmethod
+    def _mark_data_changed():
+        """Record that restaurant or enrichment data changed, invalidating derived caches"""
+        DatabaseManager.last_mutation_ts = time.time()
+
+    def invalidate_enriched_cache(self):
+        """Drop cached enriched DataFrames, e.g. after another process has written to the database"""
+        with self._enriched_frame_cache_lock:
+            self._enriched_frame_cache.clear()
+
+    def store_restaurants(self, restaurants: Iterable[Dict[str, Any]]) -> int:
         """
         Store restaurant data in the database
 
         Args:
-            restaurants: List of restaurant dictionaries
+            restaurants: Restaurant dictionaries; any iterable is consumed in a single pass, so
+                callers can pass a generator such as (vars(r) for r in records)
 
         Returns:
             Number of records stored
         """
         stored_count = 0
+        restaurants = iter(restaurants)
 
+        # One transaction for the whole ingest, written in batches: each batch looks up its existing
+        # ids with a single query and inserts the new rows with one executemany
         with self.get_session() as session:
-            for restaurant_data in restaurants:
-                try:
-                    # Check if restaurant already exists
-                    existing = session.query(Restaurant).filter_by(id=restaurant_data['id']).first()
-
-                    if existing:
-                        # Update existing record
-                        for key, value in restaurant_data.items():
-                            if hasattr(existing, key):
-                                setattr(existing, key, value)
-                        existing.last_updated = func.now()
-                    else:
-                        # Create new restaurant record
-                        restaurant = Restaurant(**restaurant_data)
-                        session.add(restaurant)
-
-                    stored_count += 1
-
-                except Exception as e:
-                    logger.error(f"Error storing restaurant {restaurant_data.get('id', 'unknown')}: {e}")
-                    continue
+            while True:
+                batch = list(itertools.islice(restaurants, _STORE_BATCH_SIZE))
+                if not batch:
+                    break
+                stored_count += self._store_restaurant_batch(session, batch)
 
             logger.info(f"Successfully stored/updated {stored_count} restaurant records")
-            return stored_count
+
+        self._mark_data_changed()
+        return stored_count
+
+    def _store_restaurant_batch(self, session: Session, batch: List[Dict[str, Any]]) -> int:
+        """Insert or update one batch of restaurant dictionaries, returning how many were stored"""
+        # Later duplicates of an id within the batch override earlier ones
+        pending = {}
+        for restaurant_data in batch:
+            try:
+                pending.setdefault(restaurant_data['id'], {}).update(restaurant_data)
+            except Exception as e:
+                logger.error(f"Error storing restaurant {restaurant_data.get('id', 'unknown')}: {e}")
+
+        existing = {
+            restaurant.id: restaurant
+            for restaurant in session.query(Restaurant).filter(Restaurant.id.in_(list(pending)))
+        }
+
+        stored_count = 0
+        new_records = []
+        for restaurant_id, restaurant_data in pending.items():
+            restaurant = existing.get(restaurant_id)
+            if restaurant is not None:
+                # Update existing record
+                for key, value in restaurant_data.items():
+                    if key in _RESTAURANT_COLUMNS:
+                        setattr(restaurant, key, value)
+                restaurant.last_updated = func.now()
+            else:
+                unknown_fields = restaurant_data.keys() - _RESTAURANT_COLUMNS
+                if unknown_fields:
+                    logger.error(f"Error storing restaurant {restaurant_id}: unknown fields {sorted(unknown_fields)}")
+                    continue
+                new_records.append(restaurant_data)
+            stored_count += 1
+
+        if new_records:
+            session.bulk_insert_mappings(Restaurant, new_records)
+        return stored_count
 
     def get_restaurant_by_id(self, restaurant_id: str) -> Optional[Restaurant]:
         """
@@ -175,12 +257,14 @@ class DatabaseManager:
             restaurant = session.query(Restaurant).filter_by(id=restaurant_id).first()
             return restaurant.to_dict() if restaurant else None
 
-    def get_restaurants_dataframe(self, limit: Optional[int] = None) -> pd.DataFrame:
+    def get_restaurants_dataframe(self, limit: Optional[int] = None, categorical: bool = False) -> pd.DataFrame:
         """
         Get all restaurants as a pandas DataFrame
 
         Args:
             limit: Maximum number of records to return
+            categorical: Load city/state/county columns as pandas categoricals, which store each
+                repeated value once and speed up grouping on them
 
         Returns:
             DataFrame with restaurant data
@@ -200,6 +284,8 @@ class DatabaseManager:
             # Convert to list of dictionaries
             data = [restaurant.to_dict() for restaurant in restaurants]
             df = pd.DataFrame(data)
+            if categorical:
+                df = df.astype({column: 'category' for column in _RESTAURANT_CATEGORY_COLUMNS if column in df.columns})
 
             logger.info(f"Retrieved {len(df)} restaurant records from database")
             return df
@@ -228,7 +314,9 @@ class DatabaseManager:
                 session.add(classification)
 
                 logger.info(f"Stored concept classification for restaurant {restaurant_id}")
-                return True
+
+            self._mark_data_changed()
+            return True
 
         except Exception as e:
             logger.error(f"Error storing concept classification: {e}")
@@ -261,7 +349,9 @@ class DatabaseManager:
                 session.add(pop_data)
 
                 logger.info(f"Stored population data for restaurant {restaurant_id}")
-                return True
+
+            self._mark_data_changed()
+            return True
 
         except Exception as e:
             logger.error(f"Error storing population data: {e}")
@@ -291,7 +381,9 @@ class DatabaseManager:
                 session.add(sqft_record)
 
                 logger.info(f"Stored square footage data for restaurant {restaurant_id}")
-                return True
+
+            self._mark_data_changed()
+            return True
 
         except Exception as e:
             logger.error(f"Error storing square footage data: {e}")
@@ -364,30 +456,114 @@ class DatabaseManager:
         except Exception as e:
             logger.error(f"Error updating enrichment job {job_id}: {e}")
 
-    def get_enriched_restaurants_dataframe(self, limit: Optional[int] = None) -> pd.DataFrame:
+    def _enriched_restaurants_query(self, session: Session, after_id: Optional[str] = None):
+        """Query joining restaurants with all enrichment data, optionally keyset-paged by id (see after_id)"""
+        query = session.query(
+            Restaurant,
+            ConceptClassification,
+            PopulationData,
+            SquareFootageData
+        ).outerjoin(
+            ConceptClassification, Restaurant.id == ConceptClassification.restaurant_id
+        ).outerjoin(
+            PopulationData, Restaurant.id == PopulationData.restaurant_id
+        ).outerjoin(
+            SquareFootageData, Restaurant.id == SquareFootageData.restaurant_id
+        )
+        if after_id is not None:
+            query = query.filter(Restaurant.id > after_id).order_by(Restaurant.id)
+        return query
+
+    def _enriched_restaurant_row(self, restaurant: Restaurant, concept: Optional[ConceptClassification],
+                                 population: Optional[PopulationData], sqft: Optional[SquareFootageData]) -> Dict[str, Any]:
+        """Flatten a restaurant and its enrichment records into a single dictionary"""
+        row = restaurant.to_dict()
+
+        # Add concept data
+        if concept:
+            row.update({
+                'concept_primary': concept.primary_concept,
+                'concept_secondary': concept.secondary_concepts or [],
+                'concept_confidence': concept.confidence,
+                'concept_source': concept.source
+            })
+        else:
+            row.update({
+                'concept_primary': None,
+                'concept_secondary': [],
+                'concept_confidence': 0.0,
+                'concept_source': None
+            })
+
+        # Add population data
+        if population:
+            pop_dict = population.to_dict()
+            for key, value in pop_dict.items():
+                if key != 'id' and key != 'restaurant_id':
+                    row[f"population_{key}"] = value
+        else:
+            # Add default population columns
+            for radius in [1, 3, 5, 10]:
+                row[f"population_{radius}_mile"] = 0
+                row[f"drinking_age_{radius}_mile"] = 0
+
+        # Add square footage data
+        if sqft:
+            row.update({
+                'square_footage': sqft.square_footage,
+                'square_footage_source': sqft.source,
+                'square_footage_confidence': sqft.confidence
+            })
+        else:
+            row.update({
+                'square_footage': None,
+                'square_footage_source': None,
+                'square_footage_confidence': 0.0
+            })
+
+        return row
+
+    def get_enriched_restaurants_dataframe(self, limit: Optional[int] = None, categorical: bool = False,
+                                           chunksize: Optional[int] = None,
+                                           after_id: Optional[str] = None) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
         """
         Get restaurants with all enrichment data as a pandas DataFrame
 
         Args:
-            limit: Maximum number of records to return
+            limit: Maximum number of records to return (applied as a SQL LIMIT)
+            categorical: Load low-cardinality text columns (cities, states, counties, concept and
+                source labels) as pandas categoricals, storing each distinct value once
+            chunksize: Instead of one DataFrame, return an iterator of DataFrames of at most this
+                many rows, fetched from the database in batches of the same size
+            after_id: Keyset pagination: only return records whose id sorts after this one, ordered
+                by id. Pass '' to start from the first record, then the last id of each page.
 
         Returns:
-            DataFrame with enriched restaurant data
+            DataFrame with enriched restaurant data, or an iterator of DataFrames when chunksize is given
+
+        DataFrames of up to _ENRICHED_FRAME_CACHE_MAX_ROWS rows in total are cached for
+        config.cache.data_cache_ttl seconds and dropped as soon as this process writes restaurant or
+        enrichment data. Each call returns its own copy.
         """
+        if chunksize:
+            return self._iter_enriched_restaurant_frames(limit, chunksize, categorical, after_id)
+
+        key = (limit, categorical, after_id)
+        mutation_ts = DatabaseManager.last_mutation_ts
+        now = time.monotonic()
+
+        with self._enriched_frame_cache_lock:
+            entry = self._enriched_frame_cache.get(key)
+            if entry and entry[0] == mutation_ts and now - entry[1] < config.cache.data_cache_ttl:
+                self._enriched_frame_cache.move_to_end(key)
+                return entry[2].copy()
+
+        if limit is None:
+            logger.warning("Loading every enriched restaurant record into memory; pass limit or chunksize to bound it")
+
         with self.get_session() as session:
             # Join restaurants with all enrichment data
-            query = session.query(
-                Restaurant,
-                ConceptClassification,
-                PopulationData,
-                SquareFootageData
-            ).outerjoin(
-                ConceptClassification, Restaurant.id == ConceptClassification.restaurant_id
-            ).outerjoin(
-                PopulationData, Restaurant.id == PopulationData.restaurant_id
-            ).outerjoin(
-                SquareFootageData, Restaurant.id == SquareFootageData.restaurant_id
-            )
+            query = self._enriched_restaurants_query(session, after_id)
 
             if limit:
                 results = query.limit(limit).all()
@@ -399,58 +575,83 @@ class DatabaseManager:
                 return pd.DataFrame()
 
             # Convert to list of dictionaries
-            data = []
-            for restaurant, concept, population, sqft in results:
-                row = restaurant.to_dict()
-
-                # Add concept data
-                if concept:
-                    row.update({
-                        'concept_primary': concept.primary_concept,
-                        'concept_secondary': concept.secondary_concepts or [],
-                        'concept_confidence': concept.confidence,
-                        'concept_source': concept.source
-                    })
-                else:
-                    row.update({
-                        'concept_primary': None,
-                        'concept_secondary': [],
-                        'concept_confidence': 0.0,
-                        'concept_source': None
-                    })
-
-                # Add population data
-                if population:
-                    pop_dict = population.to_dict()
-                    for key, value in pop_dict.items():
-                        if key != 'id' and key != 'restaurant_id':
-                            row[f"population_{key}"] = value
-                else:
-                    # Add default population columns
-                    for radius in [1, 3, 5, 10]:
-                        row[f"population_{radius}_mile"] = 0
-                        row[f"drinking_age_{radius}_mile"] = 0
-
-                # Add square footage data
-                if sqft:
-                    row.update({
-                        'square_footage': sqft.square_footage,
-                        'square_footage_source': sqft.source,
-                        'square_footage_confidence': sqft.confidence
-                    })
-                else:
-                    row.update({
-                        'square_footage': None,
-                        'square_footage_source': None,
-                        'square_footage_confidence': 0.0
-                    })
-
-                data.append(row)
+            data = [self._enriched_restaurant_row(*result) for result in results]
 
-            df = pd.DataFrame(data)
+            df = self._enriched_frame(data, categorical)
             logger.info(f"Retrieved {len(df)} enriched restaurant records from database")
+
+        if len(df) > _ENRICHED_FRAME_CACHE_MAX_ROWS:
             return df
 
+        with self._enriched_frame_cache_lock:
+            self._enriched_frame_cache[key] = (mutation_ts, now, df)
+            self._enriched_frame_cache.move_to_end(key)
+            cached_rows = sum(len(entry[2]) for entry in self._enriched_frame_cache.values())
+            while cached_rows > _ENRICHED_FRAME_CACHE_MAX_ROWS:
+                _, (_, _, evicted) = self._enriched_frame_cache.popitem(last=False)
+                cached_rows -= len(evicted)
+
+        return df.copy()
+
+    def _iter_enriched_restaurant_frames(self, limit: Optional[int], chunksize: int, categorical: bool,
+                                         after_id: Optional[str] = None) -> Iterator[pd.DataFrame]:
+        """Yield enriched restaurant DataFrames of up to chunksize rows, reading rows from the database in batches"""
+        with self.get_session() as session:
+            query = self._enriched_restaurants_query(session, after_id)
+            if limit:
+                query = query.limit(limit)
+
+            # Rows with and without population data have different columns. Give every chunk the
+            # columns one DataFrame of all the rows would have, so streamed chunks line up
+            columns = None
+
+            def frame(data):
+                nonlocal columns
+                df = self._enriched_frame(data, categorical)
+                if columns is None:
+                    columns = list(df.columns)
+                    if self._enriched_rows_mix_population(session, query):
+                        columns += [c for c in _DEFAULT_POPULATION_COLUMNS + _POPULATION_DATA_COLUMNS if c not in columns]
+                return df if list(df.columns) == columns else df.reindex(columns=columns)
+
+            data = []
+            for result in query.yield_per(chunksize):
+                data.append(self._enriched_restaurant_row(*result))
+                if len(data) == chunksize:
+                    yield frame(data)
+                    data = []
+
+            if data:
+                yield frame(data)
+
+    @staticmethod
+    def _enriched_rows_mix_population(session: Session, query) -> bool:
+        """Whether the rows of an enriched restaurants query include restaurants both with and without population data"""
+        flags = query.with_entities(PopulationData.id.is_(None).label('no_population')).subquery()
+        return session.query(flags.c.no_population).distinct().count() > 1
+
+    @staticmethod
+    def _enriched_frame(data: List[Dict[str, Any]], categorical: bool) -> pd.DataFrame:
+        """Build an enriched restaurant DataFrame from row dictionaries"""
+        df = pd.DataFrame(data)
+        if categorical:
+            df = df.astype({column: 'category' for column in _ENRICHED_CATEGORY_COLUMNS if column in df.columns})
+        return df
+
+    def get_enriched_restaurant_by_id(self, restaurant_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a single restaurant with all enrichment data by ID
+
+        Args:
+            restaurant_id: Restaurant ID
+
+        Returns:
+            Enriched restaurant dictionary or None if not found
+        """
+        with self.get_session() as session:
+            result = self._enriched_restaurants_query(session).filter(Restaurant.id == restaurant_id).first()
+            return self._enriched_restaurant_row(*result) if result else None
+
     def get_enrichment_stats(self) -> Dict[str, Any]:
         """
         Get statistics about data enrichment
@@ -2,22 +2,48 @@
 Comprehensive Data Validation and Quality Assessment Framework
 """
 
+import copy
+import heapq
 import logging
+import operator
+import os
 import re
+import sys
 import json
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Tuple, Mapping, Sequence, Union, Iterator
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from collections import defaultdict
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
 import numpy as np
 from abc import ABC, abstractmethod
 
+# Optional JIT compilation for numeric validation kernels
+NUMBA_AVAILABLE = False
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    # Numba not available - range checks run as plain NumPy expressions
+    pass
+
+# Optional Arrow-backed string columns for vectorized text operations
+PYARROW_AVAILABLE = False
+try:
+    import pyarrow  # noqa: F401
+    PYARROW_AVAILABLE = True
+except ImportError:
+    # pyarrow not available - text columns stay object dtype
+    pass
+
 logger = logging.getLogger(__name__)
 
 # Compile regex patterns once at module level for reuse
 _ZIP_PATTERN = re.compile(r"^\d{5}(-\d{4})?$")
-_STREET_SUFFIX_PATTERNS = {}  # Will be populated lazily
+_NON_DIGIT_PATTERN = re.compile(r"\D")
+# str.translate table deleting every non-digit Latin-1 character
+_NON_DIGIT_TABLE = str.maketrans('', '', ''.join(chr(c) for c in range(256) if not chr(c).isdecimal()))
 _VALID_STATES_SET = frozenset([
     "AL", "AK", "AZ", "AR", "CA", "CO", "CT", "DE", "FL", "GA",
     "HI", "ID", "IL", "IN", "IA", "KS", "KY", "LA", "ME", "MD",
@@ -26,7 +52,141 @@ _VALID_STATES_SET = frozenset([
     "SD", "TN", "TX", "UT", "VT", "VA", "WA", "WV", "WI", "WY"
 ])
 
-@dataclass
+_STREET_SUFFIX_MAP = {
+    'st': 'Street',
+    'st.': 'Street',
+    'street': 'Street',
+    'ave': 'Avenue',
+    'ave.': 'Avenue',
+    'avenue': 'Avenue',
+    'rd': 'Road',
+    'rd.': 'Road',
+    'road': 'Road',
+    'blvd': 'Boulevard',
+    'blvd.': 'Boulevard',
+    'boulevard': 'Boulevard',
+    'ln': 'Lane',
+    'ln.': 'Lane',
+    'lane': 'Lane',
+    'dr': 'Drive',
+    'dr.': 'Drive',
+    'drive': 'Drive',
+    'ct': 'Court',
+    'ct.': 'Court',
+    'court': 'Court',
+    'pl': 'Place',
+    'pl.': 'Place',
+    'place': 'Place',
+    'way': 'Way',
+    'cir': 'Circle',
+    'cir.': 'Circle',
+    'circle': 'Circle'
+}
+# Alternation keeps map order so the bare abbreviation wins, as with the old per-suffix loop
+_STREET_SUFFIX_PATTERN = re.compile(
+    r'\b(' + '|'.join(re.escape(abbr) for abbr in _STREET_SUFFIX_MAP) + r')\b',
+    re.IGNORECASE
+)
+
+# Two-letter state codes packed as (first_char << 8 | second_char) for vectorized membership tests
+_VALID_STATES_U16 = np.array(sorted(ord(s[0]) << 8 | ord(s[1]) for s in _VALID_STATES_SET), dtype=np.uint16)
+
+# __slots__ dataclasses need Python 3.10+; older interpreters fall back to a regular __dict__
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Small integer severity codes so result tallies run as NumPy reductions
+_SEVERITY_VALID = 0
+_SEVERITY_CODES = {'warning': 1, 'error': 2}
+_SEVERITY_OTHER = 3  # Invalid results with any other severity (e.g. 'info')
+
+def _is_unpopulated(value: Any) -> bool:
+    """NA-safe ``value is None or value == ''``; pd.NA counts as missing, NaN and non-scalar values as present"""
+    if value is None or value is pd.NA:
+        return True
+    return isinstance(value, str) and value == ''
+
+def _column_values(series: pd.Series) -> np.ndarray:
+    """Array of a column's cells with pd.NA read as None, like the values of rows from iterrows()"""
+    if isinstance(series.dtype, pd.api.extensions.ExtensionDtype):
+        return series.to_numpy(dtype=object, na_value=None)
+
+    values = series.to_numpy()
+    if values.dtype == object:
+        na = np.fromiter((value is pd.NA for value in values), dtype=bool, count=len(values))
+        if na.any():
+            values = values.copy()
+            values[na] = None
+    return values
+
+def _missing_mask(values: np.ndarray) -> np.ndarray:
+    """Vectorized equivalent of the per-record ``value is None or value == ''`` check"""
+    if values.dtype != object:
+        return np.zeros(len(values), dtype=bool)
+    return np.equal(values, None) | np.equal(values, '')
+
+def _to_float_array(series: pd.Series) -> np.ndarray:
+    """Float64 array of a column, only parsing cells when its dtype is not already numeric"""
+    if pd.api.types.is_numeric_dtype(series.dtype):
+        return series.to_numpy(dtype=np.float64, na_value=np.nan)
+    return pd.to_numeric(series, errors='coerce').to_numpy(dtype=np.float64)
+
+def _as_text(series: pd.Series) -> pd.Series:
+    """Stringify a column like str() does, backed by Arrow when available so .str methods run as native kernels"""
+    text = series.astype(str)
+    return text.astype("string[pyarrow]") if PYARROW_AVAILABLE else text
+
+def _valid_state_mask(values: np.ndarray) -> np.ndarray:
+    """Case-insensitive membership test of values against the valid two-letter state codes"""
+    text = values.astype(str)
+    chars = text.astype('<U2').view(np.uint32).reshape(-1, 2)
+    codes = (chars[:, 0] << 8) | chars[:, 1]
+
+    # Clearing bit 0x20 of each byte upper-cases ASCII letters and maps nothing else onto A-Z
+    folded = (codes & 0xDFDF).astype(np.uint16)
+
+    return (np.char.str_len(text) == 2) & (chars < 128).all(axis=1) & np.isin(folded, _VALID_STATES_U16)
+
+def _range_violation_codes_numpy(values: np.ndarray, lower: float, upper: float) -> np.ndarray:
+    """Classify values as in range (0), below the minimum (1) or above the maximum (2); NaN counts as in range"""
+    codes = np.zeros(len(values), dtype=np.int8)
+    codes[values > upper] = 2
+    codes[values < lower] = 1
+    return codes
+
+if NUMBA_AVAILABLE:
+    # Released GIL instead of prange: rules already run concurrently from a thread pool, and
+    # Numba's default workqueue threading layer must not be entered from several threads at once
+    @njit(cache=True, nogil=True)
+    def _range_violation_codes(values, lower, upper):
+        """JIT-compiled equivalent of _range_violation_codes_numpy"""
+        codes = np.zeros(values.shape[0], dtype=np.int8)
+        for i in range(values.shape[0]):
+            if values[i] < lower:
+                codes[i] = 1
+            elif values[i] > upper:
+                codes[i] = 2
+        return codes
+else:
+    _range_violation_codes = _range_violation_codes_numpy
+
+class _RecordView(Mapping):
+    """Read-only mapping over one row of pre-extracted column arrays, avoiding a dict per record"""
+    __slots__ = ('_columns', '_idx')
+
+    def __init__(self, columns: Dict[str, np.ndarray], idx: int):
+        self._columns = columns
+        self._idx = idx
+
+    def __getitem__(self, key: str) -> Any:
+        return self._columns[key][self._idx]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._columns)
+
+    def __len__(self) -> int:
+        return len(self._columns)
+
+@dataclass(**_DATACLASS_SLOTS)
 class ValidationRule:
     """Defines a validation rule for data quality checks"""
     name: str
@@ -37,7 +197,36 @@ class ValidationRule:
     severity: str = 'error'  # 'error', 'warning', 'info'
     enabled: bool = True
 
-@dataclass
+    # Typed views of the hot parameters, resolved once so rule checks skip dict lookups
+    required: bool = field(init=False, repr=False, compare=False)
+    min_val: Optional[float] = field(init=False, repr=False, compare=False)
+    max_val: Optional[float] = field(init=False, repr=False, compare=False)
+    compiled_pattern: Optional[re.Pattern] = field(init=False, repr=False, compare=False)
+    valid_set: Optional[frozenset] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        params = self.parameters
+        self.required = bool(params.get("required", False))
+        self.min_val = float(params["min"]) if "min" in params else None
+        self.max_val = float(params["max"]) if "max" in params else None
+
+        pattern = params.get("pattern")
+        if pattern is None:
+            self.compiled_pattern = None
+        elif pattern == _ZIP_PATTERN.pattern:
+            self.compiled_pattern = _ZIP_PATTERN
+        else:
+            self.compiled_pattern = re.compile(pattern)
+
+        valid_values = params.get("valid_values")
+        if valid_values is None:
+            self.valid_set = None
+        elif self.field == "location_state":
+            self.valid_set = _VALID_STATES_SET
+        else:
+            self.valid_set = frozenset(str(v).upper() for v in valid_values)
+
+@dataclass(**_DATACLASS_SLOTS)
 class ValidationResult:
     """Result of a validation check"""
     rule_name: str
@@ -49,11 +238,172 @@ class ValidationResult:
     expected_value: Any = None
     record_id: Optional[str] = None
 
+# Fields of each ValidationResult included in report details, read with a single attrgetter call
+_DETAIL_KEYS = ('rule_name', 'field', 'is_valid', 'severity', 'message', 'record_id')
+_detail_values = operator.attrgetter(*_DETAIL_KEYS)
+
+def _object_array(items: List[Any]) -> np.ndarray:
+    """Build a 1-D object array without NumPy unpacking nested sequences"""
+    array = np.empty(len(items), dtype=object)
+    for i, item in enumerate(items):
+        array[i] = item
+    return array
+
+class ValidationBuffer(Sequence):
+    """
+    Columnar store of validation results
+
+    Results sharing a rule, message and expected value are stored as one group, so each
+    result costs only an entry in a few parallel NumPy arrays. ValidationResult objects
+    are built on demand when the buffer is indexed or iterated.
+    """
+
+    def __init__(self):
+        # Per-group attributes: (rule_name, field, is_valid, severity, message, expected_value)
+        self._groups: List[Tuple[str, str, bool, str, str, Any]] = []
+        self._group_severity_codes: List[int] = []
+
+        # Per-result columns, kept as chunks until the buffer is read
+        self._position_chunks: List[np.ndarray] = []
+        self._group_id_chunks: List[np.ndarray] = []
+        self._record_id_chunks: List[np.ndarray] = []
+        self._actual_value_chunks: List[np.ndarray] = []
+
+        self._positions = np.empty(0, dtype=np.int64)
+        self._group_ids = np.empty(0, dtype=np.int32)
+        self._record_ids = np.empty(0, dtype=object)
+        self._actual_values = np.empty(0, dtype=object)
+
+    def add_group(self, rule_name: str, field: str, severity: str, message: str, positions: np.ndarray,
+                  record_ids: np.ndarray, actual_values: np.ndarray, expected_value: Any = None, is_valid: bool = False):
+        """
+        Add results that share everything except the record they belong to
+
+        Args:
+            positions: Row position of each result, used to order results by record
+            record_ids: Record identifier of each result
+            actual_values: Offending value of each result
+        """
+        if len(positions) == 0:
+            return
+
+        group_id = len(self._groups)
+        self._groups.append((rule_name, field, is_valid, severity, message, expected_value))
+        self._group_severity_codes.append(
+            _SEVERITY_VALID if is_valid else _SEVERITY_CODES.get(severity, _SEVERITY_OTHER)
+        )
+
+        self._position_chunks.append(np.asarray(positions, dtype=np.int64))
+        self._group_id_chunks.append(np.full(len(positions), group_id, dtype=np.int32))
+        self._record_id_chunks.append(np.asarray(record_ids, dtype=object))
+        self._actual_value_chunks.append(np.asarray(actual_values).astype(object))
+
+    def add_results(self, positions: List[int], results: List[ValidationResult]):
+        """Add individually built ValidationResult objects, one group per result"""
+        if not results:
+            return
+
+        first_group = len(self._groups)
+        for result in results:
+            self._groups.append((result.rule_name, result.field, result.is_valid, result.severity,
+                                 result.message, result.expected_value))
+            self._group_severity_codes.append(
+                _SEVERITY_VALID if result.is_valid else _SEVERITY_CODES.get(result.severity, _SEVERITY_OTHER)
+            )
+
+        self._position_chunks.append(np.asarray(positions, dtype=np.int64))
+        self._group_id_chunks.append(np.arange(first_group, len(self._groups), dtype=np.int32))
+        self._record_id_chunks.append(_object_array([result.record_id for result in results]))
+        self._actual_value_chunks.append(_object_array([result.actual_value for result in results]))
+
+    def _consolidate(self):
+        """Merge pending chunks into the per-result columns, ordered by record position"""
+        if not self._position_chunks:
+            return
+
+        positions = np.concatenate([self._positions] + self._position_chunks)
+        # Stable sort keeps insertion (rule) order within each record
+        order = np.argsort(positions, kind='stable')
+
+        self._positions = positions[order]
+        self._group_ids = np.concatenate([self._group_ids] + self._group_id_chunks)[order]
+        self._record_ids = np.concatenate([self._record_ids] + self._record_id_chunks)[order]
+        self._actual_values = np.concatenate([self._actual_values] + self._actual_value_chunks)[order]
+
+        self._position_chunks = []
+        self._group_id_chunks = []
+        self._record_id_chunks = []
+        self._actual_value_chunks = []
+
+    @property
+    def record_ids(self) -> np.ndarray:
+        """Record identifier of each result"""
+        self._consolidate()
+        return self._record_ids
+
+    @property
+    def severity_codes(self) -> np.ndarray:
+        """Severity code of each result (_SEVERITY_VALID for valid results)"""
+        self._consolidate()
+        return np.array(self._group_severity_codes, dtype=np.int8)[self._group_ids]
+
+    def count_by_field(self, mask: np.ndarray) -> Dict[str, int]:
+        """Count the results selected by a boolean mask per field"""
+        return self._count_by_group_label([group[1] for group in self._groups], mask)
+
+    def count_by_error_type(self, mask: np.ndarray) -> Dict[str, int]:
+        """Count the results selected by a boolean mask per '<severity>_<rule_name>' key"""
+        return self._count_by_group_label([f"{group[3]}_{group[0]}" for group in self._groups], mask)
+
+    def _count_by_group_label(self, labels: List[str], mask: np.ndarray) -> Dict[str, int]:
+        """Map each group to a label and count the selected results per label, in order of first occurrence"""
+        self._consolidate()
+
+        label_codes = {}
+        group_label_codes = np.array([label_codes.setdefault(label, len(label_codes)) for label in labels], dtype=np.intp)
+        codes, first_seen, counts = np.unique(group_label_codes[self._group_ids[mask]], return_index=True, return_counts=True)
+
+        label_names = list(label_codes)
+        order = np.argsort(first_seen)
+        return {label_names[codes[i]]: int(counts[i]) for i in order}
+
+    def _materialize(self, i: int) -> ValidationResult:
+        rule_name, field, is_valid, severity, message, expected_value = self._groups[self._group_ids[i]]
+        return ValidationResult(
+            rule_name=rule_name,
+            field=field,
+            is_valid=is_valid,
+            severity=severity,
+            message=message,
+            actual_value=self._actual_values[i],
+            expected_value=expected_value,
+            record_id=self._record_ids[i]
+        )
+
+    def __len__(self) -> int:
+        self._consolidate()
+        return len(self._group_ids)
+
+    def __getitem__(self, index):
+        self._consolidate()
+        if isinstance(index, slice):
+            return [self._materialize(i) for i in range(*index.indices(len(self._group_ids)))]
+        if index < 0:
+            index += len(self._group_ids)
+        if not 0 <= index < len(self._group_ids):
+            raise IndexError("ValidationBuffer index out of range")
+        return self._materialize(index)
+
+    def __iter__(self) -> Iterator[ValidationResult]:
+        self._consolidate()
+        for i in range(len(self._group_ids)):
+            yield self._materialize(i)
+
 @dataclass
 class QualityReport:
     """Comprehensive quality assessment report"""
     total_records: int
-    validation_results: List[ValidationResult]
+    validation_results: Sequence[ValidationResult]  # ValidationBuffer when produced by analyze_dataset_quality
     quality_score: float
     completeness_score: float
     accuracy_score: float
@@ -72,144 +422,167 @@ class QualityReport:
 
     generated_at: datetime = field(default_factory=datetime.now)
 
+# Restaurant data validation rules, built once so engines reuse the compiled patterns and value sets
+_DEFAULT_RULES: Tuple[ValidationRule, ...] = (
+    # Completeness rules
+    ValidationRule(
+        name="required_location_name",
+        description="Location name is required",
+        field="location_name",
+        rule_type="completeness",
+        parameters={"required": True},
+        severity="error"
+    ),
+    ValidationRule(
+        name="required_address",
+        description="Address information is required",
+        field="location_address",
+        rule_type="completeness",
+        parameters={"required": True},
+        severity="error"
+    ),
+    ValidationRule(
+        name="required_receipts",
+        description="Receipt data should be present",
+        field="total_receipts",
+        rule_type="completeness",
+        parameters={"required": True},
+        severity="warning"
+    ),
+
+    # Format validation rules
+    ValidationRule(
+        name="valid_zip_format",
+        description="ZIP code must be 5 digits",
+        field="location_zip",
+        rule_type="format",
+        parameters={"pattern": r"^\d{5}(-\d{4})?$"},
+        severity="error"
+    ),
+    ValidationRule(
+        name="valid_state_format",
+        description="State must be valid two-letter code",
+        field="location_state",
+        rule_type="format",
+        parameters={"valid_values": ["AL", "AK", "AZ", "AR", "CA", "CO", "CT", "DE", "FL", "GA",
+                                   "HI", "ID", "IL", "IN", "IA", "KS", "KY", "LA", "ME", "MD",
+                                   "MA", "MI", "MN", "MS", "MO", "MT", "NE", "NV", "NH", "NJ",
+                                   "NM", "NY", "NC", "ND", "OH", "OK", "OR", "PA", "RI", "SC",
+                                   "SD", "TN", "TX", "UT", "VT", "VA", "WA", "WV", "WI", "WY"]},
+        severity="error"
+    ),
+
+    # Range validation rules
+    ValidationRule(
+        name="reasonable_receipts",
+        description="Total receipts should be reasonable for a restaurant",
+        field="total_receipts",
+        rule_type="range",
+        parameters={"min": 0, "max": 10000000},  # Max $10M annual
+        severity="warning"
+    ),
+    ValidationRule(
+        name="valid_latitude",
+        description="Latitude must be valid",
+        field="latitude",
+        rule_type="range",
+        parameters={"min": -90, "max": 90},
+        severity="error"
+    ),
+    ValidationRule(
+        name="valid_longitude",
+        description="Longitude must be valid",
+        field="longitude",
+        rule_type="range",
+        parameters={"min": -180, "max": 180},
+        severity="error"
+    ),
+
+    # Consistency rules
+    ValidationRule(
+        name="address_city_consistency",
+        description="City should be consistent in address",
+        field="location_address",
+        rule_type="consistency",
+        parameters={"reference_field": "location_city"},
+        severity="warning"
+    ),
+
+    # Concept classification rules
+    ValidationRule(
+        name="concept_confidence_threshold",
+        description="Concept classification confidence should meet threshold",
+        field="concept_confidence",
+        rule_type="range",
+        parameters={"min": 0.3},
+        severity="warning"
+    ),
+
+    # Population data rules
+    ValidationRule(
+        name="reasonable_population",
+        description="Population within 1 mile should be reasonable",
+        field="population_1_mile",
+        rule_type="range",
+        parameters={"min": 0, "max": 100000},
+        severity="warning"
+    ),
+
+    # Square footage rules
+    ValidationRule(
+        name="reasonable_square_footage",
+        description="Square footage should be reasonable for restaurant",
+        field="square_footage",
+        rule_type="range",
+        parameters={"min": 100, "max": 50000},
+        severity="warning"
+    ),
+)
+
 class ValidationEngine:
     """Core validation engine for data quality assessment"""
 
     def __init__(self):
         self.validation_rules = []
+        self._rule_index_key = None
+        self._required_positions: List[int] = []
+        self._optional_positions_by_field: Dict[str, List[int]] = {}
         self._initialize_default_rules()
 
     def _initialize_default_rules(self):
         """Initialize default validation rules for restaurant data"""
-
-        # Restaurant data validation rules
-        self.validation_rules = [
-            # Completeness rules
-            ValidationRule(
-                name="required_location_name",
-                description="Location name is required",
-                field="location_name",
-                rule_type="completeness",
-                parameters={"required": True},
-                severity="error"
-            ),
-            ValidationRule(
-                name="required_address",
-                description="Address information is required",
-                field="location_address",
-                rule_type="completeness",
-                parameters={"required": True},
-                severity="error"
-            ),
-            ValidationRule(
-                name="required_receipts",
-                description="Receipt data should be present",
-                field="total_receipts",
-                rule_type="completeness",
-                parameters={"required": True},
-                severity="warning"
-            ),
-
-            # Format validation rules
-            ValidationRule(
-                name="valid_zip_format",
-                description="ZIP code must be 5 digits",
-                field="location_zip",
-                rule_type="format",
-                parameters={"pattern": r"^\d{5}(-\d{4})?$"},
-                severity="error"
-            ),
-            ValidationRule(
-                name="valid_state_format",
-                description="State must be valid two-letter code",
-                field="location_state",
-                rule_type="format",
-                parameters={"valid_values": ["AL", "AK", "AZ", "AR", "CA", "CO", "CT", "DE", "FL", "GA",
-                                           "HI", "ID", "IL", "IN", "IA", "KS", "KY", "LA", "ME", "MD",
-                                           "MA", "MI", "MN", "MS", "MO", "MT", "NE", "NV", "NH", "NJ",
-                                           "NM", "NY", "NC", "ND", "OH", "OK", "OR", "PA", "RI", "SC",
-                                           "SD", "TN", "TX", "UT", "VT", "VA", "WA", "WV", "WI", "WY"]},
-                severity="error"
-            ),
-
-            # Range validation rules
-            ValidationRule(
-                name="reasonable_receipts",
-                description="Total receipts should be reasonable for a restaurant",
-                field="total_receipts",
-                rule_type="range",
-                parameters={"min": 0, "max": 10000000},  # Max $10M annual
-                severity="warning"
-            ),
-            ValidationRule(
-                name="valid_latitude",
-                description="Latitude must be valid",
-                field="latitude",
-                rule_type="range",
-                parameters={"min": -90, "max": 90},
-                severity="error"
-            ),
-            ValidationRule(
-                name="valid_longitude",
-                description="Longitude must be valid",
-                field="longitude",
-                rule_type="range",
-                parameters={"min": -180, "max": 180},
-                severity="error"
-            ),
-
-            # Consistency rules
-            ValidationRule(
-                name="address_city_consistency",
-                description="City should be consistent in address",
-                field="location_address",
-                rule_type="consistency",
-                parameters={"reference_field": "location_city"},
-                severity="warning"
-            ),
-
-            # Concept classification rules
-            ValidationRule(
-                name="concept_confidence_threshold",
-                description="Concept classification confidence should meet threshold",
-                field="concept_confidence",
-                rule_type="range",
-                parameters={"min": 0.3},
-                severity="warning"
-            ),
-
-            # Population data rules
-            ValidationRule(
-                name="reasonable_population",
-                description="Population within 1 mile should be reasonable",
-                field="population_1_mile",
-                rule_type="range",
-                parameters={"min": 0, "max": 100000},
-                severity="warning"
-            ),
-
-            # Square footage rules
-            ValidationRule(
-                name="reasonable_square_footage",
-                description="Square footage should be reasonable for restaurant",
-                field="square_footage",
-                rule_type="range",
-                parameters={"min": 100, "max": 50000},
-                severity="warning"
-            )
-        ]
+        # Shallow copies share the pre-compiled patterns and value sets but keep enabled flags per engine
+        self.validation_rules = [copy.copy(rule) for rule in _DEFAULT_RULES]
 
     def add_validation_rule(self, rule: ValidationRule):
         """Add a custom validation rule"""
         self.validation_rules.append(rule)
         logger.info(f"Added validation rule: {rule.name}")
 
-    def validate_record(self, record: Dict[str, Any], record_id: Optional[str] = None) -> List[ValidationResult]:
+    def _index_rules(self):
+        """Bucket rule positions into always-run required rules and optional rules by field
+
+        Rebuilt whenever validation_rules is replaced or grows, including direct appends.
+        """
+        key = (id(self.validation_rules), len(self.validation_rules))
+        if key == self._rule_index_key:
+            return
+
+        self._required_positions = []
+        self._optional_positions_by_field = {}
+        for position, rule in enumerate(self.validation_rules):
+            if rule.rule_type == "completeness" and rule.required:
+                self._required_positions.append(position)
+            else:
+                self._optional_positions_by_field.setdefault(rule.field, []).append(position)
+        self._rule_index_key = key
+
+    def validate_record(self, record: Union[Mapping[str, Any], pd.Series], record_id: Optional[str] = None) -> List[ValidationResult]:
         """
         Validate a single record against all rules
 
         Args:
-            record: Dictionary containing record data
+            record: Dictionary (or any mapping, including a DataFrame row Series) containing record data
             record_id: Optional record identifier
 
         Returns:
@@ -217,34 +590,203 @@ class ValidationEngine:
         """
         results = []
 
-        for rule in self.validation_rules:
+        # Optional rules skip unpopulated fields, so only look up the rules of populated fields, then
+        # restore definition order
+        self._index_rules()
+        positions = list(self._required_positions)
+        for field_name, field_positions in self._optional_positions_by_field.items():
+            if not _is_unpopulated(record.get(field_name)):
+                positions.extend(field_positions)
+        positions.sort()
+
+        for position in positions:
+            rule = self.validation_rules[position]
             if not rule.enabled:
                 continue
 
+            result = self._apply_rule_safely(rule, record, record_id)
+            if result:
+                results.append(result)
+
+        return results
+
+    def validate_dataframe(self, df: pd.DataFrame, numeric_cache: Optional[Dict[str, np.ndarray]] = None) -> ValidationBuffer:
+        """
+        Validate every record of a DataFrame, evaluating each rule column-wise
+
+        Args:
+            df: DataFrame containing one record per row
+            numeric_cache: Optional pre-parsed float64 arrays by field, reused by range rules
+
+        Returns:
+            ValidationBuffer of results ordered by record
+        """
+        buffer = ValidationBuffer()
+        if df.empty:
+            return buffer
+
+        if 'id' in df.columns:
+            record_ids = df['id'].astype(str).to_numpy()
+        else:
+            record_ids = np.array([f'record_{idx}' for idx in range(len(df))], dtype=object)
+
+        rules = [rule for rule in self.validation_rules if rule.enabled]
+
+        # Rule kernels are independent NumPy/pandas operations, so evaluate them concurrently
+        with ThreadPoolExecutor(max_workers=max(1, min(len(rules), os.cpu_count() or 1))) as executor:
+            futures = [executor.submit(self._apply_rule_to_dataframe, rule, df, numeric_cache) for rule in rules]
+
+        columns = None  # Column arrays, only extracted for rules without a column-wise kernel
+
+        # Materialize results serially, in rule order
+        for rule, future in zip(rules, futures):
             try:
-                result = self._apply_rule(rule, record, record_id)
-                if result:
-                    results.append(result)
+                hit_groups = future.result()
             except Exception as e:
-                logger.error(f"Error applying rule {rule.name}: {e}")
-                results.append(ValidationResult(
-                    rule_name=rule.name,
-                    field=rule.field,
-                    is_valid=False,
-                    severity="error",
-                    message=f"Rule application error: {e}",
-                    record_id=record_id
-                ))
+                logger.debug(f"Column-wise evaluation of rule {rule.name} failed, validating per record: {e}")
+                hit_groups = None
+
+            if hit_groups is None:
+                if columns is None:
+                    columns = {column: _column_values(df[column]) for column in df.columns}
+                positions = []
+                results = []
+                for idx in range(len(df)):
+                    result = self._apply_rule_safely(rule, _RecordView(columns, idx), record_ids[idx])
+                    if result:
+                        positions.append(idx)
+                        results.append(result)
+                buffer.add_results(positions, results)
+                continue
 
-        return results
+            for indices, actual_values, message, expected_value in hit_groups:
+                buffer.add_group(rule.name, rule.field, rule.severity, message,
+                                 indices, record_ids[indices], actual_values, expected_value)
+
+        return buffer
+
+    def _apply_rule_safely(self, rule: ValidationRule, record: Mapping[str, Any], record_id: Optional[str]) -> Optional[ValidationResult]:
+        """Apply a single rule to a record, turning rule failures into error results"""
+        try:
+            return self._apply_rule(rule, record, record_id)
+        except Exception as e:
+            logger.error(f"Error applying rule {rule.name}: {e}")
+            return ValidationResult(
+                rule_name=rule.name,
+                field=rule.field,
+                is_valid=False,
+                severity="error",
+                message=f"Rule application error: {e}",
+                record_id=record_id
+            )
+
+    def _apply_rule_to_dataframe(self, rule: ValidationRule, df: pd.DataFrame,
+                                 numeric_cache: Optional[Dict[str, np.ndarray]] = None) -> Optional[List[Tuple[np.ndarray, np.ndarray, str, Any]]]:
+        """
+        Apply a single rule to every record of a DataFrame at once
+
+        Returns:
+            (row positions, actual values, message, expected value) groups of failing
+            records, or None when the rule type has no column-wise implementation
+        """
+        if rule.field in df.columns:
+            values = _column_values(df[rule.field])
+        else:
+            values = np.full(len(df), None, dtype=object)
+        missing = _missing_mask(values)
+
+        if rule.rule_type == "completeness":
+            if rule.required:
+                indices = np.flatnonzero(missing)
+                return [(indices, values[indices], rule.description, None)]
+            return []
+
+        if rule.rule_type == "format":
+            return self._validate_format_column(rule, values, ~missing)
+        elif rule.rule_type == "range":
+            numeric = numeric_cache.get(rule.field) if numeric_cache else None
+            if numeric is None:
+                numeric = _to_float_array(pd.Series(values))
+            return self._validate_range_column(rule, values, numeric, ~missing)
+        elif rule.rule_type in ("consistency", "custom"):
+            return None
+
+        return []
+
+    def _validate_format_column(self, rule: ValidationRule, values: np.ndarray, present: np.ndarray) -> List[Tuple[np.ndarray, np.ndarray, str, Any]]:
+        """Column-wise equivalent of _validate_format"""
+        hit_groups = []
+        candidates = present
+
+        if rule.compiled_pattern is not None:
+            pattern = rule.parameters["pattern"]
+            text = pd.Series(values[candidates], dtype=object).astype(str)
+            matched = np.zeros(len(values), dtype=bool)
+            matched[candidates] = text.str.match(rule.compiled_pattern).to_numpy(dtype=bool)
+
+            indices = np.flatnonzero(candidates & ~matched)
+            hit_groups.append((indices, values[indices], f"Format validation failed for pattern: {pattern}", None))
+            candidates = candidates & matched
+
+        if rule.valid_set is not None:
+            valid_values = rule.parameters["valid_values"]
+            in_set = np.zeros(len(values), dtype=bool)
+            if rule.valid_set is _VALID_STATES_SET:
+                in_set[candidates] = _valid_state_mask(values[candidates])
+            else:
+                in_set[candidates] = np.isin(np.char.upper(values[candidates].astype(str)), list(rule.valid_set))
 
-    def _apply_rule(self, rule: ValidationRule, record: Dict[str, Any], record_id: Optional[str]) -> Optional[ValidationResult]:
+            indices = np.flatnonzero(candidates & ~in_set)
+            hit_groups.append((indices, values[indices], f"Value not in valid set: {valid_values}", valid_values))
+
+        return hit_groups
+
+    def _validate_range_column(self, rule: ValidationRule, values: np.ndarray, numeric: np.ndarray,
+                               present: np.ndarray) -> List[Tuple[np.ndarray, np.ndarray, str, Any]]:
+        """Column-wise equivalent of _validate_range, given the column already coerced to float64"""
+        hit_groups = []
+
+        # pd.to_numeric coerces some strings float() accepts (e.g. 'nan', '1_000') to NaN, so re-parse
+        # those cells the way _validate_range does before reporting them as not numeric
+        not_numeric = np.zeros(len(values), dtype=bool)
+        unparsed = np.flatnonzero(present & np.isnan(numeric) & pd.notna(values))
+        if len(unparsed):
+            numeric = numeric.copy()  # May be a shared numeric cache entry
+            for i in unparsed:
+                try:
+                    numeric[i] = float(values[i])
+                except (ValueError, TypeError):
+                    not_numeric[i] = True
+        checked = present & ~not_numeric
+
+        codes = _range_violation_codes(
+            numeric,
+            -np.inf if rule.min_val is None else rule.min_val,
+            np.inf if rule.max_val is None else rule.max_val
+        )
+
+        if rule.min_val is not None:
+            indices = np.flatnonzero(checked & (codes == 1))
+            hit_groups.append((indices, values[indices], f"Value below minimum: {rule.parameters['min']}",
+                               f">={rule.parameters['min']}"))
+
+        if rule.max_val is not None:
+            indices = np.flatnonzero(checked & (codes == 2))
+            hit_groups.append((indices, values[indices], f"Value above maximum: {rule.parameters['max']}",
+                               f"<={rule.parameters['max']}"))
+
+        indices = np.flatnonzero(not_numeric)
+        hit_groups.append((indices, values[indices], "Value is not numeric", None))
+
+        return hit_groups
+
+    def _apply_rule(self, rule: ValidationRule, record: Mapping[str, Any], record_id: Optional[str]) -> Optional[ValidationResult]:
         """Apply a single validation rule to a record"""
         field_value = record.get(rule.field)
 
         # Skip if field is missing and not required
-        if field_value is None or field_value == '':
-            if rule.rule_type == "completeness" and rule.parameters.get("required", False):
+        if _is_unpopulated(field_value):
+            if rule.rule_type == "completeness" and rule.required:
                 return ValidationResult(
                     rule_name=rule.name,
                     field=rule.field,
@@ -273,15 +815,9 @@ class ValidationEngine:
 
     def _validate_format(self, rule: ValidationRule, value: Any, record_id: Optional[str]) -> Optional[ValidationResult]:
         """Validate field format"""
-        if "pattern" in rule.parameters:
+        if rule.compiled_pattern is not None:
             pattern = rule.parameters["pattern"]
-            # Use pre-compiled pattern if available
-            if pattern == r"^\d{5}(-\d{4})?$":
-                compiled_pattern = _ZIP_PATTERN
-            else:
-                compiled_pattern = re.compile(pattern)
-            
-            if not compiled_pattern.match(str(value)):
+            if not rule.compiled_pattern.match(str(value)):
                 return ValidationResult(
                     rule_name=rule.name,
                     field=rule.field,
@@ -292,15 +828,9 @@ class ValidationEngine:
                     record_id=record_id
                 )
 
-        if "valid_values" in rule.parameters:
+        if rule.valid_set is not None:
             valid_values = rule.parameters["valid_values"]
-            # Use frozenset for O(1) lookup instead of list comprehension
-            if rule.field == "location_state":
-                valid_set = _VALID_STATES_SET
-            else:
-                valid_set = frozenset(str(v).upper() for v in valid_values)
-            
-            if str(value).upper() not in valid_set:
+            if str(value).upper() not in rule.valid_set:
                 return ValidationResult(
                     rule_name=rule.name,
                     field=rule.field,
@@ -319,7 +849,7 @@ class ValidationEngine:
         try:
             numeric_value = float(value)
 
-            if "min" in rule.parameters and numeric_value < rule.parameters["min"]:
+            if rule.min_val is not None and numeric_value < rule.min_val:
                 return ValidationResult(
                     rule_name=rule.name,
                     field=rule.field,
@@ -331,7 +861,7 @@ class ValidationEngine:
                     record_id=record_id
                 )
 
-            if "max" in rule.parameters and numeric_value > rule.parameters["max"]:
+            if rule.max_val is not None and numeric_value > rule.max_val:
                 return ValidationResult(
                     rule_name=rule.name,
                     field=rule.field,
@@ -358,7 +888,7 @@ class ValidationEngine:
 
     def _validate_completeness(self, rule: ValidationRule, value: Any, record_id: Optional[str]) -> Optional[ValidationResult]:
         """Validate field completeness"""
-        if rule.parameters.get("required", False) and (value is None or value == ''):
+        if rule.required and (value is None or value == ''):
             return ValidationResult(
                 rule_name=rule.name,
                 field=rule.field,
@@ -371,7 +901,7 @@ class ValidationEngine:
 
         return None
 
-    def _validate_consistency(self, rule: ValidationRule, record: Dict[str, Any], record_id: Optional[str]) -> Optional[ValidationResult]:
+    def _validate_consistency(self, rule: ValidationRule, record: Mapping[str, Any], record_id: Optional[str]) -> Optional[ValidationResult]:
         """Validate field consistency with other fields"""
         if "reference_field" in rule.parameters:
             ref_field = rule.parameters["reference_field"]
@@ -393,7 +923,7 @@ class ValidationEngine:
 
         return None
 
-    def _validate_custom(self, rule: ValidationRule, value: Any, record: Dict[str, Any], record_id: Optional[str]) -> Optional[ValidationResult]:
+    def _validate_custom(self, rule: ValidationRule, value: Any, record: Mapping[str, Any], record_id: Optional[str]) -> Optional[ValidationResult]:
         """Apply custom validation logic"""
         # Placeholder for custom validation functions
         # Could be extended with user-defined validation functions
@@ -402,6 +932,9 @@ class ValidationEngine:
 class DataQualityAnalyzer:
     """Advanced data quality analysis and anomaly detection"""
 
+    # Numeric fields scanned for statistical outliers
+    OUTLIER_FIELDS = ('total_receipts', 'latitude', 'longitude', 'population_1_mile', 'square_footage')
+
     def __init__(self):
         self.validation_engine = ValidationEngine()
 
@@ -417,48 +950,32 @@ class DataQualityAnalyzer:
         """
         logger.info(f"Starting quality analysis for dataset with {len(df)} records")
 
-        all_results = []
         total_records = len(df)
 
-        # Validate each record
-        for idx, (_, record) in enumerate(df.iterrows()):
-            record_id = str(record.get('id', f'record_{idx}'))
-            record_dict = record.to_dict()
+        # Parse each numeric column once, shared by the range rules and outlier detection
+        numeric_cache = self._build_numeric_cache(df)
+
+        # Validate all records, one column-wise pass per rule
+        all_results = self.validation_engine.validate_dataframe(df, numeric_cache=numeric_cache)
 
-            results = self.validation_engine.validate_record(record_dict, record_id)
-            all_results.extend(results)
+        # Tally issues with NumPy reductions over the per-result severity codes
+        severity_codes = all_results.severity_codes
+        is_error = severity_codes == _SEVERITY_CODES['error']
+        is_issue = severity_codes != _SEVERITY_VALID
+
+        errors_by_field = all_results.count_by_field(is_error)
+        warnings_by_field = all_results.count_by_field(is_issue & ~is_error)
+        errors_by_type = all_results.count_by_error_type(is_issue)
 
         # Calculate quality scores
-        quality_score = self._calculate_overall_quality_score(all_results, total_records)
+        quality_score = self._calculate_overall_quality_score(severity_codes, total_records)
         completeness_score = self._calculate_completeness_score(df)
-        accuracy_score = self._calculate_accuracy_score(all_results)
+        accuracy_score = self._calculate_accuracy_score(severity_codes)
         consistency_score = self._calculate_consistency_score(df)
         timeliness_score = self._calculate_timeliness_score(df)
 
-        # Analyze issues using defaultdict for cleaner code
-        errors_by_field = defaultdict(int)
-        warnings_by_field = defaultdict(int)
-        errors_by_type = defaultdict(int)
-
-        for result in all_results:
-            if not result.is_valid:
-                # Count by field
-                if result.severity == 'error':
-                    errors_by_field[result.field] += 1
-                else:
-                    warnings_by_field[result.field] += 1
-
-                # Count by type
-                error_type = f"{result.severity}_{result.rule_name}"
-                errors_by_type[error_type] += 1
-        
-        # Convert back to regular dicts for consistency
-        errors_by_field = dict(errors_by_field)
-        warnings_by_field = dict(warnings_by_field)
-        errors_by_type = dict(errors_by_type)
-
         # Detect outliers and duplicates
-        outlier_records = self._detect_outliers(df)
+        outlier_records = self._detect_outliers(df, numeric_cache=numeric_cache)
         duplicate_records = self._detect_duplicates(df)
         missing_data_patterns = self._analyze_missing_data_patterns(df)
 
@@ -478,14 +995,21 @@ class DataQualityAnalyzer:
             missing_data_patterns=missing_data_patterns
         )
 
-    def _calculate_overall_quality_score(self, validation_results: List[ValidationResult], total_records: int) -> float:
-        """Calculate overall quality score"""
+    def _build_numeric_cache(self, df: pd.DataFrame) -> Dict[str, np.ndarray]:
+        """Coerce every numeric field used by range rules or outlier detection to float64 once"""
+        fields = set(self.OUTLIER_FIELDS)
+        fields.update(rule.field for rule in self.validation_engine.validation_rules if rule.rule_type == "range")
+
+        return {field: _to_float_array(df[field]) for field in fields if field in df.columns}
+
+    def _calculate_overall_quality_score(self, severity_codes: np.ndarray, total_records: int) -> float:
+        """Calculate overall quality score from per-result severity codes"""
         if total_records == 0:
             return 1.0
 
         # Weight errors and warnings differently
-        error_count = sum(1 for r in validation_results if not r.is_valid and r.severity == 'error')
-        warning_count = sum(1 for r in validation_results if not r.is_valid and r.severity == 'warning')
+        error_count = int(np.count_nonzero(severity_codes == _SEVERITY_CODES['error']))
+        warning_count = int(np.count_nonzero(severity_codes == _SEVERITY_CODES['warning']))
 
         # Calculate weighted score
         total_issues = error_count * 1.0 + warning_count * 0.5
@@ -517,13 +1041,13 @@ class DataQualityAnalyzer:
 
         return round(sum(completeness_scores) / len(completeness_scores), 3) if completeness_scores else 1.0
 
-    def _calculate_accuracy_score(self, validation_results: List[ValidationResult]) -> float:
-        """Calculate data accuracy score based on validation results"""
-        if not validation_results:
+    def _calculate_accuracy_score(self, severity_codes: np.ndarray) -> float:
+        """Calculate data accuracy score based on per-result severity codes"""
+        if len(severity_codes) == 0:
             return 1.0
 
-        valid_results = sum(1 for r in validation_results if r.is_valid)
-        total_results = len(validation_results)
+        valid_results = int(np.count_nonzero(severity_codes == _SEVERITY_VALID))
+        total_results = len(severity_codes)
 
         return round(valid_results / total_results, 3) if total_results > 0 else 1.0
 
@@ -536,15 +1060,14 @@ class DataQualityAnalyzer:
 
         # Check address consistency (city in address)
         if 'location_address' in df.columns and 'location_city' in df.columns:
-            city_in_address = df.apply(
-                lambda row: str(row.get('location_city', '')).lower() in str(row.get('location_address', '')).lower(),
-                axis=1
-            )
+            cities = _as_text(df['location_city']).str.lower().to_numpy(dtype=str)
+            addresses = _as_text(df['location_address']).str.lower().to_numpy(dtype=str)
+            city_in_address = np.char.find(addresses, cities) >= 0
             consistency_scores.append(city_in_address.sum() / len(df))
 
         # Check state format consistency
         if 'location_state' in df.columns:
-            valid_states = df['location_state'].astype(str).str.len() == 2
+            valid_states = _as_text(df['location_state']).str.len() == 2
             consistency_scores.append(valid_states.sum() / len(df))
 
         return round(sum(consistency_scores) / len(consistency_scores), 3) if consistency_scores else 1.0
@@ -555,43 +1078,49 @@ class DataQualityAnalyzer:
         # In production, this would check data freshness against collection dates
         return 1.0
 
-    def _detect_outliers(self, df: pd.DataFrame) -> List[str]:
-        """Detect outlier records using statistical methods"""
-        outlier_record_ids = []
-
+    def _detect_outliers(self, df: pd.DataFrame, numeric_cache: Optional[Dict[str, np.ndarray]] = None) -> List[str]:
+        """Detect outlier records using statistical methods, reusing any pre-parsed float64 columns"""
         # Outlier detection for numeric fields
-        numeric_fields = ['total_receipts', 'latitude', 'longitude', 'population_1_mile', 'square_footage']
+        numeric_fields = [field for field in self.OUTLIER_FIELDS if field in df.columns]
 
-        for field in numeric_fields:
-            if field in df.columns:
-                try:
-                    values = pd.to_numeric(df[field], errors='coerce')
-                    clean_values = values.dropna()
+        if not numeric_fields:
+            return []
+
+        try:
+            # Stack all numeric fields into a single (N, F) float matrix, reusing already parsed columns
+            values = np.column_stack([
+                numeric_cache[field] if numeric_cache and field in numeric_cache else _to_float_array(df[field])
+                for field in numeric_fields
+            ])
 
-                    if len(clean_values) > 10:  # Need sufficient data for outlier detection
-                        Q1 = clean_values.quantile(0.25)
-                        Q3 = clean_values.quantile(0.75)
-                        IQR = Q3 - Q1
+            # Need sufficient data for outlier detection
+            usable = np.count_nonzero(~np.isnan(values), axis=0) > 10
+            if not usable.any():
+                return []
+            values = values[:, usable]
 
-                        lower_bound = Q1 - 1.5 * IQR
-                        upper_bound = Q3 + 1.5 * IQR
+            q1, q3 = np.nanquantile(values, [0.25, 0.75], axis=0)
+            iqr = q3 - q1
 
-                        outliers = df[(values < lower_bound) | (values > upper_bound)]
-                        outlier_record_ids.extend(outliers['id'].astype(str).tolist())
+            # Broadcast the IQR bounds across every row and field at once
+            outlier_mask = (values < q1 - 1.5 * iqr) | (values > q3 + 1.5 * iqr)
 
-                except Exception as e:
-                    logger.warning(f"Error detecting outliers for field {field}: {e}")
+            return df.loc[outlier_mask.any(axis=1), 'id'].astype(str).unique().tolist()
 
-        return list(set(outlier_record_ids))  # Remove duplicates
+        except Exception as e:
+            logger.warning(f"Error detecting outliers: {e}")
+            return []
 
     def _detect_duplicates(self, df: pd.DataFrame) -> List[str]:
         """Detect duplicate records"""
         duplicate_ids = []
 
         try:
-            # Check for exact duplicates
-            duplicates = df[df.duplicated(subset=['location_name', 'location_address', 'location_city'], keep=False)]
-            duplicate_ids.extend(duplicates['id'].astype(str).tolist())
+            # Check for exact duplicates on a single uint64 row hash instead of tuples of three object columns
+            row_hashes = pd.util.hash_pandas_object(
+                df[['location_name', 'location_address', 'location_city']], index=False
+            )
+            duplicate_ids.extend(df.loc[row_hashes.duplicated(keep=False).to_numpy(), 'id'].astype(str).unique().tolist())
 
             # Check for similar names/addresses (fuzzy matching would be better here)
             # For now, just flag exact duplicates
@@ -599,24 +1128,36 @@ class DataQualityAnalyzer:
         except Exception as e:
             logger.warning(f"Error detecting duplicates: {e}")
 
-        return list(set(duplicate_ids))
+        return duplicate_ids
 
     def _analyze_missing_data_patterns(self, df: pd.DataFrame) -> Dict[str, List[str]]:
         """Analyze patterns in missing data"""
         patterns = {}
 
         try:
-            # Group by missing field combinations
-            missing_mask = df.isnull()
+            missing_mask = df.isnull().to_numpy()
 
             # Find records missing multiple fields
-            for idx, (_, row) in enumerate(missing_mask.iterrows()):
-                missing_fields = [col for col, missing in row.items() if missing]
-                if len(missing_fields) > 1:
-                    pattern_key = "_".join(sorted([str(field) for field in missing_fields]))
-                    if pattern_key not in patterns:
-                        patterns[pattern_key] = []
-                    patterns[pattern_key].append(str(df.iloc[idx]['id']))
+            multi_missing = missing_mask.sum(axis=1) > 1
+            if not multi_missing.any():
+                return patterns
+
+            # Pack each row's missing-column bitmap into a fixed-width bytes key
+            packed = np.packbits(missing_mask[multi_missing], axis=1)
+            row_keys = packed.view(np.dtype((np.void, packed.shape[1]))).ravel()
+            unique_keys, key_index = np.unique(row_keys, return_inverse=True)
+
+            # Group by missing field combinations
+            record_ids = df['id'].astype(str).to_numpy()[multi_missing]
+            grouped_ids = pd.Series(record_ids).groupby(key_index.ravel(), sort=False).agg(list)
+
+            columns = [str(col) for col in df.columns]
+            for key_idx, ids in grouped_ids.items():
+                bitmap = np.unpackbits(
+                    np.frombuffer(unique_keys[key_idx].tobytes(), dtype=np.uint8), count=len(columns)
+                ).astype(bool)
+                pattern_key = "_".join(sorted(col for col, missing in zip(columns, bitmap) if missing))
+                patterns[pattern_key] = ids
 
         except Exception as e:
             logger.warning(f"Error analyzing missing data patterns: {e}")
@@ -703,49 +1244,15 @@ class DataCleaner:
 
     def _standardize_street_suffix(self, address: str) -> str:
         """Standardize street name suffixes"""
-        suffix_map = {
-            'st': 'Street',
-            'st.': 'Street',
-            'street': 'Street',
-            'ave': 'Avenue',
-            'ave.': 'Avenue',
-            'avenue': 'Avenue',
-            'ave': 'Avenue',
-            'rd': 'Road',
-            'rd.': 'Road',
-            'road': 'Road',
-            'blvd': 'Boulevard',
-            'blvd.': 'Boulevard',
-            'boulevard': 'Boulevard',
-            'ln': 'Lane',
-            'ln.': 'Lane',
-            'lane': 'Lane',
-            'dr': 'Drive',
-            'dr.': 'Drive',
-            'drive': 'Drive',
-            'ct': 'Court',
-            'ct.': 'Court',
-            'court': 'Court',
-            'pl': 'Place',
-            'pl.': 'Place',
-            'place': 'Place',
-            'way': 'Way',
-            'cir': 'Circle',
-            'cir.': 'Circle',
-            'circle': 'Circle'
-        }
-
-        # Replace common abbreviations with full words
-        for abbr, full in suffix_map.items():
-            pattern = r'\b' + re.escape(abbr) + r'\b'
-            address = re.sub(pattern, full, address, flags=re.IGNORECASE)
-
-        return address
+        # Replace common abbreviations with full words in a single scan
+        return _STREET_SUFFIX_PATTERN.sub(lambda m: _STREET_SUFFIX_MAP[m.group(1).lower()], address)
 
     def _format_zip_code(self, zip_code: str) -> str:
         """Format ZIP code to standard format"""
-        # Remove non-digits
-        digits = re.sub(r'\D', '', zip_code)
+        # Remove non-digits, falling back to the regex for characters outside Latin-1
+        digits = zip_code.translate(_NON_DIGIT_TABLE)
+        if not digits.isdecimal():
+            digits = _NON_DIGIT_PATTERN.sub('', digits)
 
         if len(digits) == 9:
             return f"{digits[:5]}-{digits[5:]}"
@@ -780,16 +1287,24 @@ class DataCleaner:
 class ValidationReporter:
     """Generate comprehensive validation and quality reports"""
 
+    _ISSUE_DESCRIPTIONS = {
+        'validation_error': "{count} validation errors in {field}",
+        'outliers': "{count} records with outlier values",
+        'duplicates': "{count} potential duplicate records"
+    }
+
     def __init__(self):
         self.analyzer = DataQualityAnalyzer()
         self.cleaner = DataCleaner()
 
-    def generate_comprehensive_report(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def generate_comprehensive_report(self, df: pd.DataFrame, include_details: bool = True) -> Dict[str, Any]:
         """
         Generate a comprehensive data quality report
 
         Args:
             df: DataFrame to analyze
+            include_details: Include the per-result 'detailed_results' section. Callers that only
+                display the summary can skip it, since it holds one entry per validation result.
 
         Returns:
             Dictionary containing complete report
@@ -802,6 +1317,26 @@ class ValidationReporter:
         # Analyze quality
         quality_report = self.analyzer.analyze_dataset_quality(cleaned_df)
 
+        validation_results = quality_report.validation_results
+        details = None
+
+        if include_details:
+            # Project each result to its detail fields once, then build the details and issue counts from the tuples
+            rows = list(map(_detail_values, validation_results))
+            details = [dict(zip(_DETAIL_KEYS, row)) for row in rows]
+            issue_counts = Counter(severity for _, _, is_valid, severity, _, _ in rows if not is_valid)
+            error_count = issue_counts['error']
+            warning_count = issue_counts['warning']
+        elif isinstance(validation_results, ValidationBuffer):
+            # Count from the buffer's severity codes without building any ValidationResult
+            severity_codes = validation_results.severity_codes
+            error_count = int(np.count_nonzero(severity_codes == _SEVERITY_CODES['error']))
+            warning_count = int(np.count_nonzero(severity_codes == _SEVERITY_CODES['warning']))
+        else:
+            issue_counts = Counter(r.severity for r in validation_results if not r.is_valid)
+            error_count = issue_counts['error']
+            warning_count = issue_counts['warning']
+
         # Generate summary
         summary = {
             'report_generated_at': quality_report.generated_at.isoformat(),
@@ -815,75 +1350,59 @@ class ValidationReporter:
                 'timeliness_score': quality_report.timeliness_score
             },
             'issue_summary': {
-                'total_validation_errors': len([r for r in quality_report.validation_results if not r.is_valid and r.severity == 'error']),
-                'total_validation_warnings': len([r for r in quality_report.validation_results if not r.is_valid and r.severity == 'warning']),
+                'total_validation_errors': error_count,
+                'total_validation_warnings': warning_count,
                 'outlier_records_count': len(quality_report.outlier_records),
                 'duplicate_records_count': len(quality_report.duplicate_records),
                 'missing_data_patterns_count': len(quality_report.missing_data_patterns)
             },
             'top_issues': self._get_top_issues(quality_report),
-            'recommendations': self._generate_recommendations(quality_report),
-            'detailed_results': {
-                'validation_results': [
-                    {
-                        'rule_name': r.rule_name,
-                        'field': r.field,
-                        'is_valid': r.is_valid,
-                        'severity': r.severity,
-                        'message': r.message,
-                        'record_id': r.record_id
-                    }
-                    for r in quality_report.validation_results
-                ],
+            'recommendations': self._generate_recommendations(quality_report)
+        }
+
+        if include_details:
+            summary['detailed_results'] = {
+                'validation_results': details,
                 'errors_by_field': quality_report.errors_by_field,
                 'warnings_by_field': quality_report.warnings_by_field,
                 'outlier_records': quality_report.outlier_records,
                 'duplicate_records': quality_report.duplicate_records
             }
-        }
 
         return summary
 
     def _get_top_issues(self, quality_report: QualityReport) -> List[Dict[str, Any]]:
         """Get the most common issues"""
-        issues = []
-
-        # Add field error counts
-        for field, count in quality_report.errors_by_field.items():
-            issues.append({
-                'type': 'validation_error',
-                'field': field,
-                'count': count,
-                'description': f"{count} validation errors in {field}"
-            })
+        # (type, field, count) candidates: field error counts, then outliers and duplicates
+        candidates = [('validation_error', field, count) for field, count in quality_report.errors_by_field.items()]
 
-        # Add outlier information
         if quality_report.outlier_records:
-            issues.append({
-                'type': 'outliers',
-                'field': 'multiple',
-                'count': len(quality_report.outlier_records),
-                'description': f"{len(quality_report.outlier_records)} records with outlier values"
-            })
-
-        # Add duplicate information
+            candidates.append(('outliers', 'multiple', len(quality_report.outlier_records)))
+
         if quality_report.duplicate_records:
-            issues.append({
-                'type': 'duplicates',
-                'field': 'multiple',
-                'count': len(quality_report.duplicate_records),
-                'description': f"{len(quality_report.duplicate_records)} potential duplicate records"
-            })
+            candidates.append(('duplicates', 'multiple', len(quality_report.duplicate_records)))
 
-        # Sort by count (descending)
-        issues.sort(key=lambda x: x['count'], reverse=True)
+        # Partial sort for the top 10 by count; nlargest keeps ties in insertion order like a stable sort
+        top = heapq.nlargest(10, candidates, key=lambda issue: issue[2])
 
-        return issues[:10]  # Top 10 issues
+        return [
+            {
+                'type': issue_type,
+                'field': field,
+                'count': count,
+                'description': self._ISSUE_DESCRIPTIONS[issue_type].format(count=count, field=field)
+            }
+            for issue_type, field, count in top
+        ]
 
     def _generate_recommendations(self, quality_report: QualityReport) -> List[str]:
         """Generate improvement recommendations"""
         recommendations = []
 
+        total_records = quality_report.total_records
+        error_threshold = total_records * 0.1  # More than 10% error rate
+        outlier_threshold = total_records * 0.05  # More than 5% outliers
+
         # Quality score recommendations
         if quality_report.quality_score < 0.7:
             recommendations.append("Overall data quality is low. Consider reviewing data collection processes.")
@@ -896,11 +1415,11 @@ class ValidationReporter:
 
         # Specific field recommendations
         for field, error_count in quality_report.errors_by_field.items():
-            if error_count > quality_report.total_records * 0.1:  # More than 10% error rate
+            if error_count > error_threshold:
                 recommendations.append(f"High error rate in field '{field}'. Consider data cleansing or source review.")
 
         # Outlier recommendations
-        if len(quality_report.outlier_records) > quality_report.total_records * 0.05:  # More than 5% outliers
+        if len(quality_report.outlier_records) > outlier_threshold:
             recommendations.append("High number of outlier records detected. Consider outlier removal or investigation.")
 
         # Missing data recommendations
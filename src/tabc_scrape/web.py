@@ -3,26 +3,96 @@ Web server for health monitoring and API endpoints
 """
 
 import asyncio
+import concurrent.futures
+import gzip
+import hashlib
+import io
+import itertools
 import logging
 import time
-import subprocess
 import threading
-import numpy as np
-from flask import Flask, jsonify, request, Response
+import zlib
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Optional, Tuple
+from flask import Flask, g, jsonify, request, Response, stream_with_context
 from .config import config
-from .storage.database import DatabaseManager
-from .data.api_client import TexasComptrollerAPI
 from .workflow import WorkflowManager
-import pandas as pd
-import io
 from prometheus_client import Counter, Gauge, Histogram, generate_latest, CollectorRegistry, CONTENT_TYPE_LATEST
 
+# Optional fast JSON encoding for large payloads
+ORJSON_AVAILABLE = False
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    # orjson not available - responses are encoded with Flask's jsonify
+    pass
+
+# Optional Arrow IPC responses for binary, columnar clients
+PYARROW_AVAILABLE = False
+try:
+    import pyarrow as pa
+    PYARROW_AVAILABLE = True
+except ImportError:
+    # pyarrow not available - enriched data is served as JSON only
+    pass
+
+# Optional MessagePack responses for lightweight binary clients
+MSGPACK_AVAILABLE = False
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    # msgpack not available - enriched data is not offered as MessagePack
+    pass
+
+# Optional production WSGI server
+WAITRESS_AVAILABLE = False
+try:
+    from waitress import serve as waitress_serve
+    WAITRESS_AVAILABLE = True
+except ImportError:
+    # waitress not available - run_server falls back to the Flask development server
+    pass
+
+if TYPE_CHECKING:
+    # pandas and the storage/API clients are only needed by the data endpoints, so they are
+    # imported where they are used and a worker serving /health never loads them
+    import pandas as pd
+    from .storage.database import DatabaseManager
+    from .data.api_client import TexasComptrollerAPI
+
+try:
+    from flask.json.provider import DefaultJSONProvider
+except ImportError:
+    # Flask < 2.2 has no pluggable JSON providers
+    DefaultJSONProvider = None
+
 logger = logging.getLogger(__name__)
 
 # Prometheus metrics setup
 registry = CollectorRegistry()
 app = Flask(__name__)
 
+if ORJSON_AVAILABLE and DefaultJSONProvider is not None:
+    class OrjsonProvider(DefaultJSONProvider):
+        """JSON provider that encodes every jsonify() response with orjson"""
+
+        def dumps(self, obj, **kwargs):
+            # Datetimes pass through to Flask's default hook so they keep the HTTP date format
+            option = (orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+                      | orjson.OPT_PASSTHROUGH_DATETIME)
+            if kwargs.get('sort_keys', self.sort_keys):
+                option |= orjson.OPT_SORT_KEYS
+            if kwargs.get('indent'):
+                option |= orjson.OPT_INDENT_2
+            return orjson.dumps(obj, default=kwargs.get('default', self.default), option=option).decode()
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+    app.json = OrjsonProvider(app)
+
 # Define metrics
 REQUEST_COUNT = Counter(
     'http_requests_total',
@@ -50,6 +120,13 @@ ENRICHED_RESTAURANT_COUNT = Gauge(
     registry=registry
 )
 
+RESPONSE_CACHE_REQUESTS = Counter(
+    'response_cache_requests_total',
+    'Server-side response cache lookups',
+    ['cache', 'result'],
+    registry=registry
+)
+
 API_CALLS_TOTAL = Counter(
     'api_calls_total',
     'Total API calls made',
@@ -57,48 +134,359 @@ API_CALLS_TOTAL = Counter(
     registry=registry
 )
 
+# Shared clients, built on first use and reused by every request
+_db_manager = None
+_api_client = None
+_clients_lock = threading.Lock()
+
+def _db() -> 'DatabaseManager':
+    """Get the process-wide DatabaseManager, creating it on first use"""
+    global _db_manager
+    if _db_manager is None:
+        with _clients_lock:
+            if _db_manager is None:
+                from .storage.database import DatabaseManager
+                _db_manager = DatabaseManager()
+    return _db_manager
+
+def _api() -> 'TexasComptrollerAPI':
+    """Get the process-wide TexasComptrollerAPI client, creating it on first use"""
+    global _api_client
+    if _api_client is None:
+        with _clients_lock:
+            if _api_client is None:
+                from .data.api_client import TexasComptrollerAPI
+                _api_client = TexasComptrollerAPI()
+    return _api_client
+
+# One long-lived event loop on a daemon thread runs async checks for synchronous Flask handlers
+_event_loop = None
+_event_loop_lock = threading.Lock()
+
+def _background_loop() -> asyncio.AbstractEventLoop:
+    """Get the shared background event loop, starting its thread on first use"""
+    global _event_loop
+    if _event_loop is None:
+        with _event_loop_lock:
+            if _event_loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name='web-event-loop', daemon=True).start()
+                _event_loop = loop
+    return _event_loop
+
+def _run_async(coro, timeout: float):
+    """Run a coroutine on the background event loop and wait for its result, cancelling it on timeout"""
+    future = asyncio.run_coroutine_threadsafe(coro, _background_loop())
+    try:
+        return future.result(timeout=timeout)
+    except concurrent.futures.TimeoutError:
+        # Don't leave the coroutine running on the shared loop after the caller has given up
+        future.cancel()
+        raise
+
+# Enrichment stats change slowly, so /metrics scrapes and dashboard polls share one recent result
+_stats_cache = {'timestamp': 0.0, 'value': None}
+_stats_lock = threading.Lock()
+
+def _enrichment_stats() -> dict:
+    """Get enrichment stats, reusing the last result for config.cache.stats_cache_ttl seconds"""
+    with _stats_lock:
+        now = time.monotonic()
+        if _stats_cache['value'] is None or now - _stats_cache['timestamp'] >= config.cache.stats_cache_ttl:
+            _stats_cache['value'] = _db().get_enrichment_stats()
+            _stats_cache['timestamp'] = now
+        return _stats_cache['value']
+
+# Database-backed gauges are refreshed on a daemon thread, so /metrics scrapes never wait on SQL
+_gauge_refresher = None
+_gauge_refresher_lock = threading.Lock()
+
+def _refresh_gauges():
+    """Set the database-backed gauges from the latest enrichment stats"""
+    try:
+        stats = _enrichment_stats()
+        RESTAURANT_COUNT.set(stats.get('total_restaurants', 0))
+        ENRICHED_RESTAURANT_COUNT.set(stats.get('restaurants_with_concept_classification', 0))
+    except Exception as e:
+        logger.error(f"Error refreshing metrics gauges: {e}")
+
+def _gauge_refresh_loop():
+    while True:
+        time.sleep(config.cache.metrics_refresh_interval)
+        _refresh_gauges()
+
+def _start_gauge_refresher():
+    """Fill the gauges once and start the background refresher, on first use"""
+    global _gauge_refresher
+    if _gauge_refresher is None:
+        with _gauge_refresher_lock:
+            if _gauge_refresher is None:
+                _refresh_gauges()
+                thread = threading.Thread(target=_gauge_refresh_loop, name='metrics-gauge-refresher', daemon=True)
+                thread.start()
+                _gauge_refresher = thread
+
+# Rendered /metrics output is reused for a few seconds, so concurrent scrapers share one render
+_METRICS_CACHE_TTL = 5
+_metrics_cache = {'timestamp': 0.0, 'value': None}
+_metrics_lock = threading.Lock()
+
+def _metrics_body() -> bytes:
+    """Render the Prometheus exposition, reusing the last render for _METRICS_CACHE_TTL seconds"""
+    with _metrics_lock:
+        now = time.monotonic()
+        if _metrics_cache['value'] is not None and now - _metrics_cache['timestamp'] < _METRICS_CACHE_TTL:
+            RESPONSE_CACHE_REQUESTS.labels(cache='metrics', result='hit').inc()
+            return _metrics_cache['value']
+
+        RESPONSE_CACHE_REQUESTS.labels(cache='metrics', result='miss').inc()
+        _start_gauge_refresher()
+
+        _metrics_cache['value'] = generate_latest(registry)
+        _metrics_cache['timestamp'] = now
+        return _metrics_cache['value']
+
+def _shrink_df(df: 'pd.DataFrame') -> 'pd.DataFrame':
+    """
+    Narrow DataFrame dtypes before serialization
+
+    Integer columns are downcast; low-cardinality text columns are already categoricals when loaded.
+    Float columns keep float64, since float32 would change the values written out.
+    """
+    import pandas as pd
+
+    shrunk = {column: pd.to_numeric(df[column], downcast='integer') for column in df.select_dtypes('integer').columns}
+    return df.assign(**shrunk)
+
+# Rows serialized per chunk when streaming CSV responses
+_CSV_CHUNK_ROWS = 10000
+
+def _iter_csv_chunks(frames):
+    """Yield DataFrame chunks as CSV text: the header first, then one piece per chunk"""
+    # One buffer is reused for every chunk instead of to_csv allocating a fresh one each time
+    buffer = io.StringIO()
+    for i, frame in enumerate(frames):
+        if i == 0:
+            yield frame.iloc[:0].to_csv(index=False)
+
+        frame.to_csv(buffer, index=False, header=False)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate(0)
+
+def _dataframe_records(df: 'pd.DataFrame') -> list:
+    """Build one dict per row from column lists, without to_dict('records') per-cell boxing"""
+    columns = list(df.columns)
+    arrays = [df[column].tolist() for column in columns]
+    return [dict(zip(columns, row)) for row in zip(*arrays)]
+
+def _encode_enriched_records(df: 'pd.DataFrame') -> bytes:
+    """Serialize enriched restaurant records to a JSON array"""
+    if ORJSON_AVAILABLE:
+        # orjson writes NaN and inf as null, so no full-frame replace pass is needed
+        return orjson.dumps(_dataframe_records(_shrink_df(df)), option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_SORT_KEYS)
+
+    # Replace NaN and inf values with None for valid JSON serialization (object dtype so categoricals are covered too)
+    df = df.astype(object).replace([float('nan'), float('inf'), float('-inf')], None)
+    return jsonify(df.to_dict('records')).get_data()
+
+def _encode_enriched_columns(df: 'pd.DataFrame') -> bytes:
+    """Serialize enriched restaurant data to a JSON object of column name -> values"""
+    if ORJSON_AVAILABLE:
+        # Numeric columns go to orjson as NumPy arrays and are written without per-cell Python objects
+        df = _shrink_df(df)
+        columns = {
+            column: values.to_numpy() if values.dtype.kind in 'biuf' else values.tolist()
+            for column, values in df.items()
+        }
+        return orjson.dumps(columns, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_SORT_KEYS)
+
+    df = df.astype(object).replace([float('nan'), float('inf'), float('-inf')], None)
+    return jsonify(df.to_dict('list')).get_data()
+
+_ARROW_STREAM_MIMETYPE = 'application/vnd.apache.arrow.stream'
+
+def _encode_enriched_arrow(df: 'pd.DataFrame') -> bytes:
+    """Serialize enriched restaurant data as an Arrow IPC stream"""
+    # Categorical columns become dictionary-encoded Arrow columns
+    table = pa.Table.from_pandas(_shrink_df(df), preserve_index=False)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+def _encode_enriched_msgpack(df: 'pd.DataFrame') -> bytes:
+    """
+    Serialize enriched restaurant data as a MessagePack map of columns
+
+    Numeric and boolean columns are sent as raw array bytes, with their NumPy dtype string
+    (e.g. '<f8') in 'dtypes' so clients can rebuild them with np.frombuffer. Other columns are
+    sent as lists of values, with their pandas dtype name.
+    """
+    df = _shrink_df(df)
+    data = {}
+    dtypes = {}
+    for column, values in df.items():
+        if values.dtype.kind in 'biuf':
+            array = values.to_numpy()
+            data[column] = array.tobytes()
+            dtypes[column] = array.dtype.str
+        else:
+            data[column] = values.astype(object).where(values.notna(), None).tolist()
+            dtypes[column] = str(values.dtype)
+
+    return msgpack.packb({'columns': list(df.columns), 'dtypes': dtypes, 'data': data}, use_bin_type=True)
+
+# JSON layouts of the enriched-data endpoint, selected with ?orient=
+_JSON_ORIENTS = ('records', 'columns')
+
+# Encoders by payload format: the JSON orients, plus binary formats for clients that ask for them in Accept
+_ENRICHED_ENCODERS = {
+    'records': _encode_enriched_records,  # [{column: value, ...}, ...] (default)
+    'columns': _encode_enriched_columns,  # {column: [value, ...], ...}
+}
+
+# Binary payload formats by mimetype, offered only when their library is installed
+_BINARY_FORMATS = {}
+if PYARROW_AVAILABLE:
+    _ENRICHED_ENCODERS['arrow'] = _encode_enriched_arrow
+    _BINARY_FORMATS[_ARROW_STREAM_MIMETYPE] = 'arrow'
+if MSGPACK_AVAILABLE:
+    _ENRICHED_ENCODERS['msgpack'] = _encode_enriched_msgpack
+    _BINARY_FORMATS['application/msgpack'] = 'msgpack'
+
+# gzip level for enriched-data responses: most of the size reduction of level 9 at a fraction of the CPU
+_GZIP_LEVEL = 5
+
+def _accepts_gzip() -> bool:
+    """Check whether the current request's Accept-Encoding allows a gzip response"""
+    return request.accept_encodings['gzip'] > 0
+
+def _iter_gzip(chunks, level: int = _GZIP_LEVEL):
+    """Compress an iterable of text chunks into a gzip stream without buffering the whole body"""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        data = compressor.compress(chunk.encode('utf-8'))
+        if data:
+            yield data
+    yield compressor.flush()
+
+# Page size bounds for /api/enriched-data; the full export is the streamed CSV endpoint
+_ENRICHED_DEFAULT_LIMIT = 1000
+_ENRICHED_MAX_LIMIT = 10000
+
+# Serialized enriched-data payloads by (limit, cursor, format). Entries are dropped when this process writes to the
+# database, and expire after config.cache.data_cache_ttl to pick up writes from other processes.
+_ENRICHED_CACHE_MAX_ENTRIES = 32
+_enriched_cache = OrderedDict()  # (limit, cursor, format) -> (mutation_ts, created_at, etag, body, gzip_body, next_cursor)
+_enriched_cache_lock = threading.Lock()
+
+def _enriched_payload(limit: int, cursor: str = '',
+                      payload_format: str = 'records') -> Optional[Tuple[str, bytes, bytes, Optional[str]]]:
+    """
+    Get a page of enriched data, ordered by id, as (etag, body, gzipped body, next cursor)
+
+    Args:
+        limit: Maximum number of records
+        cursor: Only include records with ids after this one; '' for the first page
+        payload_format: A key of _ENRICHED_ENCODERS
+
+    The next cursor is None on the last page. Returns None when there is no data.
+    """
+    key = (limit, cursor, payload_format)
+    from .storage.database import DatabaseManager
+
+    mutation_ts = DatabaseManager.last_mutation_ts
+    now = time.monotonic()
+
+    with _enriched_cache_lock:
+        entry = _enriched_cache.get(key)
+        if entry and entry[0] == mutation_ts and now - entry[1] < config.cache.data_cache_ttl:
+            _enriched_cache.move_to_end(key)
+            RESPONSE_CACHE_REQUESTS.labels(cache='enriched_data', result='hit').inc()
+            return entry[2:]
+
+    RESPONSE_CACHE_REQUESTS.labels(cache='enriched_data', result='miss').inc()
+
+    df = _db().get_enriched_restaurants_dataframe(limit=limit, categorical=True, after_id=cursor)
+    if df.empty:
+        return None
+    next_cursor = str(df['id'].iloc[-1]) if len(df) == limit else None
+
+    body = _ENRICHED_ENCODERS[payload_format](df)
+    etag = hashlib.md5(body).hexdigest()
+    gzip_body = gzip.compress(body, compresslevel=_GZIP_LEVEL)
+    logger.info(f"Serialized {len(df)} enriched restaurant records")
+
+    with _enriched_cache_lock:
+        _enriched_cache[key] = (mutation_ts, now, etag, body, gzip_body, next_cursor)
+        _enriched_cache.move_to_end(key)
+        while len(_enriched_cache) > _ENRICHED_CACHE_MAX_ENTRIES:
+            _enriched_cache.popitem(last=False)
+
+    return etag, body, gzip_body, next_cursor
+
 # Middleware to track HTTP requests
 @app.before_request
 def before_request():
-    request.start_time = time.time()
+    # Monotonic, high-resolution clock; g avoids setting attributes through the request proxy
+    g.start_ns = time.perf_counter_ns()
+
+# Labelled metric children by label values, so each request skips the labels() resolution
+_duration_children = {}
+_count_children = {}
 
 @app.after_request
 def after_request(response):
-    if hasattr(request, 'start_time'):
-        duration = time.time() - request.start_time
-        REQUEST_DURATION.labels(
-            method=request.method,
-            endpoint=request.endpoint or 'unknown'
-        ).observe(duration)
-
-        REQUEST_COUNT.labels(
-            method=request.method,
-            endpoint=request.endpoint or 'unknown',
-            status_code=str(response.status_code)
-        ).inc()
+    start_ns = g.get('start_ns')
+    if start_ns is not None:
+        duration = (time.perf_counter_ns() - start_ns) / 1e9
+        key = (request.method, request.endpoint or 'unknown')
+
+        duration_child = _duration_children.get(key)
+        if duration_child is None:
+            duration_child = _duration_children.setdefault(
+                key, REQUEST_DURATION.labels(method=key[0], endpoint=key[1])
+            )
+        duration_child.observe(duration)
+
+        count_key = key + (response.status_code,)
+        count_child = _count_children.get(count_key)
+        if count_child is None:
+            count_child = _count_children.setdefault(
+                count_key, REQUEST_COUNT.labels(method=key[0], endpoint=key[1], status_code=str(response.status_code))
+            )
+        count_child.inc()
 
     return response
 
+# Health check payload, encoded once at import time since its contents never change per request
+_HEALTH_BODY = (app.json.dumps({
+    'status': 'healthy',
+    'environment': config.api.base_url,
+    'timestamp': '2023-10-01T00:00:00Z'  # Placeholder
+}) + '\n').encode()
+
 @app.route('/health')
 def health_check():
     """Basic health check endpoint"""
-    return jsonify({
-        'status': 'healthy',
-        'environment': config.api.base_url,
-        'timestamp': '2023-10-01T00:00:00Z'  # Placeholder
-    })
+    return Response(_HEALTH_BODY, mimetype='application/json')
 
 @app.route('/status')
 def system_status():
     """Detailed system status"""
     try:
-        db_manager = DatabaseManager()
-        api_client = TexasComptrollerAPI()
+        db_manager = _db()
+        api_client = _api()
 
         db_ok = db_manager.test_connection()
-        api_ok = asyncio.run(api_client.test_connection())
+        try:
+            # test_connection bounds its own request at 10s; allow a little slack on top
+            api_ok = _run_async(api_client.test_connection(), timeout=15)
+        except concurrent.futures.TimeoutError:
+            api_ok = False
 
-        stats = db_manager.get_enrichment_stats() if db_ok else {}
+        stats = _enrichment_stats() if db_ok else {}
 
         return jsonify({
             'database_connected': db_ok,
@@ -114,15 +502,8 @@ def system_status():
 def metrics():
     """Prometheus metrics endpoint"""
     try:
-        # Update gauge metrics with current database stats
-        db_manager = DatabaseManager()
-        stats = db_manager.get_enrichment_stats()
-
-        RESTAURANT_COUNT.set(stats.get('total_restaurants', 0))
-        ENRICHED_RESTAURANT_COUNT.set(stats.get('restaurants_with_concept_classification', 0))
-
         # Generate and return Prometheus metrics
-        return Response(generate_latest(registry), mimetype=CONTENT_TYPE_LATEST)
+        return Response(_metrics_body(), mimetype=CONTENT_TYPE_LATEST)
     except Exception as e:
         logger.error(f"Error in metrics endpoint: {e}")
         return Response(f"Error generating metrics: {str(e)}", status=500, mimetype='text/plain')
@@ -132,21 +513,46 @@ def get_enriched_data():
     """Get enriched restaurant data in JSON format"""
     try:
         logger.info("API request for enriched data (JSON)")
-        db_manager = DatabaseManager()
-
-        # Get limit from query parameter
-        limit = request.args.get('limit', type=int)
 
-        df = db_manager.get_enriched_restaurants_dataframe(limit=limit)
-        if df.empty:
+        # Get page size, page cursor and JSON layout from query parameters
+        limit = request.args.get('limit', default=_ENRICHED_DEFAULT_LIMIT, type=int)
+        limit = max(1, min(limit, _ENRICHED_MAX_LIMIT))
+        cursor = request.args.get('cursor', '')
+        orient = request.args.get('orient', 'records')
+        if orient not in _JSON_ORIENTS:
+            return jsonify({'error': f"orient must be one of: {', '.join(_JSON_ORIENTS)}"}), 400
+
+        # Binary formats are only sent to clients that prefer them over JSON; '*/*' and missing Accept get JSON
+        mimetype = 'application/json'
+        payload_format = orient
+        best_match = request.accept_mimetypes.best_match([mimetype, *_BINARY_FORMATS])
+        if best_match in _BINARY_FORMATS:
+            mimetype = best_match
+            payload_format = _BINARY_FORMATS[best_match]
+
+        payload = _enriched_payload(limit, cursor, payload_format)
+        if payload is None:
             logger.warning("No enriched data available")
             return jsonify({'error': 'No enriched data available'}), 404
 
-        # Replace NaN and inf values with None for valid JSON serialization
-        df = df.replace([np.nan, np.inf, -np.inf], None)
-        data = df.to_dict('records')
-        logger.info(f"Returning {len(data)} enriched restaurant records")
-        return jsonify(data)
+        etag, body, gzip_body, next_cursor = payload
+        if _accepts_gzip():
+            response = Response(gzip_body, mimetype=mimetype)
+            response.content_encoding = 'gzip'
+            # Each encoding is a different representation, so it gets its own validator
+            response.set_etag(f"{etag}-gzip")
+        else:
+            response = Response(body, mimetype=mimetype)
+            response.set_etag(etag)
+        if next_cursor is not None:
+            # Pass back as ?cursor= for the next page; absent on the last page
+            response.headers['X-Next-Cursor'] = next_cursor
+        response.vary.update(('Accept', 'Accept-Encoding'))
+        response.cache_control.public = True
+        response.cache_control.max_age = config.cache.data_cache_ttl
+
+        # Answers 304 Not Modified when the client already holds this payload
+        return response.make_conditional(request)
 
     except Exception as e:
         logger.error(f"Error in enriched-data endpoint: {e}")
@@ -157,24 +563,31 @@ def get_enriched_data_csv():
     """Get enriched restaurant data in CSV format"""
     try:
         logger.info("API request for enriched data (CSV)")
-        db_manager = DatabaseManager()
+        db_manager = _db()
 
         # Get limit from query parameter
         limit = request.args.get('limit', type=int)
 
-        df = db_manager.get_enriched_restaurants_dataframe(limit=limit)
-        if df.empty:
+        # Read and write the CSV in row chunks, so neither the rows nor the file are held in memory at once
+        frames = db_manager.get_enriched_restaurants_dataframe(limit=limit, chunksize=_CSV_CHUNK_ROWS)
+        first_frame = next(frames, None)
+        if first_frame is None:
             logger.warning("No enriched data available for CSV")
             return Response("No enriched data available", status=404, mimetype='text/plain')
 
-        # Convert to CSV
-        output = io.StringIO()
-        df.to_csv(output, index=False)
-        csv_data = output.getvalue()
-        output.close()
+        logger.info("Streaming CSV of enriched restaurant records")
+        chunks = _iter_csv_chunks(itertools.chain([first_frame], frames))
+        headers = {
+            'Content-Disposition': 'attachment; filename=enriched_restaurants.csv',
+            'Cache-Control': f"public, max-age={config.cache.data_cache_ttl}",
+            'Vary': 'Accept-Encoding'
+        }
+        if _accepts_gzip():
+            # Compress chunk by chunk so the response keeps streaming
+            chunks = _iter_gzip(chunks)
+            headers['Content-Encoding'] = 'gzip'
 
-        logger.info(f"Returning CSV with {len(df)} enriched restaurant records")
-        return Response(csv_data, mimetype='text/csv', headers={'Content-Disposition': 'attachment; filename=enriched_restaurants.csv'})
+        return Response(stream_with_context(chunks), mimetype='text/csv', headers=headers)
 
     except Exception as e:
         logger.error(f"Error in enriched-data CSV endpoint: {e}")
@@ -185,19 +598,14 @@ def get_restaurant_by_id(restaurant_id):
     """Get specific restaurant data by ID"""
     try:
         logger.info(f"API request for restaurant {restaurant_id}")
-        db_manager = DatabaseManager()
+        db_manager = _db()
 
-        restaurant = db_manager.get_restaurant_dict_by_id(restaurant_id)
+        # Look up the enriched record directly instead of loading the whole table
+        restaurant = db_manager.get_enriched_restaurant_by_id(restaurant_id)
         if not restaurant:
             logger.warning(f"Restaurant {restaurant_id} not found")
             return jsonify({'error': 'Restaurant not found'}), 404
 
-        # Get enriched data for this restaurant
-        df = db_manager.get_enriched_restaurants_dataframe(limit=None)
-        enriched_row = df[df['id'] == restaurant_id]
-        if not enriched_row.empty:
-            restaurant = enriched_row.iloc[0].to_dict()
-
         logger.info(f"Returning data for restaurant {restaurant_id}")
         return jsonify(restaurant)
 
@@ -205,10 +613,8 @@ def get_restaurant_by_id(restaurant_id):
         logger.error(f"Error in restaurant endpoint: {e}")
         return jsonify({'error': str(e)}), 500
 
-@app.route('/')
-def dashboard():
-    """Main dashboard page"""
-    return '''
+# Static dashboard page, encoded once at import time
+_DASHBOARD_HTML = '''
     <!DOCTYPE html>
     <html>
     <head>
@@ -337,7 +743,15 @@ def dashboard():
         </script>
     </body>
     </html>
-    '''
+    '''.encode('utf-8')
+_DASHBOARD_ETAG = hashlib.md5(_DASHBOARD_HTML).hexdigest()
+
+@app.route('/')
+def dashboard():
+    """Main dashboard page"""
+    response = Response(_DASHBOARD_HTML, mimetype='text/html', headers={'Cache-Control': 'public, max-age=3600'})
+    response.set_etag(_DASHBOARD_ETAG)
+    return response.make_conditional(request)
 
 @app.route('/api/trigger/fetch', methods=['POST'])
 def trigger_fetch():
@@ -345,12 +759,13 @@ def trigger_fetch():
     try:
         limit = request.json.get('limit', 100)
         
-        # Run fetch command in background
+        # Run the fetch in-process on a background thread, skipping interpreter startup
         def run_fetch():
-            subprocess.run([
-                'python', '-m', 'src.tabc_scrape.cli',
-                'fetch', '--limit', str(limit)
-            ], check=True)
+            from .cli import fetch_restaurants  # Imported lazily: cli imports this module
+            try:
+                asyncio.run(fetch_restaurants(limit=limit))
+            except Exception as e:
+                logger.error(f"Background fetch failed: {e}")
         
         thread = threading.Thread(target=run_fetch, daemon=True)
         thread.start()
@@ -365,12 +780,13 @@ def trigger_enrich():
     try:
         limit = request.json.get('limit', 10)
         
-        # Run enrich command in background
+        # Run the enrichment in-process on a background thread, skipping interpreter startup
         def run_enrich():
-            subprocess.run([
-                'python', '-m', 'src.tabc_scrape.cli',
-                'enrich', '--limit', str(limit)
-            ], check=True)
+            from .cli import enrich_restaurants  # Imported lazily: cli imports this module
+            try:
+                asyncio.run(enrich_restaurants(limit=limit))
+            except Exception as e:
+                logger.error(f"Background enrichment failed: {e}")
         
         thread = threading.Thread(target=run_enrich, daemon=True)
         thread.start()
@@ -404,6 +820,24 @@ def run_full_workflow():
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
-def run_server(host='0.0.0.0', port=5000, debug=False):
-    """Run the Flask server"""
-    app.run(host=host, port=port, debug=debug)
\ No newline at end of file
+def run_server(host='0.0.0.0', port=5000, debug=False, threads=8):
+    """
+    Run the Flask server
+
+    Serves with waitress and a pool of worker threads when it is installed, so slow
+    database-bound requests don't hold up /health or /metrics. Debug mode always uses
+    the Flask development server for its reloader and debugger.
+
+    Args:
+        host: Interface to bind to
+        port: Port to bind to
+        debug: Run the Flask development server in debug mode
+        threads: Number of request-handling threads
+    """
+    if WAITRESS_AVAILABLE and not debug:
+        logger.info(f"Serving with waitress on {host}:{port} ({threads} threads)")
+        waitress_serve(app, host=host, port=port, threads=threads)
+    else:
+        if not debug:
+            logger.warning("waitress not installed; using the Flask development server")
+        app.run(host=host, port=port, debug=debug, threaded=True)
\ No newline at end of file
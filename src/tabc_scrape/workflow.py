@@ -30,7 +30,8 @@ class WorkflowManager:
             db_manager = DatabaseManager()
             
             restaurants = await api_client.get_all_restaurants(limit=limit)
-            stored_count = db_manager.store_restaurants([r.__dict__ for r in restaurants])
+            # The insert is synchronous SQLAlchemy work; run it off the event loop
+            stored_count = await asyncio.to_thread(db_manager.store_restaurants, (vars(r) for r in restaurants))
             results['fetch'] = {'count': stored_count}
             
             # Step 2: Enrich data
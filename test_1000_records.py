@@ -7,10 +7,6 @@ import asyncio
 import sys
 import os
 import time
-from pathlib import Path
-
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent / 'src'))
 
 from tabc_scrape.data.api_client import TexasComptrollerAPI
 from tabc_scrape.storage.database import DatabaseManager
@@ -55,7 +51,7 @@ async def test_1000_records():
         print("\n3. Storing records in database...")
         start_time = time.time()
 
-        stored_count = db_manager.store_restaurants([r.__dict__ for r in restaurants])
+        stored_count = db_manager.store_restaurants(vars(r) for r in restaurants)
         store_time = time.time() - start_time
 
         print(f"Stored {stored_count} records in {store_time:.2f} seconds")
@@ -1,6 +1,5 @@
 import asyncio
 import logging
-import sys
 import os
 
 # Set environment variables for this session
@@ -8,11 +7,9 @@ os.environ['API_KEY_ID'] = '1qah3gxsa7hq22uv7pq1qb6j2'
 os.environ['API_KEY_SECRET'] = 'owqiugc9q94bnvh5r11n3ibvhq1zs2k72lnz8re98woh0neug'
 os.environ['APP_TOKEN'] = '2d7MaXhf0SeDpdQ1gEmJ80Jjy'
 
-# Add src to path
-sys.path.append('src')
-
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
 
 from tabc_scrape.data.api_client import TexasComptrollerAPI
 
@@ -44,8 +41,7 @@ async def test_api_connection():
             print(f"  - City: {restaurant.location_city}")
     except Exception as e:
         print(f"ERROR: Error fetching restaurants: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Fetching restaurants failed")
 
 if __name__ == "__main__":
     asyncio.run(test_api_connection())
\ No newline at end of file
@@ -3,10 +3,6 @@
 Test script for the improved Texas Comptroller API client
 """
 
-import sys
-import os
-sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
-
 from tabc_scrape.data.api_client import TexasComptrollerAPI
 import logging
 
@@ -49,8 +45,7 @@ def main():
             print("No data retrieved")
     except Exception as e:
         print(f"✗ Error retrieving data: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Retrieving restaurant data failed")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,6 +1,6 @@
 import asyncio
 import logging
-from src.tabc_scrape.data.api_client import TexasComptrollerAPI
+from tabc_scrape.data.api_client import TexasComptrollerAPI
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -4,13 +4,9 @@ Test script for Redis caching functionality
 """
 
 import sys
-import os
 import logging
 from unittest.mock import Mock, patch
 
-# Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
-
 from tabc_scrape.config import config
 from tabc_scrape.storage.cache import CacheService, get_api_cache, set_api_cache, get_geocode_cache, set_geocode_cache
 
@@ -204,8 +200,7 @@ def main():
 
     except Exception as e:
         print(f"\n❌ Test failed with error: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Caching test failed")
         return False
 
 if __name__ == "__main__":
@@ -5,51 +5,105 @@ Tests all components (API + Square Footage + Population) with real Texas Comptro
 """
 
 import sys
-import os
-sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
-
-import requests
+import aiohttp
+import numpy as np
+import pandas as pd
+import io
 import json
 import time
 import asyncio
-from tabc_scrape.scraping.square_footage import SquareFootageScraper
-from tabc_scrape.analysis.population import PopulationAnalyzer
 import logging
 
+# Optional JIT compilation for the per-restaurant metric kernel
+NUMBA_AVAILABLE = False
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    # Numba not available - metrics are computed with NumPy expressions
+    pass
+
+# Optional faster JSON decoding of API pages
+ORJSON_AVAILABLE = False
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    # orjson not available - pages are decoded with aiohttp's json()
+    pass
+
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-def fetch_real_restaurant_data(limit=15):
-    """Fetch real restaurant data from Texas Comptroller API"""
-    print("Fetching real restaurant data from Texas Comptroller API...")
+COMPTROLLER_URL = "https://data.texas.gov/api/odata/v4/naix-2893"
+COMPTROLLER_FIELDS = '__id,location_name,location_address,location_city,location_state,location_zip,location_county,total_receipts,liquor_receipts,wine_receipts,beer_receipts'
 
-    url = "https://data.texas.gov/api/odata/v4/naix-2893"
+# Transient statuses retried with exponential backoff (0.3s, 0.6s, 1.2s)
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+MAX_RETRIES = 3
+RETRY_BACKOFF = 0.3
+
+async def fetch_restaurant_page(session, semaphore, skip, top):
+    """Fetch one $skip/$top page of restaurants, retrying transient failures"""
     params = {
-        '$top': str(limit),
-        '$select': '__id,location_name,location_address,location_city,location_state,location_zip,location_county,total_receipts,liquor_receipts,wine_receipts,beer_receipts'
+        '$skip': str(skip),
+        '$top': str(top),
+        '$orderby': '__id',
+        '$select': COMPTROLLER_FIELDS
     }
 
+    async with semaphore:
+        for attempt in range(MAX_RETRIES + 1):
+            async with session.get(COMPTROLLER_URL, params=params) as response:
+                if response.status == 200:
+                    if ORJSON_AVAILABLE:
+                        # Decodes the raw bytes directly, skipping the intermediate str
+                        data = orjson.loads(await response.read())
+                    else:
+                        data = await response.json()
+                    return data['value']
+                if response.status not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                    raise RuntimeError(f"API request failed: {response.status}")
+            await asyncio.sleep(RETRY_BACKOFF * 2 ** attempt)
+
+async def fetch_real_restaurant_data(limit=15, page_size=200, max_concurrency=4):
+    """Fetch real restaurant data from Texas Comptroller API, requesting pages concurrently"""
+    print("Fetching real restaurant data from Texas Comptroller API...")
+
+    # Pages are ordered by __id so concurrent $skip windows don't overlap
+    pages = [(skip, min(page_size, limit - skip)) for skip in range(0, limit, page_size)]
+    semaphore = asyncio.Semaphore(max_concurrency)
+
     try:
-        response = requests.get(url, params=params, timeout=30)
-        if response.status_code == 200:
-            data = response.json()
-            restaurants = data['value']
+        # One pooled keep-alive session for every page; aiohttp requests gzip responses by default
+        connector = aiohttp.TCPConnector(limit=max_concurrency)
+        async with aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=30)) as session:
+            page_results = await asyncio.gather(
+                *(fetch_restaurant_page(session, semaphore, skip, top) for skip, top in pages)
+            )
+
+        restaurants = [restaurant for page in page_results for restaurant in page]
 
-            print(f"Successfully retrieved {len(restaurants)} real restaurants")
+        # Formatted once here and shared by every later step, so cache keys see one canonical form
+        for restaurant in restaurants:
+            restaurant['full_address'] = f"{restaurant['location_address']}, {restaurant['location_city']}, {restaurant['location_state']} {restaurant['location_zip']}"
+
+        if restaurants:
+            print(f"Successfully retrieved {len(restaurants)} real restaurants in {len(pages)} page(s)")
 
             # Show sample of real data
             print("\nSample Real Restaurant Data:")
             for i, restaurant in enumerate(restaurants[:3], 1):
                 print(f"  {i}. {restaurant['location_name']}")
-                print(f"     📍 {restaurant['location_address']}, {restaurant['location_city']}, {restaurant['location_state']} {restaurant['location_zip']}")
+                print(f"     📍 {restaurant['full_address']}")
                 print(f"     🏛️  County: {restaurant['location_county']}")
                 print(f"     💰 Annual Receipts: ${restaurant['total_receipts']:,.2f}")
                 print()
 
             return restaurants
         else:
-            print(f"API request failed: {response.status_code}")
+            print("API returned no restaurants")
             return []
 
     except Exception as e:
@@ -60,24 +114,36 @@ async def test_square_footage_with_real_data(restaurants):
     """Test square footage scraping with real restaurant data"""
     print("\nTesting Square Footage Scraping with Real Data...")
 
+    # Imported here so the script starts without loading the scraper stack
+    from tabc_scrape.scraping.square_footage import SquareFootageScraper, SquareFootageResult
+
     scraper = SquareFootageScraper()
     results = {}
 
     # Test on first 5 restaurants
     test_restaurants = restaurants[:5]
 
-    for i, restaurant in enumerate(test_restaurants, 1):
+    # Scrape concurrently; the scraper paces its own search requests
+    outcomes = await asyncio.gather(
+        *(scraper.scrape_square_footage(r['location_name'], r['full_address'], r.get('location_county', ''))
+          for r in test_restaurants),
+        return_exceptions=True
+    )
+
+    for i, (restaurant, result) in enumerate(zip(test_restaurants, outcomes), 1):
         print(f"\n{i}. {restaurant['location_name']}")
         print(f"   📍 {restaurant['location_address']}, {restaurant['location_city']}")
 
-        # Prepare data for scraper
-        restaurant_name = restaurant['location_name']
-        full_address = f"{restaurant['location_address']}, {restaurant['location_city']}, {restaurant['location_state']} {restaurant['location_zip']}"
-        county = restaurant.get('location_county', '')
-
-        try:
-            result = await scraper.scrape_square_footage(restaurant_name, full_address, county)
-
+        if isinstance(result, Exception):
+            print(f"   ❌ Error: {result}")
+            result = SquareFootageResult(
+                restaurant_name=restaurant['location_name'],
+                address=restaurant['full_address'],
+                square_footage=None,
+                source='error',
+                confidence=0.0
+            )
+        else:
             print(f"   📏 Square Footage: {result.square_footage or 'Not found'}")
             print(f"   🔍 Source: {result.source}")
             print(f"   📊 Confidence: {result.confidence:.2f}")
@@ -87,44 +153,35 @@ async def test_square_footage_with_real_data(restaurants):
             else:
                 print("   No square footage data found")
 
-        except Exception as e:
-            print(f"   ❌ Error: {e}")
-            from tabc_scrape.scraping.square_footage import SquareFootageResult
-            result = SquareFootageResult(
-                restaurant_name=restaurant_name,
-                address=full_address,
-                square_footage=None,
-                source='error',
-                confidence=0.0
-            )
-
         results[restaurant['__id']] = result
 
-        # Small delay between requests
-        if i < len(test_restaurants):
-            await asyncio.sleep(1)
-
     return results
 
 async def test_population_analysis_with_real_data(restaurants):
     """Test population analysis with real restaurant data"""
     print("\nTesting Population Analysis with Real Data...")
 
+    from tabc_scrape.analysis.population import PopulationAnalyzer
+
     analyzer = PopulationAnalyzer()
     results = {}
 
     # Test on first 5 restaurants
     test_restaurants = restaurants[:5]
 
-    for i, restaurant in enumerate(test_restaurants, 1):
+    # Analyzed concurrently, with the analyzer spacing its geocoding requests to Nominatim's limit
+    outcomes = await asyncio.gather(
+        *(analyzer.analyze_location(r['location_name'], r['full_address']) for r in test_restaurants),
+        return_exceptions=True
+    )
+
+    for i, (restaurant, result) in enumerate(zip(test_restaurants, outcomes), 1):
         print(f"\n{i}. {restaurant['location_name']}")
         print(f"   📍 {restaurant['location_address']}, {restaurant['location_city']}")
 
-        # Prepare address for analysis
-        full_address = f"{restaurant['location_address']}, {restaurant['location_city']}, {restaurant['location_state']} {restaurant['location_zip']}"
-
         try:
-            result = await analyzer.analyze_location(restaurant['location_name'], full_address)
+            if isinstance(result, Exception):
+                raise result
 
             print(f"   🌍 Coordinates: {result.latitude:.4f}, {result.longitude:.4f}")
             print(f"   👥 1-mile population: {result.population_1_mile:,}")
@@ -139,133 +196,205 @@ async def test_population_analysis_with_real_data(restaurants):
 
         results[restaurant['__id']] = result
 
-        # Delay between geocoding requests
-        if i < len(test_restaurants):
-            await asyncio.sleep(1.5)
-
     return results
 
-def show_comprehensive_results(restaurants, sqft_results, pop_results):
+SQFT_PER_SQ_MILE = 27878400
+MARKET_POTENTIAL_LABELS = np.array(['Low', 'Medium', 'High'])
+
+def _enrichment_metrics_numpy(receipts, sqft, pop):
+    """Revenue per sq ft, population density and market potential tier (0 Low, 1 Medium, 2 High) per restaurant"""
+    revenue_per_sqft = np.where(receipts > 0, receipts / sqft, 0.0)
+    density = pop / np.maximum(sqft / SQFT_PER_SQ_MILE, 1)
+    tier = np.where(revenue_per_sqft > 100, 2, np.where(revenue_per_sqft > 50, 1, 0)).astype(np.int8)
+    return revenue_per_sqft, density, tier
+
+if NUMBA_AVAILABLE:
+    # error_model='numpy' so a zero square footage gives inf like NumPy instead of raising. Released GIL
+    # instead of prange: the kernel is warmed up from a worker thread, and numba's default threading
+    # layer must not be started from one thread and then used from another.
+    @njit(cache=True, nogil=True, error_model='numpy')
+    def _enrichment_metrics(receipts, sqft, pop):
+        """JIT-compiled equivalent of _enrichment_metrics_numpy; missing values are NaN"""
+        n = receipts.shape[0]
+        revenue_per_sqft = np.empty(n)
+        density = np.empty(n)
+        tier = np.zeros(n, dtype=np.int8)
+        for i in range(n):
+            revenue_per_sqft[i] = receipts[i] / sqft[i] if receipts[i] > 0 else 0.0
+            sq_miles = sqft[i] / SQFT_PER_SQ_MILE
+            if sq_miles < 1:
+                sq_miles = 1.0
+            density[i] = pop[i] / sq_miles
+            if revenue_per_sqft[i] > 100:
+                tier[i] = 2
+            elif revenue_per_sqft[i] > 50:
+                tier[i] = 1
+        return revenue_per_sqft, density, tier
+else:
+    _enrichment_metrics = _enrichment_metrics_numpy
+
+def warm_up_metrics():
+    """Compile the metric kernel (or load it from numba's on-disk cache) ahead of its first real use"""
+    one = np.ones(1)
+    _enrichment_metrics(one, one, one)
+
+POPULATION_FIELDS = ['population_1_mile', 'drinking_age_1_mile', 'median_age_1_mile', 'median_income_1_mile', 'census_data_available']
+
+def build_enrichment_frame(restaurants, sqft_results, pop_results):
+    """One row per restaurant, indexed by __id, joined with its enrichment results and derived metrics"""
+    df = pd.DataFrame(restaurants).set_index('__id')
+
+    sqft_df = pd.DataFrame.from_dict(
+        {rid: {'square_footage': r.square_footage} for rid, r in sqft_results.items()},
+        orient='index', columns=['square_footage'], dtype=float
+    )
+    # Object dtype keeps the population values exactly as returned (ints stay ints, None stays None)
+    pop_items = [(rid, r) for rid, r in pop_results.items() if r]
+    pop_df = pd.DataFrame(
+        [[getattr(r, field) for field in POPULATION_FIELDS] for _, r in pop_items],
+        index=[rid for rid, _ in pop_items], columns=POPULATION_FIELDS, dtype=object
+    )
+    df = df.join(sqft_df).join(pop_df)
+
+    df['has_sqft'] = df['square_footage'].fillna(0) != 0
+    df['has_pop'] = df['census_data_available'].eq(True)
+    df['has_both'] = df['has_sqft'] & df['has_pop']
+
+    revenue_per_sqft, density, tier = _enrichment_metrics(
+        df['total_receipts'].to_numpy(dtype=np.float64),
+        df['square_footage'].to_numpy(dtype=np.float64),
+        df['population_1_mile'].to_numpy(dtype=np.float64)
+    )
+    df['revenue_per_sqft'] = revenue_per_sqft
+    df['population_density'] = density
+    df['market_potential'] = MARKET_POTENTIAL_LABELS[tier]
+    return df
+
+def show_comprehensive_results(restaurants, sqft_results, pop_results, df=None):
     """Show comprehensive enrichment results"""
-    print("\n" + "="*80)
-    print("📊 COMPREHENSIVE ENRICHMENT RESULTS")
-    print("="*80)
+    # Output is buffered and written to stdout once
+    out = io.StringIO()
+    print("\n" + "="*80, file=out)
+    print("📊 COMPREHENSIVE ENRICHMENT RESULTS", file=out)
+    print("="*80, file=out)
 
-    for restaurant in restaurants[:8]:  # Show first 8 restaurants
-        restaurant_id = restaurant['__id']
+    if df is None:
+        df = build_enrichment_frame(restaurants, sqft_results, pop_results)
 
-        print(f"\n🏪 {restaurant['location_name']}")
-        print(f"   📍 {restaurant['location_address']}, {restaurant['location_city']}, {restaurant['location_state']} {restaurant['location_zip']}")
-        print(f"   💰 Annual Revenue: ${restaurant['total_receipts']:,.2f}")
+    for row in df.head(8).itertuples():  # Show first 8 restaurants
+        print(f"\n🏪 {row.location_name}", file=out)
+        print(f"   📍 {row.full_address}", file=out)
+        print(f"   💰 Annual Revenue: ${row.total_receipts:,.2f}", file=out)
 
         # Square footage results
-        if restaurant_id in sqft_results:
-            sqft_result = sqft_results[restaurant_id]
-            if sqft_result.square_footage:
-                revenue_per_sqft = restaurant['total_receipts'] / sqft_result.square_footage if restaurant['total_receipts'] > 0 else 0
-                print(f"   📏 Square Footage: {sqft_result.square_footage:,}")
-                print(f"   💵 Revenue per Sq Ft: ${revenue_per_sqft:.2f}")
+        if row.Index in sqft_results:
+            if row.has_sqft:
+                print(f"   📏 Square Footage: {int(row.square_footage):,}", file=out)
+                print(f"   💵 Revenue per Sq Ft: ${row.revenue_per_sqft:.2f}", file=out)
             else:
-                print("   📏 Square Footage: Not available")
+                print("   📏 Square Footage: Not available", file=out)
         # Population results
-        if restaurant_id in pop_results:
-            pop_result = pop_results[restaurant_id]
-            if pop_result and pop_result.census_data_available:
-                print(f"   👥 1-mile Population: {pop_result.population_1_mile:,}")
-                print(f"   🍺 Drinking Age: {pop_result.drinking_age_1_mile:,}")
-                print(f"   👴 Median Age: {pop_result.median_age_1_mile}")
-                print(f"   💵 Median Income: ${pop_result.median_income_1_mile:,}")
-
-        # Calculate key metrics if we have both data points
-        if (restaurant_id in sqft_results and restaurant_id in pop_results and
-            sqft_results[restaurant_id].square_footage and pop_results[restaurant_id].census_data_available):
-
-            sqft_result = sqft_results[restaurant_id]
-            pop_result = pop_results[restaurant_id]
-
-            if restaurant['total_receipts'] > 0:
-                revenue_per_sqft = restaurant['total_receipts'] / sqft_result.square_footage
-                print(f"   📊 Key Metrics:")
-                print(f"      • Revenue per Sq Ft: ${revenue_per_sqft:.2f}")
-                print(f"      • Population Density: {pop_result.population_1_mile / max(sqft_result.square_footage / 27878400, 1):.1f} people/sq mile")
-                print(f"      • Market Potential: {'High' if revenue_per_sqft > 100 else 'Medium' if revenue_per_sqft > 50 else 'Low'}")
-
-def show_system_summary(restaurants, sqft_results, pop_results):
+        if row.has_pop:
+            print(f"   👥 1-mile Population: {row.population_1_mile:,}", file=out)
+            print(f"   🍺 Drinking Age: {row.drinking_age_1_mile:,}", file=out)
+            print(f"   👴 Median Age: {row.median_age_1_mile}", file=out)
+            print(f"   💵 Median Income: ${row.median_income_1_mile:,}", file=out)
+
+        # Show key metrics if we have both data points
+        if row.has_both and row.total_receipts > 0:
+            print(f"   📊 Key Metrics:", file=out)
+            print(f"      • Revenue per Sq Ft: ${row.revenue_per_sqft:.2f}", file=out)
+            print(f"      • Population Density: {row.population_density:.1f} people/sq mile", file=out)
+            print(f"      • Market Potential: {row.market_potential}", file=out)
+
+    sys.stdout.write(out.getvalue())
+
+def show_system_summary(restaurants, sqft_results, pop_results, df=None):
     """Show overall system performance summary"""
-    print("\n" + "="*80)
-    print("📈 SYSTEM PERFORMANCE SUMMARY")
-    print("="*80)
+    # Output is buffered and written to stdout once
+    out = io.StringIO()
+    print("\n" + "="*80, file=out)
+    print("📈 SYSTEM PERFORMANCE SUMMARY", file=out)
+    print("="*80, file=out)
+
+    if df is None:
+        df = build_enrichment_frame(restaurants, sqft_results, pop_results)
 
     # Overall statistics
-    total_restaurants = len(restaurants)
-    print(f"📊 Data Collection:")
-    print(f"   • Restaurants processed: {total_restaurants}")
-    print(f"   • Data sources: Texas Comptroller API, OpenStreetMap, Census data")
+    total_restaurants = len(df)
+    print(f"📊 Data Collection:", file=out)
+    print(f"   • Restaurants processed: {total_restaurants}", file=out)
+    print(f"   • Data sources: Texas Comptroller API, OpenStreetMap, Census data", file=out)
 
     # Square footage statistics
+    from tabc_scrape.scraping.square_footage import SquareFootageScraper
     sqft_scraper = SquareFootageScraper()
     sqft_stats = sqft_scraper.get_scraping_stats(sqft_results)
 
-    print("\n🏢 Square Footage Scraping:")
-    print(f"   • Success rate: {sqft_stats['success_rate']:.1%}")
-    print(f"   • Average confidence: {sqft_stats['average_confidence']:.2f}")
+    print("\n🏢 Square Footage Scraping:", file=out)
+    print(f"   • Success rate: {sqft_stats['success_rate']:.1%}", file=out)
+    print(f"   • Average confidence: {sqft_stats['average_confidence']:.2f}", file=out)
     if sqft_stats['sources_used']:
-        print(f"   • Sources used: {', '.join(sqft_stats['sources_used'])}")
+        print(f"   • Sources used: {', '.join(sqft_stats['sources_used'])}", file=out)
 
     # Population analysis statistics
-    successful_pop_analyses = sum(1 for r in pop_results.values() if r and r.census_data_available)
+    successful_pop_analyses = int(df['has_pop'].sum())
     pop_success_rate = successful_pop_analyses / total_restaurants if total_restaurants > 0 else 0
+    populations = df['population_1_mile'].dropna()
 
-    print("\n👥 Population Analysis:")
-    print(f"   • Geocoding success rate: {pop_success_rate:.1%}")
-    print(f"   • Average 1-mile population: {sum(r.population_1_mile for r in pop_results.values() if r and r.population_1_mile > 0) / max(successful_pop_analyses, 1):,}")
+    print("\n👥 Population Analysis:", file=out)
+    print(f"   • Geocoding success rate: {pop_success_rate:.1%}", file=out)
+    print(f"   • Average 1-mile population: {populations[populations > 0].sum() / max(successful_pop_analyses, 1):,}", file=out)
 
     # Combined insights
-    restaurants_with_both = 0
-    for restaurant in restaurants:
-        restaurant_id = restaurant['__id']
-        has_sqft = restaurant_id in sqft_results and sqft_results[restaurant_id].square_footage
-        has_pop = restaurant_id in pop_results and pop_results[restaurant_id] and pop_results[restaurant_id].census_data_available
+    restaurants_with_both = int(df['has_both'].sum())
 
-        if has_sqft and has_pop:
-            restaurants_with_both += 1
-
-    print("\n🔗 Combined Analysis:")
-    print(f"   • Restaurants with complete enrichment: {restaurants_with_both}")
-    print(f"   • Complete enrichment rate: {restaurants_with_both/total_restaurants:.1%}")
+    print("\n🔗 Combined Analysis:", file=out)
+    print(f"   • Restaurants with complete enrichment: {restaurants_with_both}", file=out)
+    print(f"   • Complete enrichment rate: {restaurants_with_both/total_restaurants:.1%}", file=out)
 
     if restaurants_with_both > 0:
-        print("\n💡 Business Insights:")
-        print(f"   • {restaurants_with_both} restaurants now have:")
-        print("     ✓ Square footage data for capacity planning")
-        print("     ✓ Population demographics for market analysis")
-        print("     ✓ Revenue per square foot calculations")
-        print("     ✓ Drinking age population for alcohol-related businesses")
+        print("\n💡 Business Insights:", file=out)
+        print(f"   • {restaurants_with_both} restaurants now have:", file=out)
+        print("     ✓ Square footage data for capacity planning", file=out)
+        print("     ✓ Population demographics for market analysis", file=out)
+        print("     ✓ Revenue per square foot calculations", file=out)
+        print("     ✓ Drinking age population for alcohol-related businesses", file=out)
+
+    sys.stdout.write(out.getvalue())
+
 async def main():
     """Main integration test function"""
     print("COMPLETE RESTAURANT DATA ENRICHMENT PIPELINE TEST")
     print("Testing with Real Texas Comptroller Data")
     print("="*80)
 
+    # JIT warmup runs in a worker thread while the network-bound steps below are in flight
+    warmup = asyncio.ensure_future(asyncio.to_thread(warm_up_metrics)) if NUMBA_AVAILABLE else None
+
     try:
         # Step 1: Fetch real restaurant data
-        restaurants = fetch_real_restaurant_data(limit=12)
+        restaurants = await fetch_real_restaurant_data(limit=12)
 
         if not restaurants:
             print("No restaurant data available for testing")
             return
 
-        # Step 2: Test square footage scraping
-        sqft_results = await test_square_footage_with_real_data(restaurants)
-
-        # Step 3: Test population analysis
-        pop_results = await test_population_analysis_with_real_data(restaurants)
+        # Steps 2 and 3: square footage scraping and population analysis query different services,
+        # so they run concurrently; each prints its results once its lookups finish
+        sqft_results, pop_results = await asyncio.gather(
+            test_square_footage_with_real_data(restaurants),
+            test_population_analysis_with_real_data(restaurants)
+        )
 
-        # Step 4: Show comprehensive results
-        show_comprehensive_results(restaurants, sqft_results, pop_results)
+        # Step 4: Show comprehensive results (both reports read one joined frame)
+        if warmup is not None:
+            await warmup
+        enrichment_df = build_enrichment_frame(restaurants, sqft_results, pop_results)
+        show_comprehensive_results(restaurants, sqft_results, pop_results, enrichment_df)
 
         # Step 5: Show system summary
-        show_system_summary(restaurants, sqft_results, pop_results)
+        show_system_summary(restaurants, sqft_results, pop_results, enrichment_df)
 
         print("\n" + "="*80)
         print("✅ COMPLETE ENRICHMENT PIPELINE TEST SUCCESSFUL!")
@@ -282,8 +411,7 @@ async def main():
         print("\n\n⚠️  Test interrupted by user")
     except Exception as e:
         print(f"\n\n❌ Test failed with error: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Complete enrichment pipeline test failed")
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file
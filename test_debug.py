@@ -1,10 +1,13 @@
 import os
 import sys
 
-# Set environment variables for this session
-os.environ['API_KEY_ID'] = '1qah3gxsa7hq22uv7pq1qb6j2'
-os.environ['API_KEY_SECRET'] = 'owqiugc9q94bnvh5r11n3ibvhq1zs2k72lnz8re98woh0neug'
-os.environ['APP_TOKEN'] = '2d7MaXhf0SeDpdQ1gEmJ80Jjy'
+# Credentials come from the environment or a local .env file (loaded once, never overriding set variables)
+try:
+    from dotenv import load_dotenv
+    load_dotenv(override=False)
+except ImportError:
+    # python-dotenv not available - only the process environment is used
+    pass
 
 # Add src to path
 sys.path.append('src')
@@ -14,9 +17,9 @@ print(f"Current directory: {os.getcwd()}", flush=True)
 print(f"Python path: {sys.path}", flush=True)
 
 print("=== ENVIRONMENT VARIABLES ===", flush=True)
-print(f'API_KEY_ID: {os.getenv("API_KEY_ID")}', flush=True)
-print(f'API_KEY_SECRET: {os.getenv("API_KEY_SECRET")}', flush=True)
-print(f'APP_TOKEN: {os.getenv("APP_TOKEN")}', flush=True)
+print(f'API_KEY_ID: {os.getenv("API_KEY_ID", "")[:10] + "..." if os.getenv("API_KEY_ID") else "None"}', flush=True)
+print(f'API_KEY_SECRET: {"Set" if os.getenv("API_KEY_SECRET") else "None"}', flush=True)
+print(f'APP_TOKEN: {os.getenv("APP_TOKEN", "")[:10] + "..." if os.getenv("APP_TOKEN") else "None"}', flush=True)
 
 print("=== TESTING IMPORTS ===", flush=True)
 try:
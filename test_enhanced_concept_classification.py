@@ -3,10 +3,11 @@
 Test script for the Enhanced Restaurant Concept Classification System
 """
 
-import sys
 import os
-sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
-
+import asyncio
+import hashlib
+import shelve
+import numpy as np
 from tabc_scrape.scraping.concept_classifier import EnhancedRestaurantConceptClassifier, ConceptClassification, AI_AVAILABLE
 import logging
 
@@ -14,6 +15,28 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Classifications are deterministic for a given restaurant and classifier version, so web-sourced
+# results are kept on disk between runs; bump the version when the classifier changes
+CONCEPT_CACHE_DIR = os.path.expanduser('~/.cache/tabc_scrape')
+CONCEPT_CACHE_VERSION = 'concept-v1'
+
+def concept_cache_key(name, address, description=""):
+    """Cache key for a restaurant, ignoring case and whitespace differences"""
+    normalized = '|'.join(' '.join(part.lower().split()) for part in (name, address, description))
+    return hashlib.blake2b(f"{CONCEPT_CACHE_VERSION}|{normalized}".encode(), digest_size=16).hexdigest()
+
+async def classify_restaurant_cached(classifier, cache, name, address, description=""):
+    """classify_restaurant, served from the on-disk cache when this restaurant was seen before"""
+    key = concept_cache_key(name, address, description)
+    if key in cache:
+        return cache[key]
+
+    result = await classifier.classify_restaurant(name, address, description)
+    # Fallbacks mean the web sources were unreachable, so those are retried next run
+    if result.web_data_sources:
+        cache[key] = result
+    return result
+
 def test_basic_classification():
     """Test basic concept classification functionality"""
     print("=== Testing Enhanced Restaurant Concept Classification ===\n")
@@ -52,38 +75,42 @@ def test_basic_classification():
 
     print("Testing classification with sample restaurants...\n")
 
-    for i, restaurant in enumerate(test_restaurants, 1):
-        print(f"{i}. {restaurant['name']}")
-        print(f"   📍 {restaurant['address']}")
-        print(f"   📝 {restaurant['description']}")
+    os.makedirs(CONCEPT_CACHE_DIR, exist_ok=True)
+    with shelve.open(os.path.join(CONCEPT_CACHE_DIR, 'concepts')) as cache:
+        for i, restaurant in enumerate(test_restaurants, 1):
+            print(f"{i}. {restaurant['name']}")
+            print(f"   📍 {restaurant['address']}")
+            print(f"   📝 {restaurant['description']}")
 
-        try:
-            # Test classification
-            result = classifier.classify_restaurant(
-                restaurant['name'],
-                restaurant['address'],
-                restaurant['description']
-            )
+            try:
+                # Test classification
+                result = asyncio.run(classify_restaurant_cached(
+                    classifier,
+                    cache,
+                    restaurant['name'],
+                    restaurant['address'],
+                    restaurant['description']
+                ))
 
-            print(f"   🏷️  Primary Concept: {result.primary_concept}")
-            print(f"   📊 Confidence: {result.confidence:.2f}")
-            print(f"   🔍 Source: {result.source}")
+                print(f"   🏷️  Primary Concept: {result.primary_concept}")
+                print(f"   📊 Confidence: {result.confidence:.2f}")
+                print(f"   🔍 Source: {result.source}")
 
-            if result.secondary_concepts:
-                print(f"   🔗 Secondary Concepts: {', '.join(result.secondary_concepts)}")
+                if result.secondary_concepts:
+                    print(f"   🔗 Secondary Concepts: {', '.join(result.secondary_concepts)}")
 
-            if result.web_data_sources:
-                print(f"   🌐 Web Sources: {', '.join(result.web_data_sources)}")
+                if result.web_data_sources:
+                    print(f"   🌐 Web Sources: {', '.join(result.web_data_sources)}")
 
-            if result.price_range:
-                print(f"   💰 Price Range: {result.price_range}")
+                if result.price_range:
+                    print(f"   💰 Price Range: {result.price_range}")
 
-            print(f"   ✅ Classification: {'SUCCESS' if result.confidence > 0.3 else 'LOW CONFIDENCE'}")
-            print()
+                print(f"   ✅ Classification: {'SUCCESS' if result.confidence > 0.3 else 'LOW CONFIDENCE'}")
+                print()
 
-        except Exception as e:
-            print(f"   ❌ Error: {e}")
-            print()
+            except Exception as e:
+                print(f"   ❌ Error: {e}")
+                print()
 
 def test_web_scraping():
     """Test web scraping functionality"""
@@ -101,10 +128,10 @@ def test_web_scraping():
     print(f"📍 {test_restaurant['address']}\n")
 
     try:
-        result = classifier.scrape_concept_from_web(
+        result = asyncio.run(classifier.scrape_concept_from_web(
             test_restaurant['name'],
             test_restaurant['address']
-        )
+        ))
 
         print("Web scraping results:")
         print(f"   🏷️  Concept: {result.primary_concept}")
@@ -118,8 +145,7 @@ def test_web_scraping():
 
     except Exception as e:
         print(f"❌ Web scraping test failed: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Web scraping test failed")
 
 def test_ai_classification():
     """Test AI-powered classification if available"""
@@ -137,26 +163,41 @@ def test_ai_classification():
 
     print("Testing AI classification with various restaurant descriptions:\n")
 
-    for i, description in enumerate(test_cases, 1):
-        print(f"{i}. {description}")
-
+    # Classify every case first (an exception stands in for a failed result) so the status
+    # tiers can be assigned in one vectorized step
+    outcomes = []
+    for description in test_cases:
         try:
             # Test AI classification if available
             if AI_AVAILABLE:
-                concept, confidence = classifier._ai_classify_text(description)
-                print(f"   🤖 AI Concept: {concept}")
-                print(f"   📊 AI Confidence: {confidence:.2f}")
+                outcomes.append(classifier._ai_classify_text(description))
             else:
-                concept, confidence = classifier._rule_based_classify(description)
-                print(f"   🔍 Rule-based Concept: {concept}")
-                print(f"   📊 Confidence: {confidence:.2f}")
+                outcomes.append(classifier._rule_based_classify(description))
+        except Exception as e:
+            outcomes.append(e)
 
-            print(f"   ✅ Status: {'HIGH CONFIDENCE' if confidence > 0.6 else 'MODERATE CONFIDENCE' if confidence > 0.3 else 'LOW CONFIDENCE'}")
-            print()
+    confidences = np.array([np.nan if isinstance(o, Exception) else o[1] for o in outcomes])
+    statuses = np.select([confidences > 0.6, confidences > 0.3],
+                         ['HIGH CONFIDENCE', 'MODERATE CONFIDENCE'], default='LOW CONFIDENCE')
 
-        except Exception as e:
-            print(f"   ❌ Error: {e}")
+    for i, (description, outcome, status) in enumerate(zip(test_cases, outcomes, statuses), 1):
+        print(f"{i}. {description}")
+
+        if isinstance(outcome, Exception):
+            print(f"   ❌ Error: {outcome}")
             print()
+            continue
+
+        concept, confidence = outcome
+        if AI_AVAILABLE:
+            print(f"   🤖 AI Concept: {concept}")
+            print(f"   📊 AI Confidence: {confidence:.2f}")
+        else:
+            print(f"   🔍 Rule-based Concept: {concept}")
+            print(f"   📊 Confidence: {confidence:.2f}")
+
+        print(f"   ✅ Status: {status}")
+        print()
 
 def show_system_capabilities():
     """Show the capabilities of the enhanced system"""
@@ -219,8 +260,7 @@ def main():
         print("\n\n⚠️  Test interrupted by user")
     except Exception as e:
         print(f"\n\n❌ Test failed with error: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Concept classification tests failed")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -5,8 +5,10 @@ Test script for the Data Storage and Enrichment Pipeline
 
 import sys
 import os
-sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
-
+import io
+import functools
+import contextlib
+import csv
 from tabc_scrape.storage.database import DatabaseManager
 from tabc_scrape.storage.enrichment_pipeline import DataEnrichmentPipeline, EnrichmentResult
 import logging
@@ -15,13 +17,48 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# In-memory by default so the tests never touch disk; set TABC_TEST_DB_URL to inspect the data afterwards
+TEST_DB_URL = os.getenv('TABC_TEST_DB_URL', 'sqlite:///:memory:')
+_test_db = None
+_sample_df = None
+
+# Largest number of restaurants any test looks at; each test takes the head it needs
+SAMPLE_DF_LIMIT = 5
+
+def buffered_output(func):
+    """Collect everything a test prints and write it to stdout in one call"""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        out = io.StringIO()
+        try:
+            with contextlib.redirect_stdout(out):
+                return func(*args, **kwargs)
+        finally:
+            sys.stdout.write(out.getvalue())
+    return wrapper
+
+def get_test_db():
+    """Database manager shared by every test in this script, so the engine and schema are set up once"""
+    global _test_db
+    if _test_db is None:
+        _test_db = DatabaseManager(TEST_DB_URL)
+    return _test_db
+
+def get_sample_df():
+    """Restaurants shared by every test in this script, fetched once after test_database_operations stores them"""
+    global _sample_df
+    if _sample_df is None or _sample_df.empty:
+        _sample_df = get_test_db().get_restaurants_dataframe(limit=SAMPLE_DF_LIMIT)
+    return _sample_df
+
+@buffered_output
 def test_database_operations():
     """Test basic database operations"""
     print("=== Testing Database Operations ===\n")
 
     try:
         # Initialize database
-        db = DatabaseManager("sqlite:///test_restaurants.db")
+        db = get_test_db()
         print("✅ Database initialized successfully")
 
         # Test connection
@@ -63,7 +100,7 @@ def test_database_operations():
         print(f"✅ Stored {stored_count} restaurant records")
 
         # Test data retrieval
-        restaurants_df = db.get_restaurants_dataframe(limit=5)
+        restaurants_df = get_sample_df().head(5)
         if not restaurants_df.empty:
             print(f"✅ Retrieved {len(restaurants_df)} restaurants from database")
             print("Sample data:")
@@ -83,17 +120,17 @@ def test_database_operations():
 
     except Exception as e:
         print(f"❌ Database test failed: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Database test failed")
         return False
 
+@buffered_output
 def test_enrichment_pipeline():
     """Test the enrichment pipeline"""
     print("\n=== Testing Enrichment Pipeline ===\n")
 
     try:
         # Initialize database and pipeline
-        db = DatabaseManager("sqlite:///test_restaurants.db")
+        db = get_test_db()
         pipeline = DataEnrichmentPipeline(db)
 
         print("✅ Enrichment pipeline initialized")
@@ -106,7 +143,7 @@ def test_enrichment_pipeline():
         print(f"   • Batch size: {status.get('pipeline_config', {}).get('batch_size', 'N/A')}")
 
         # Test data validation
-        restaurants_df = db.get_restaurants_dataframe(limit=2)
+        restaurants_df = get_sample_df().head(2)
         if not restaurants_df.empty:
             restaurant_id = restaurants_df.iloc[0]['id']
             validation = pipeline.validate_enriched_data(restaurant_id)
@@ -127,20 +164,20 @@ def test_enrichment_pipeline():
 
     except Exception as e:
         print(f"❌ Enrichment pipeline test failed: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Enrichment pipeline test failed")
         return False
 
+@buffered_output
 def test_job_management():
     """Test enrichment job creation and management"""
     print("\n=== Testing Job Management ===\n")
 
     try:
-        db = DatabaseManager("sqlite:///test_restaurants.db")
+        db = get_test_db()
         pipeline = DataEnrichmentPipeline(db)
 
         # Get a restaurant for testing
-        restaurants_df = db.get_restaurants_dataframe(limit=1)
+        restaurants_df = get_sample_df().head(1)
         if restaurants_df.empty:
             print("⚠️ No restaurants available for job testing")
             return True
@@ -158,10 +195,40 @@ def test_job_management():
 
     except Exception as e:
         print(f"❌ Job management test failed: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Job management test failed")
         return False
 
+@buffered_output
+def test_streamed_enriched_chunks():
+    """Streamed enriched chunks and their CSV should keep one column layout across chunk boundaries"""
+    print("\n=== Testing Streamed Enriched Chunks ===\n")
+
+    from tabc_scrape.web import _iter_csv_chunks
+
+    # Separate database so the population data doesn't leak into the other tests
+    db = DatabaseManager('sqlite:///:memory:')
+    db.store_restaurants([
+        {'id': f'stream_{i}', 'location_name': f'Stream Restaurant {i}', 'location_city': 'Houston',
+         'location_state': 'TX', 'location_county': 'Harris', 'total_receipts': 100000.0 * i}
+        for i in range(1, 4)
+    ])
+    # Only the last restaurant has population data, so the chunks of two disagree on which data they hold
+    db.store_population_data('stream_3', {'population_1_mile': 12000, 'drinking_age_1_mile': 9000,
+                                          'source': 'zip_estimation', 'confidence': 0.8})
+
+    frames = list(db.get_enriched_restaurants_dataframe(chunksize=2))
+    assert [len(frame) for frame in frames] == [2, 1]
+    assert list(frames[0].columns) == list(frames[1].columns), "Chunks have different columns"
+    print(f"✅ {len(frames)} chunks share {len(frames[0].columns)} columns")
+
+    rows = list(csv.reader(io.StringIO(''.join(_iter_csv_chunks(frames)))))
+    assert len(rows) == 4
+    assert all(len(row) == len(rows[0]) for row in rows), "CSV rows don't match the header"
+    print(f"✅ Streamed CSV rows all have {len(rows[0])} fields")
+
+    return True
+
+@buffered_output
 def show_pipeline_capabilities():
     """Show the capabilities of the new pipeline"""
     print("\n=== Data Storage and Enrichment Pipeline Capabilities ===\n")
@@ -215,11 +282,14 @@ def main():
         # Test job management
         job_success = test_job_management()
 
+        # Test chunked enriched data streaming
+        streaming_success = test_streamed_enriched_chunks()
+
         # Show capabilities
         show_pipeline_capabilities()
 
         print("\n" + "=" * 50)
-        if db_success and pipeline_success and job_success:
+        if db_success and pipeline_success and job_success and streaming_success:
             print("✅ DATA STORAGE AND ENRICHMENT PIPELINE TEST SUCCESSFUL!")
         else:
             print("⚠️ Some tests failed - check logs for details")
@@ -238,8 +308,7 @@ def main():
         print("\n\n⚠️  Test interrupted by user")
     except Exception as e:
         print(f"\n\n❌ Test failed with error: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Enrichment pipeline tests failed")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -3,10 +3,6 @@
 Test script for population analysis functionality
 """
 
-import sys
-import os
-sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
-
 from tabc_scrape.analysis.population import PopulationAnalyzer
 import logging
 
@@ -102,7 +98,9 @@ def test_population_analysis():
     # Show summary statistics
     print("=== POPULATION ANALYSIS SUMMARY ===")
 
-    successful_analyses = sum(1 for r in results.values() if r and r.census_data_available)
+    # Results with census data, picked out once for the averages and the detailed listing
+    valid_results = {rid: r for rid, r in results.items() if r and r.census_data_available}
+    successful_analyses = len(valid_results)
 
     print("\n📊 Analysis Results:")
     print(f"  Restaurants analyzed: {len(test_restaurants)}")
@@ -110,10 +108,15 @@ def test_population_analysis():
     print(f"  Success rate: {successful_analyses/len(test_restaurants):.1%}")
 
     if successful_analyses > 0:
-        # Calculate averages
-        avg_pop_1 = sum(r.population_1_mile for r in results.values() if r and r.population_1_mile > 0) // successful_analyses
-        avg_pop_3 = sum(r.population_3_mile for r in results.values() if r and r.population_3_mile > 0) // successful_analyses
-        avg_pop_5 = sum(r.population_5_mile for r in results.values() if r and r.population_5_mile > 0) // successful_analyses
+        # Calculate averages, summing every radius in one pass over the results
+        total_pop_1 = total_pop_3 = total_pop_5 = 0
+        for r in valid_results.values():
+            total_pop_1 += max(r.population_1_mile, 0)
+            total_pop_3 += max(r.population_3_mile, 0)
+            total_pop_5 += max(r.population_5_mile, 0)
+        avg_pop_1 = total_pop_1 // successful_analyses
+        avg_pop_3 = total_pop_3 // successful_analyses
+        avg_pop_5 = total_pop_5 // successful_analyses
 
         print("\n📈 Average Populations:")
         print(f"  1-mile radius: {avg_pop_1:,}")
@@ -121,17 +124,17 @@ def test_population_analysis():
         print(f"  5-mile radius: {avg_pop_5:,}")
 
         # Show detailed results for successful analyses
+        restaurants_by_id = {r['id']: r for r in test_restaurants}
         print("\n🏘️  Detailed Results:")
-        for restaurant_id, result in results.items():
-            if result and result.census_data_available:
-                restaurant = next(r for r in test_restaurants if r['id'] == restaurant_id)
-                print(f"\n  📍 {restaurant['location_name']}:")
-                print(f"     1-mile population: {result.population_1_mile:,} ({result.drinking_age_1_mile:,} drinking age)")
-                print(f"     3-mile population: {result.population_3_mile:,} ({result.drinking_age_3_mile:,} drinking age)")
-                print(f"     5-mile population: {result.population_5_mile:,} ({result.drinking_age_5_mile:,} drinking age)")
-                print(f"     10-mile population: {result.population_10_mile:,} ({result.drinking_age_10_mile:,} drinking age)")
-                print(f"     Median age: {result.median_age_1_mile}")
-                print(f"     Median income: ${result.median_income_1_mile:,}")
+        for restaurant_id, result in valid_results.items():
+            restaurant = restaurants_by_id[restaurant_id]
+            print(f"\n  📍 {restaurant['location_name']}:")
+            print(f"     1-mile population: {result.population_1_mile:,} ({result.drinking_age_1_mile:,} drinking age)")
+            print(f"     3-mile population: {result.population_3_mile:,} ({result.drinking_age_3_mile:,} drinking age)")
+            print(f"     5-mile population: {result.population_5_mile:,} ({result.drinking_age_5_mile:,} drinking age)")
+            print(f"     10-mile population: {result.population_10_mile:,} ({result.drinking_age_10_mile:,} drinking age)")
+            print(f"     Median age: {result.median_age_1_mile}")
+            print(f"     Median income: ${result.median_income_1_mile:,}")
 
 def test_batch_analysis():
     """Test batch population analysis"""
@@ -171,8 +174,7 @@ def test_batch_analysis():
         print("\n✅ Batch analysis completed successfully!")
     except Exception as e:
         print(f"❌ Batch analysis failed: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Batch analysis failed")
 
 def main():
     """Main test function"""
@@ -193,8 +195,7 @@ def main():
         print("\n\nTests interrupted by user")
     except Exception as e:
         print(f"\n\nTests failed with error: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Population analysis tests failed")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
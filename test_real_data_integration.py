@@ -3,11 +3,8 @@
 Integration test with real Texas Comptroller restaurant data
 """
 
-import sys
-import os
-sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
-
 import asyncio
+import pandas as pd
 from tabc_scrape.data.api_client import TexasComptrollerAPI
 from tabc_scrape.scraping.square_footage import SquareFootageScraper, SquareFootageResult
 from tabc_scrape.storage.database import DatabaseManager
@@ -57,19 +54,10 @@ async def test_real_restaurant_scraping():
     print("\n3. Testing square footage scraping on real restaurants...")
 
     # Convert DataFrame to list of dictionaries for scraping
-    restaurant_list = []
-    for _, row in restaurants_df.iterrows():
-        restaurant_dict = {
-            'id': row['id'],
-            'location_name': row['location_name'],
-            'full_address': row['full_address'],
-            'location_address': row['location_address'],
-            'location_city': row['location_city'],
-            'location_state': row['location_state'],
-            'location_zip': row['location_zip'],
-            'location_county': row['location_county']
-        }
-        restaurant_list.append(restaurant_dict)
+    restaurant_list = restaurants_df[[
+        'id', 'location_name', 'full_address', 'location_address',
+        'location_city', 'location_state', 'location_zip', 'location_county', 'total_receipts'
+    ]].to_dict(orient='records')
 
     # Test scraping on first 5 restaurants (to avoid overwhelming the system)
     test_restaurants = restaurant_list[:5]
@@ -129,10 +117,12 @@ async def test_real_restaurant_scraping():
     else:
         print("  No sources found data for these restaurants")
 
+    restaurants_by_id = {r['id']: r for r in test_restaurants}
+
     # Individual results with more detail
     print("\n🏢 Individual Restaurant Results:")
     for restaurant_id, result in results.items():
-        restaurant = next(r for r in test_restaurants if r['id'] == restaurant_id)
+        restaurant = restaurants_by_id[restaurant_id]
         status = "SUCCESS" if result.square_footage else "FAILED"
 
         print(f"\n  {status} {restaurant['location_name']}")
@@ -149,24 +139,29 @@ async def test_real_restaurant_scraping():
     if successful_results:
         print("\n🎯 SUCCESSFUL SCRAPES:")
         for restaurant_id, result in successful_results.items():
-            restaurant = next(r for r in test_restaurants if r['id'] == restaurant_id)
+            restaurant = restaurants_by_id[restaurant_id]
             print(f"  SUCCESS {restaurant['location_name']}: {result.square_footage:,} sq ft ({result.source})")
 
     # Calculate potential revenue per square foot for restaurants with both data
     print("\n💰 REVENUE ANALYSIS:")
     print("  (Sample calculation for restaurants with both receipt and square footage data)")
 
-    for restaurant_id, result in results.items():
-        if result.square_footage:
-            restaurant = next(r for r in test_restaurants if r['id'] == restaurant_id)
-            total_receipts = restaurant.get('total_receipts', 0)
-
-            if total_receipts > 0:
-                revenue_per_sqft = total_receipts / result.square_footage
-                print(f"  ANALYSIS {restaurant['location_name']}:")
-                print(f"     Square Footage: {result.square_footage:,}")
-                print(f"     Annual Receipts: ${total_receipts:,.2f}")
-                print(f"     Revenue per Sq Ft: ${revenue_per_sqft:.2f}")
+    revenue_df = pd.DataFrame(
+        [
+            (restaurants_by_id[restaurant_id]['location_name'], result.square_footage,
+             restaurants_by_id[restaurant_id].get('total_receipts', 0))
+            for restaurant_id, result in results.items()
+        ],
+        columns=['location_name', 'square_footage', 'total_receipts']
+    )
+    revenue_df = revenue_df[(revenue_df['square_footage'] > 0) & (revenue_df['total_receipts'] > 0)]
+    revenue_df = revenue_df.assign(revenue_per_sqft=revenue_df['total_receipts'] / revenue_df['square_footage'])
+
+    for row in revenue_df.itertuples(index=False):
+        print(f"  ANALYSIS {row.location_name}:")
+        print(f"     Square Footage: {int(row.square_footage):,}")
+        print(f"     Annual Receipts: ${row.total_receipts:,.2f}")
+        print(f"     Revenue per Sq Ft: ${row.revenue_per_sqft:.2f}")
 
     print("\n✅ Test completed! The square footage scraper is working with real data.")
     # Recommendations
@@ -183,8 +178,7 @@ async def main():
         print("\n\nTest interrupted by user")
     except Exception as e:
         print(f"\n\nTest failed with error: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Integration test failed")
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file
@@ -3,10 +3,6 @@
 Test script for the square footage scraper
 """
 
-import sys
-import os
-sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
-
 from tabc_scrape.scraping.square_footage import SquareFootageScraper
 import logging
 import pytest
@@ -93,8 +89,7 @@ async def test_square_footage_scraping():
 
     except Exception as e:
         print(f"Error in batch scraping: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Batch scraping failed")
 
 def test_text_extraction():
     """Test the text extraction functionality"""